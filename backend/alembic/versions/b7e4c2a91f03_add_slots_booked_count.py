@@ -0,0 +1,36 @@
+"""Add slots.booked_count
+
+Revision ID: b7e4c2a91f03
+Revises: 6a1c73adecef
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c2a91f03'
+down_revision: Union[str, None] = '6a1c73adecef'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('slots', sa.Column('booked_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill from active (CONFIRMED/PENDING) bookings
+    op.execute(
+        """
+        UPDATE slots SET booked_count = (
+            SELECT count(bookings.id) FROM bookings
+            WHERE bookings.slot_id = slots.id
+              AND bookings.status IN ('CONFIRMED', 'PENDING')
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('slots', 'booked_count')
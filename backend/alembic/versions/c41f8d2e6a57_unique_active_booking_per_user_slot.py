@@ -0,0 +1,56 @@
+"""Unique active booking per user and slot
+
+Revision ID: c41f8d2e6a57
+Revises: b7e4c2a91f03
+Create Date: 2026-10-17 11:40:03.527114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f8d2e6a57'
+down_revision: Union[str, None] = 'b7e4c2a91f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing duplicates would block the index: keep the oldest active booking
+    # per (user, slot), cancel the rest and recount the affected slots
+    op.execute(
+        """
+        UPDATE bookings SET status = 'CANCELLED'
+        WHERE status IN ('CONFIRMED', 'PENDING')
+          AND EXISTS (
+            SELECT 1 FROM bookings AS older
+            WHERE older.user_id = bookings.user_id
+              AND older.slot_id = bookings.slot_id
+              AND older.status IN ('CONFIRMED', 'PENDING')
+              AND older.id < bookings.id
+          )
+        """
+    )
+    op.execute(
+        """
+        UPDATE slots SET booked_count = (
+            SELECT count(bookings.id) FROM bookings
+            WHERE bookings.slot_id = slots.id
+              AND bookings.status IN ('CONFIRMED', 'PENDING')
+        )
+        """
+    )
+    op.create_index(
+        'uq_bookings_user_slot_active',
+        'bookings',
+        ['user_id', 'slot_id'],
+        unique=True,
+        postgresql_where=sa.text("status IN ('CONFIRMED', 'PENDING')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_bookings_user_slot_active', table_name='bookings')
@@ -0,0 +1,42 @@
+"""Add booking and slot filter indexes
+
+Revision ID: d5a0e7b3c812
+Revises: c41f8d2e6a57
+Create Date: 2026-10-17 13:05:51.904426
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a0e7b3c812'
+down_revision: Union[str, None] = 'c41f8d2e6a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns) matched to the filters in BookingService, SlotService and UserService
+INDEXES = [
+    ('ix_bookings_user_id_status', 'bookings', ['user_id', 'status']),
+    ('ix_bookings_slot_id_status', 'bookings', ['slot_id', 'status']),
+    ('ix_bookings_status', 'bookings', ['status']),
+    ('ix_slots_game_id_start_time_end_time', 'slots', ['game_id', 'start_time', 'end_time']),
+    ('ix_slots_start_time', 'slots', ['start_time']),
+    ('ix_users_department_id', 'users', ['department_id']),
+]
+
+
+def upgrade() -> None:
+    # Build without blocking writes on large tables (CONCURRENTLY can't run in a transaction)
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""Keyset index for bookings by status
+
+Revision ID: e8b3f1c47a20
+Revises: d5a0e7b3c812
+Create Date: 2026-10-17 14:21:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3f1c47a20'
+down_revision: Union[str, None] = 'd5a0e7b3c812'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Status listings are paged in id order, so seek on (status, id) instead of filtering a status-only index
+    with op.get_context().autocommit_block():
+        op.create_index('ix_bookings_status_id', 'bookings', ['status', 'id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_bookings_status', table_name='bookings', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_bookings_status', 'bookings', ['status'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_bookings_status_id', table_name='bookings', postgresql_concurrently=True)
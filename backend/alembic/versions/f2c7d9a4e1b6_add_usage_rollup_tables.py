@@ -0,0 +1,74 @@
+"""Add usage rollup tables
+
+Revision ID: f2c7d9a4e1b6
+Revises: e8b3f1c47a20
+Create Date: 2026-10-17 16:48:05.302117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7d9a4e1b6'
+down_revision: Union[str, None] = 'e8b3f1c47a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timestamps() -> list:
+    return [
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table('slot_usage_hourly',
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('slots', sa.Integer(), nullable=False),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    *_timestamps(),
+    sa.PrimaryKeyConstraint('hour', 'game_id')
+    )
+    op.create_table('booking_usage_hourly',
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('bookings', sa.Integer(), nullable=False),
+    sa.Column('active_bookings', sa.Integer(), nullable=False),
+    sa.Column('cancelled_bookings', sa.Integer(), nullable=False),
+    *_timestamps(),
+    sa.PrimaryKeyConstraint('hour', 'game_id', 'department_id')
+    )
+    op.create_table('usage_rollup_dirty',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    *_timestamps(),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_usage_rollup_dirty_hour', 'usage_rollup_dirty', ['hour'], unique=False)
+    op.create_table('usage_rollup_state',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('refreshed_until', sa.DateTime(timezone=True), nullable=True),
+    *_timestamps(),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Incremental refreshes look for rows updated since the watermark
+    with op.get_context().autocommit_block():
+        op.create_index('ix_slots_updated_at', 'slots', ['updated_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_bookings_updated_at', 'bookings', ['updated_at'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_bookings_updated_at', table_name='bookings', postgresql_concurrently=True)
+        op.drop_index('ix_slots_updated_at', table_name='slots', postgresql_concurrently=True)
+    op.drop_table('usage_rollup_state')
+    op.drop_index('ix_usage_rollup_dirty_hour', table_name='usage_rollup_dirty')
+    op.drop_table('usage_rollup_dirty')
+    op.drop_table('booking_usage_hourly')
+    op.drop_table('slot_usage_hourly')
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import CONTENT_TYPE, metrics_registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus scrape endpoint for this worker's request, pool, auth and booking metrics."""
+    return Response(content=metrics_registry.render(), media_type=CONTENT_TYPE)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.routes import users, departments, games, slots, bookings, auth
+from app.api.v1.routes import users, departments, games, slots, bookings, auth, admin
 
 api_router = APIRouter()
 
@@ -9,3 +9,4 @@ api_router.include_router(departments.router)
 api_router.include_router(games.router)
 api_router.include_router(slots.router)
 api_router.include_router(bookings.router)
+api_router.include_router(admin.router)
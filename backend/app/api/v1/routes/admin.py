@@ -0,0 +1,82 @@
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.dependencies import Principal, get_current_admin_user
+from app.core.request_metrics import request_metrics
+from app.core.security import password_hash_metrics
+from app.db.session import get_db
+from app.db.usage_rollup import refresh_usage_rollup
+from app.schemas.analytics import DepartmentUsage, GameUsage, HourOfWeekUsage
+from app.services.analytics_service import AnalyticsService
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/metrics", response_model=dict)
+async def get_metrics(
+    current_user: Principal = Depends(get_current_admin_user)
+):
+    """Per-route request, DB time and statement count histograms for this worker (Admin only)."""
+    return {
+        "routes": request_metrics.snapshot(),
+        "password_hashing": password_hash_metrics.snapshot(),
+    }
+
+
+@router.get("/analytics/games", response_model=List[GameUsage])
+async def get_game_usage(
+    start_date: datetime = Query(..., description="Slots starting at or after this time (rounded down to the hour)"),
+    end_date: datetime = Query(..., description="Slots starting before this time (rounded up to the hour)"),
+    game_id: Optional[List[int]] = Query(None, description="Only these games; repeat for several"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_admin_user)
+):
+    """Utilization, cancellation rate and peak hour per game (Admin only)."""
+    analytics_service = AnalyticsService(db)
+    return await analytics_service.usage_by_game(start_date, end_date, game_ids=game_id)
+
+
+@router.get("/analytics/departments", response_model=List[DepartmentUsage])
+async def get_department_usage(
+    start_date: datetime = Query(..., description="Slots starting at or after this time (rounded down to the hour)"),
+    end_date: datetime = Query(..., description="Slots starting before this time (rounded up to the hour)"),
+    game_id: Optional[List[int]] = Query(None, description="Only these games; repeat for several"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_admin_user)
+):
+    """Share of seats, cancellation rate and peak hour per department (Admin only)."""
+    analytics_service = AnalyticsService(db)
+    return await analytics_service.usage_by_department(start_date, end_date, game_ids=game_id)
+
+
+@router.get("/analytics/hours", response_model=List[HourOfWeekUsage])
+async def get_hour_of_week_usage(
+    start_date: datetime = Query(..., description="Slots starting at or after this time (rounded down to the hour)"),
+    end_date: datetime = Query(..., description="Slots starting before this time (rounded up to the hour)"),
+    game_id: Optional[List[int]] = Query(None, description="Only these games; repeat for several"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_admin_user)
+):
+    """Utilization and cancellation rate per hour of the week, in UTC (Admin only)."""
+    analytics_service = AnalyticsService(db)
+    return await analytics_service.usage_by_hour_of_week(start_date, end_date, game_ids=game_id)
+
+
+@router.post("/analytics/rollup/refresh", response_model=dict)
+async def refresh_analytics_rollup(
+    full: bool = Query(False, description="Rebuild every hour instead of the ones changed since the last refresh"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_admin_user)
+):
+    """Bring the analytics rollup up to date (Admin only)."""
+    if not settings.ANALYTICS_ROLLUP:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The analytics rollup is disabled"
+        )
+    return asdict(await refresh_usage_rollup(db, full=full))
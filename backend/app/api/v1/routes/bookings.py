@@ -1,11 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import csv
+import io
+import json
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
 from app.db.session import get_db
-from app.services.booking_service import BookingService
-from app.schemas.booking import BookingCreate, BookingUpdate, BookingOut, BookingDeleteResponse, BookingStatus
-from app.core.dependencies import get_current_user
+from app.services.booking_service import BookingService, TIMELINE_LIST
+from app.services.projections import BOOKING_OUT
+from app.schemas.booking import (
+    BookingCreate, BookingUpdate, BookingOut, BookingDeleteResponse, BookingStatus, BookingPurge,
+    BookingBatchRequest, BookingBatchResponse, BookingTimelineItem, BookingTimelinePeriod,
+    BookingExportFormat, BookingExportRow
+)
+from app.core.dependencies import Principal
+from app.core.pagination import set_next_cursor
+from app.core.projection import sparse_fields
+from app.core.responses import json_list_response
+from app.core.etag import not_modified
 from app.core.permissions import (
     require_booking_read_permission,
     require_booking_create_permission,
@@ -14,90 +29,213 @@ from app.core.permissions import (
     require_booking_confirm_permission,
     require_booking_reset_permission
 )
-from app.core.ownership import require_booking_ownership
-from app.schemas.user import UserOut
+from app.core.ownership import require_booking_ownership, is_admin
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
 
 @router.get("/", response_model=List[BookingOut])
 async def get_bookings(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    fields: Optional[List[str]] = Depends(sparse_fields(BookingOut)),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_delete_permission)  # Use admin-only permission
+    current_user: Principal = Depends(require_booking_delete_permission)  # Use admin-only permission
 ):
     """Get all bookings with pagination (Admin only)."""
     booking_service = BookingService(db)
-    return await booking_service.get_bookings(skip=skip, limit=limit)
+    unchanged = not_modified(request, response, await booking_service.get_bookings_version())
+    if unchanged:
+        return unchanged
+    bookings = await booking_service.get_bookings(skip=skip, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, bookings, limit, BookingService.KEYSET)
+    return json_list_response(response, bookings, BOOKING_OUT.adapter, fields)
 
 
 @router.get("/user/{user_id}", response_model=List[BookingOut])
 async def get_bookings_by_user(
     user_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    fields: Optional[List[str]] = Depends(sparse_fields(BookingOut)),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_read_permission)
+    current_user: Principal = Depends(require_booking_read_permission)
 ):
     """Get all bookings for a specific user (Users can only view their own bookings, admins can view any)."""
     # Check ownership
     require_booking_ownership(current_user, user_id)
     
     booking_service = BookingService(db)
-    return await booking_service.get_bookings_by_user(user_id, skip=skip, limit=limit)
+    unchanged = not_modified(request, response, await booking_service.get_bookings_version(user_id=user_id))
+    if unchanged:
+        return unchanged
+    bookings = await booking_service.get_bookings_by_user(user_id, skip=skip, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, bookings, limit, BookingService.KEYSET)
+    return json_list_response(response, bookings, BOOKING_OUT.adapter, fields)
 
 
 @router.get("/user/{user_id}/active", response_model=List[BookingOut])
 async def get_user_active_bookings(
     user_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    fields: Optional[List[str]] = Depends(sparse_fields(BookingOut)),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_read_permission)
+    current_user: Principal = Depends(require_booking_read_permission)
 ):
     """Get active (confirmed) bookings for a specific user (Users can only view their own bookings, admins can view any)."""
     # Check ownership
     require_booking_ownership(current_user, user_id)
     
     booking_service = BookingService(db)
-    return await booking_service.get_user_active_bookings(user_id, skip=skip, limit=limit)
+    unchanged = not_modified(request, response, await booking_service.get_bookings_version(user_id=user_id, status=BookingStatus.confirmed))
+    if unchanged:
+        return unchanged
+    bookings = await booking_service.get_user_active_bookings(user_id, skip=skip, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, bookings, limit, BookingService.KEYSET)
+    return json_list_response(response, bookings, BOOKING_OUT.adapter, fields)
+
+
+@router.get("/user/{user_id}/timeline", response_model=List[BookingTimelineItem])
+async def get_user_booking_timeline(
+    user_id: int,
+    response: Response,
+    period: BookingTimelinePeriod = Query(BookingTimelinePeriod.all, description="upcoming (slot not yet over), past or all"),
+    booking_status: Optional[BookingStatus] = Query(None, alias="status", description="Only bookings in this status"),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_booking_read_permission)
+):
+    """Get a user's bookings with slot times and game titles, by slot start time (Users can only view their own bookings, admins can view any)."""
+    require_booking_ownership(current_user, user_id)
+    
+    booking_service = BookingService(db)
+    timeline = await booking_service.get_user_timeline(
+        user_id, period=period, booking_status=booking_status, skip=skip, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, timeline, limit, BookingService.TIMELINE_KEYSET)
+    return json_list_response(response, timeline, TIMELINE_LIST)
 
 
 @router.get("/slot/{slot_id}", response_model=List[BookingOut])
 async def get_bookings_by_slot(
     slot_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    fields: Optional[List[str]] = Depends(sparse_fields(BookingOut)),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_read_permission)
+    current_user: Principal = Depends(require_booking_read_permission)
 ):
     """Get all bookings for a specific slot (Authenticated users only)."""
     booking_service = BookingService(db)
-    return await booking_service.get_bookings_by_slot(slot_id, skip=skip, limit=limit)
+    unchanged = not_modified(request, response, await booking_service.get_bookings_version(slot_id=slot_id))
+    if unchanged:
+        return unchanged
+    bookings = await booking_service.get_bookings_by_slot(slot_id, skip=skip, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, bookings, limit, BookingService.KEYSET)
+    return json_list_response(response, bookings, BOOKING_OUT.adapter, fields)
 
 
 @router.get("/status/{status}", response_model=List[BookingOut])
 async def get_bookings_by_status(
     status: BookingStatus,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    fields: Optional[List[str]] = Depends(sparse_fields(BookingOut)),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_delete_permission)
+    current_user: Principal = Depends(require_booking_delete_permission)
 ):
     """Get all bookings with a specific status (Admin only)."""
     booking_service = BookingService(db)
-    return await booking_service.get_bookings_by_status(status, skip=skip, limit=limit)
+    unchanged = not_modified(request, response, await booking_service.get_bookings_version(status=status))
+    if unchanged:
+        return unchanged
+    bookings = await booking_service.get_bookings_by_status(status, skip=skip, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, bookings, limit, BookingService.KEYSET)
+    return json_list_response(response, bookings, BOOKING_OUT.adapter, fields)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_bookings(
+    export_format: BookingExportFormat = Query(BookingExportFormat.ndjson, alias="format", description="ndjson (one JSON object per line) or csv"),
+    start_date: Optional[datetime] = Query(None, description="Only bookings for slots starting at or after this time"),
+    end_date: Optional[datetime] = Query(None, description="Only bookings for slots starting before this time"),
+    game_id: Optional[List[int]] = Query(None, description="Only bookings for slots of these games; repeat for several"),
+    booking_status: Optional[BookingStatus] = Query(None, alias="status", description="Only bookings in this status"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_booking_delete_permission)  # Use admin-only permission
+):
+    """Stream bookings with their user, department, slot and game as NDJSON or CSV, in booking id order (Admin only)."""
+    booking_service = BookingService(db)
+    batches = booking_service.export_bookings(
+        start_time=start_date, end_time=end_date, game_ids=game_id, booking_status=booking_status
+    )
+
+    async def lines():
+        # One chunk per fetched batch
+        if export_format == BookingExportFormat.csv:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(BookingExportRow.model_fields)
+            yield buffer.getvalue()
+        async for rows in batches:
+            if export_format == BookingExportFormat.csv:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(row.model_dump(mode="json").values() for row in rows)
+                yield buffer.getvalue()
+            else:
+                yield "".join(row.model_dump_json() + "\n" for row in rows)
+
+    async def release():
+        # Runs once the body is sent or the client disconnects; get_db has exited long before,
+        # so close the cursor and release the connection here
+        await batches.aclose()
+        await db.close()
+
+    media_type = "text/csv" if export_format == BookingExportFormat.csv else "application/x-ndjson"
+    return StreamingResponse(
+        lines(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="bookings.{export_format.value}"'},
+        background=BackgroundTask(release)
+    )
 
 
 @router.get("/{booking_id}", response_model=BookingOut)
 async def get_booking(
     booking_id: int, 
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_read_permission)
+    current_user: Principal = Depends(require_booking_read_permission)
 ):
     """Get a specific booking by ID (Users can only view their own bookings, admins can view any)."""
     booking_service = BookingService(db)
+    version = await booking_service.get_booking_version(booking_id)
+    if version is not None:
+        # Check ownership before revealing whether the booking changed
+        require_booking_ownership(current_user, version.user_id)
+        unchanged = not_modified(request, response, tuple(version))
+        if unchanged:
+            return unchanged
     booking = await booking_service.get_booking_by_id(booking_id)
     
     # Check ownership
@@ -110,7 +248,7 @@ async def get_booking(
 async def create_booking(
     booking_data: BookingCreate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_create_permission)
+    current_user: Principal = Depends(require_booking_create_permission)
 ):
     """Create a new booking (Users can only create bookings for themselves, admins can create for any user)."""
     # Users can only create bookings for themselves, admins can create for any user
@@ -124,44 +262,49 @@ async def create_booking(
     return await booking_service.create_booking(booking_data)
 
 
+@router.post("/batch", response_model=BookingBatchResponse)
+async def apply_booking_batch(
+    batch: BookingBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_booking_confirm_permission)
+):
+    """Create, cancel and confirm bookings in one transaction, reporting a result per item (Admin only)."""
+    booking_service = BookingService(db)
+    return await booking_service.apply_batch(batch)
+
+
 @router.put("/{booking_id}", response_model=BookingOut)
 async def update_booking(
     booking_id: int, 
     booking_data: BookingUpdate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_update_permission)
+    current_user: Principal = Depends(require_booking_update_permission)
 ):
     """Update an existing booking (Users can only update their own bookings, admins can update any)."""
     booking_service = BookingService(db)
-    booking = await booking_service.get_booking_by_id(booking_id)
-    
-    # Check ownership
-    require_booking_ownership(current_user, booking.user_id)
-    
-    return await booking_service.update_booking(booking_id, booking_data)
+    # Ownership is checked by the write itself
+    owner_id = None if is_admin(current_user) else current_user.id
+    return await booking_service.update_booking(booking_id, booking_data, owner_id=owner_id)
 
 
 @router.post("/{booking_id}/cancel", response_model=BookingOut)
 async def cancel_booking(
     booking_id: int, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_update_permission)
+    current_user: Principal = Depends(require_booking_update_permission)
 ):
     """Cancel a booking (Users can only cancel their own bookings, admins can cancel any)."""
     booking_service = BookingService(db)
-    booking = await booking_service.get_booking_by_id(booking_id)
-    
-    # Check ownership
-    require_booking_ownership(current_user, booking.user_id)
-    
-    return await booking_service.cancel_booking(booking_id)
+    # Ownership is checked by the write itself
+    owner_id = None if is_admin(current_user) else current_user.id
+    return await booking_service.cancel_booking(booking_id, owner_id=owner_id)
 
 
 @router.post("/{booking_id}/confirm", response_model=BookingOut)
 async def confirm_booking(
     booking_id: int, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_confirm_permission)
+    current_user: Principal = Depends(require_booking_confirm_permission)
 ):
     """Confirm a pending booking (Admin only)."""
     booking_service = BookingService(db)
@@ -172,7 +315,7 @@ async def confirm_booking(
 async def delete_booking(
     booking_id: int, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_delete_permission)
+    current_user: Principal = Depends(require_booking_delete_permission)
 ):
     """Delete a booking (Admin only)."""
     booking_service = BookingService(db)
@@ -181,9 +324,30 @@ async def delete_booking(
 
 @router.post("/reset-current-day", response_model=dict)
 async def reset_current_day_bookings(
+    tz: Optional[str] = Query(None, description="IANA timezone defining the current day; defaults to BOOKING_TIMEZONE"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_booking_reset_permission)
+    current_user: Principal = Depends(require_booking_reset_permission)
 ):
     """Reset all bookings for the current day (Admin only)."""
     booking_service = BookingService(db)
-    return await booking_service.reset_current_day_bookings()
+    return await booking_service.reset_current_day_bookings(timezone_name=tz)
+
+
+@router.post("/purge")
+async def purge_bookings(
+    purge: BookingPurge,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_booking_reset_permission)
+):
+    """Delete bookings by slot time range, game and/or status in batches, streaming NDJSON progress (Admin only)."""
+    booking_service = BookingService(db)
+
+    async def progress():
+        try:
+            async for step in booking_service.purge_bookings(purge):
+                yield json.dumps(step) + "\n"
+        finally:
+            # get_db has already exited by the time the body streams, so release the connection here
+            await db.close()
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
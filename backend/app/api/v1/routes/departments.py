@@ -1,50 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
 from app.db.session import get_db
-from app.services.department_service import DepartmentService
+from app.services.department_service import DepartmentService, DEPARTMENT_LIST
 from app.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentOut, DepartmentDeleteResponse
-from app.core.dependencies import get_current_user
+from app.schemas.booking import BookingStatus
+from app.core.dependencies import Principal
+from app.core.pagination import set_next_cursor
+from app.core.responses import json_list_response
 from app.core.permissions import (
     require_department_read_permission,
     require_department_create_permission,
     require_department_update_permission,
     require_department_delete_permission
 )
-from app.schemas.user import UserOut
 
 router = APIRouter(prefix="/departments", tags=["Departments"])
 
 
 @router.get("/", response_model=List[DepartmentOut])
 async def get_departments(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    booking_status: Optional[BookingStatus] = Query(None, description="Only count bookings with this status"),
+    start_date: Optional[datetime] = Query(None, description="Only count bookings for slots starting at or after this time"),
+    end_date: Optional[datetime] = Query(None, description="Only count bookings for slots starting before this time"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_department_read_permission)
+    current_user: Principal = Depends(require_department_read_permission)
 ):
     """Get all departments with pagination (Authenticated users only)."""
     department_service = DepartmentService(db)
-    return await department_service.get_departments(skip=skip, limit=limit)
+    departments = await department_service.get_departments(
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        booking_status=booking_status,
+        start_date=start_date,
+        end_date=end_date
+    )
+    set_next_cursor(response, departments, limit, DepartmentService.KEYSET)
+    return json_list_response(response, departments, DEPARTMENT_LIST)
 
 
 @router.get("/{department_id}", response_model=DepartmentOut)
 async def get_department(
     department_id: int, 
+    booking_status: Optional[BookingStatus] = Query(None, description="Only count bookings with this status"),
+    start_date: Optional[datetime] = Query(None, description="Only count bookings for slots starting at or after this time"),
+    end_date: Optional[datetime] = Query(None, description="Only count bookings for slots starting before this time"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_department_read_permission)
+    current_user: Principal = Depends(require_department_read_permission)
 ):
     """Get a specific department by ID (Authenticated users only)."""
     department_service = DepartmentService(db)
-    return await department_service.get_department_by_id(department_id)
+    return await department_service.get_department_by_id(department_id, booking_status, start_date, end_date)
 
 
 @router.post("/", response_model=DepartmentOut, status_code=status.HTTP_201_CREATED)
 async def create_department(
     department_data: DepartmentCreate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_department_create_permission)
+    current_user: Principal = Depends(require_department_create_permission)
 ):
     """Create a new department (Admin only)."""
     department_service = DepartmentService(db)
@@ -56,7 +76,7 @@ async def update_department(
     department_id: int, 
     department_data: DepartmentUpdate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_department_update_permission)
+    current_user: Principal = Depends(require_department_update_permission)
 ):
     """Update an existing department (Admin only)."""
     department_service = DepartmentService(db)
@@ -67,7 +87,7 @@ async def update_department(
 async def delete_department(
     department_id: int, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_department_delete_permission)
+    current_user: Principal = Depends(require_department_delete_permission)
 ):
     """Delete a department (Admin only)."""
     department_service = DepartmentService(db)
@@ -1,50 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
 from app.db.session import get_db
-from app.services.game_service import GameService
+from app.services.game_service import GameService, GAME_LIST
 from app.schemas.game import GameCreate, GameUpdate, GameOut, GameDeleteResponse
-from app.core.dependencies import get_current_user
+from app.core.dependencies import Principal
+from app.core.pagination import set_next_cursor
+from app.core.etag import not_modified
+from app.core.responses import json_list_response
 from app.core.permissions import (
     require_game_read_permission,
     require_game_create_permission,
     require_game_update_permission,
     require_game_delete_permission
 )
-from app.schemas.user import UserOut
 
 router = APIRouter(prefix="/games", tags=["Games"])
 
 
 @router.get("/", response_model=List[GameOut])
 async def get_games(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_game_read_permission)
+    current_user: Principal = Depends(require_game_read_permission)
 ):
     """Get all games with pagination (Authenticated users only)."""
     game_service = GameService(db)
-    return await game_service.get_games(skip=skip, limit=limit)
+    # The ETag describes the cached copy served, which may lag the database until it is invalidated
+    games, version = await game_service.get_games_versioned(skip=skip, limit=limit, cursor=cursor)
+    unchanged = not_modified(request, response, version)
+    if unchanged:
+        return unchanged
+    set_next_cursor(response, games, limit, GameService.KEYSET)
+    return json_list_response(response, games, GAME_LIST)
 
 
 @router.get("/{game_id}", response_model=GameOut)
 async def get_game(
     game_id: int, 
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_game_read_permission)
+    current_user: Principal = Depends(require_game_read_permission)
 ):
     """Get a specific game by ID (Authenticated users only)."""
     game_service = GameService(db)
-    return await game_service.get_game_by_id(game_id)
+    game, version = await game_service.get_game_versioned(game_id)
+    unchanged = not_modified(request, response, version)
+    if unchanged:
+        return unchanged
+    return game
 
 
 @router.post("/", response_model=GameOut, status_code=status.HTTP_201_CREATED)
 async def create_game(
     game_data: GameCreate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_game_create_permission)
+    current_user: Principal = Depends(require_game_create_permission)
 ):
     """Create a new game (Admin only)."""
     game_service = GameService(db)
@@ -56,7 +73,7 @@ async def update_game(
     game_id: int, 
     game_data: GameUpdate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_game_update_permission)
+    current_user: Principal = Depends(require_game_update_permission)
 ):
     """Update an existing game (Admin only)."""
     game_service = GameService(db)
@@ -67,7 +84,7 @@ async def update_game(
 async def delete_game(
     game_id: int, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_game_delete_permission)
+    current_user: Principal = Depends(require_game_delete_permission)
 ):
     """Delete a game (Admin only)."""
     game_service = GameService(db)
@@ -76,11 +93,19 @@ async def delete_game(
 
 @router.get("/available/", response_model=List[GameOut])
 async def get_games_with_available_slots(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_game_read_permission)
+    current_user: Principal = Depends(require_game_read_permission)
 ):
     """Get games that have available slots (Authenticated users only)."""
     game_service = GameService(db)
-    return await game_service.get_games_with_available_slots(skip=skip, limit=limit)
+    unchanged = not_modified(request, response, await game_service.get_games_version())
+    if unchanged:
+        return unchanged
+    games = await game_service.get_games_with_available_slots(skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, games, limit, GameService.KEYSET)
+    return json_list_response(response, games, GAME_LIST)
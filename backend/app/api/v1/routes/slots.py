@@ -1,82 +1,156 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 from app.db.session import get_db
-from app.services.slot_service import SlotService
-from app.schemas.slot import SlotCreate, SlotUpdate, SlotOut, SlotDeleteResponse
-from app.core.dependencies import get_current_user
+from app.services.slot_service import SlotService, SLOT_LIST
+from app.services.booking_service import naive_utc
+from app.schemas.slot import SlotCreate, SlotUpdate, SlotOut, SlotDeleteResponse, SlotBulkCreate, SlotBulkCreateResponse
+from app.core.dependencies import Principal
+from app.core.pagination import set_next_cursor
+from app.core.etag import not_modified
+from app.core.responses import json_list_response
+from app.core.slot_events import slot_broker, slot_event_stream
 from app.core.permissions import (
     require_slot_read_permission,
     require_slot_create_permission,
     require_slot_update_permission,
     require_slot_delete_permission
 )
-from app.schemas.user import UserOut
 
 router = APIRouter(prefix="/slots", tags=["Slots"])
 
 
 @router.get("/", response_model=List[SlotOut])
 async def get_slots(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_slot_read_permission)
+    current_user: Principal = Depends(require_slot_read_permission)
 ):
     """Get all slots with pagination (Authenticated users only)."""
     slot_service = SlotService(db)
-    return await slot_service.get_slots(skip=skip, limit=limit)
+    unchanged = not_modified(request, response, await slot_service.get_slots_version())
+    if unchanged:
+        return unchanged
+    slots = await slot_service.get_slots(skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, slots, limit, SlotService.KEYSET)
+    return json_list_response(response, slots, SLOT_LIST)
 
 
 @router.get("/available/", response_model=List[SlotOut])
 async def get_available_slots(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_slot_read_permission)
+    current_user: Principal = Depends(require_slot_read_permission)
 ):
     """Get all available slots (not full) (Authenticated users only)."""
     slot_service = SlotService(db)
-    return await slot_service.get_available_slots(skip=skip, limit=limit)
+    unchanged = not_modified(request, response, await slot_service.get_slots_version(available=True))
+    if unchanged:
+        return unchanged
+    slots = await slot_service.get_available_slots(skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, slots, limit, SlotService.KEYSET)
+    return json_list_response(response, slots, SLOT_LIST)
 
 
 @router.get("/game/{game_id}", response_model=List[SlotOut])
 async def get_slots_by_game(
     game_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_slot_read_permission)
+    current_user: Principal = Depends(require_slot_read_permission)
 ):
     """Get all slots for a specific game (Authenticated users only)."""
     slot_service = SlotService(db)
-    return await slot_service.get_slots_by_game(game_id, skip=skip, limit=limit)
+    # The ETag describes the cached copy served, which may lag the database until it is invalidated
+    slots, version = await slot_service.get_slots_by_game_versioned(game_id, skip=skip, limit=limit, cursor=cursor)
+    unchanged = not_modified(request, response, version)
+    if unchanged:
+        return unchanged
+    set_next_cursor(response, slots, limit, SlotService.KEYSET)
+    return json_list_response(response, slots, SLOT_LIST)
 
 
 @router.get("/date-range/", response_model=List[SlotOut])
 async def get_slots_by_date_range(
+    request: Request,
+    response: Response,
     start_date: datetime = Query(..., description="Start date and time"),
     end_date: datetime = Query(..., description="End date and time"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_slot_read_permission)
+    current_user: Principal = Depends(require_slot_read_permission)
 ):
     """Get slots within a specific date range (Authenticated users only)."""
     slot_service = SlotService(db)
-    return await slot_service.get_slots_by_date_range(start_date, end_date, skip=skip, limit=limit)
+    # The ETag describes the cached copy served, which may lag the database until it is invalidated
+    slots, version = await slot_service.get_slots_by_date_range_versioned(
+        start_date, end_date, skip=skip, limit=limit, cursor=cursor
+    )
+    unchanged = not_modified(request, response, version)
+    if unchanged:
+        return unchanged
+    set_next_cursor(response, slots, limit, SlotService.KEYSET)
+    return json_list_response(response, slots, SLOT_LIST)
+
+
+@router.get("/stream/", response_class=StreamingResponse)
+async def stream_slot_occupancy(
+    game_id: Optional[List[int]] = Query(None, description="Only slots of these games; repeat for several"),
+    start_date: Optional[datetime] = Query(None, description="Only slots starting at or after this time"),
+    end_date: Optional[datetime] = Query(None, description="Only slots ending at or before this time"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_slot_read_permission)
+):
+    """Stream slot occupancy changes as Server-Sent Events (Authenticated users only).
+    
+    Each `occupancy` event carries a slot's counts after a committed change; on `resync` the client
+    fell behind and should reload the slots it shows.
+    """
+    # Authenticated; don't hold a pooled connection for the life of the stream
+    await db.close()
+    # Updates carry naive UTC slot times, so offset-aware bounds are converted to compare with them
+    events = slot_event_stream(
+        slot_broker, game_ids=game_id, start_date=naive_utc(start_date), end_date=naive_utc(end_date)
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/{slot_id}", response_model=SlotOut)
 async def get_slot(
     slot_id: int, 
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_slot_read_permission)
+    current_user: Principal = Depends(require_slot_read_permission)
 ):
     """Get a specific slot by ID (Authenticated users only)."""
     slot_service = SlotService(db)
+    version = await slot_service.get_slot_version(slot_id)
+    if version is not None:
+        unchanged = not_modified(request, response, version)
+        if unchanged:
+            return unchanged
     return await slot_service.get_slot_by_id(slot_id)
 
 
@@ -84,19 +158,30 @@ async def get_slot(
 async def create_slot(
     slot_data: SlotCreate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_slot_create_permission)
+    current_user: Principal = Depends(require_slot_create_permission)
 ):
     """Create a new slot (Admin only)."""
     slot_service = SlotService(db)
     return await slot_service.create_slot(slot_data)
 
 
+@router.post("/bulk/", response_model=SlotBulkCreateResponse, status_code=status.HTTP_201_CREATED)
+async def create_slots_bulk(
+    schedule: SlotBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_slot_create_permission)
+):
+    """Generate slots from a recurring weekday schedule (Admin only)."""
+    slot_service = SlotService(db)
+    return await slot_service.create_slots_bulk(schedule)
+
+
 @router.put("/{slot_id}", response_model=SlotOut)
 async def update_slot(
     slot_id: int, 
     slot_data: SlotUpdate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_slot_update_permission)
+    current_user: Principal = Depends(require_slot_update_permission)
 ):
     """Update an existing slot (Admin only)."""
     slot_service = SlotService(db)
@@ -107,7 +192,7 @@ async def update_slot(
 async def delete_slot(
     slot_id: int, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_slot_delete_permission)
+    current_user: Principal = Depends(require_slot_delete_permission)
 ):
     """Delete a slot (Admin only)."""
     slot_service = SlotService(db)
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
 from app.db.session import get_db
 from app.services.user_service import UserService
+from app.services.projections import USER_OUT
 from app.schemas.user import UserCreate, UserUpdate, UserOut, UserDeleteResponse, UserRole
-from app.core.dependencies import get_current_user
+from app.core.dependencies import Principal
+from app.core.pagination import set_next_cursor
+from app.core.projection import sparse_fields
+from app.core.responses import json_list_response
 from app.core.permissions import (
     require_user_read_permission,
     require_user_create_permission,
@@ -20,21 +24,26 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 @router.get("/", response_model=List[UserOut])
 async def get_users(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    fields: Optional[List[str]] = Depends(sparse_fields(UserOut)),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_user_create_permission)
+    current_user: Principal = Depends(require_user_create_permission)
 ):
     """Get all users with pagination (Admin only)."""
     user_service = UserService(db)
-    return await user_service.get_users(skip=skip, limit=limit)
+    users = await user_service.get_users(skip=skip, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, users, limit, UserService.KEYSET)
+    return json_list_response(response, users, USER_OUT.adapter, fields)
 
 
 @router.get("/{user_id}", response_model=UserOut)
 async def get_user(
     user_id: int, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_user_read_permission)
+    current_user: Principal = Depends(require_user_read_permission)
 ):
     """Get a specific user by ID (Users can only view their own profile, admins can view any)."""
     # Check ownership
@@ -48,7 +57,7 @@ async def get_user(
 async def create_user(
     user_data: UserCreate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_user_create_permission)
+    current_user: Principal = Depends(require_user_create_permission)
 ):
     """Create a new user (Admin only - for creating users on behalf of others)."""
     user_service = UserService(db)
@@ -60,7 +69,7 @@ async def update_user(
     user_id: int, 
     user_data: UserUpdate, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_user_update_permission)
+    current_user: Principal = Depends(require_user_update_permission)
 ):
     """Update an existing user (Users can only update their own profile, admins can update any)."""
     # Check ownership
@@ -74,7 +83,7 @@ async def update_user(
 async def delete_user(
     user_id: int, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_user_delete_permission)
+    current_user: Principal = Depends(require_user_delete_permission)
 ):
     """Delete a user (Admin only)."""
     user_service = UserService(db)
@@ -84,11 +93,16 @@ async def delete_user(
 @router.get("/department/{department_id}", response_model=List[UserOut])
 async def get_users_by_department(
     department_id: int,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header; takes precedence over skip"),
+    fields: Optional[List[str]] = Depends(sparse_fields(UserOut)),
     db: AsyncSession = Depends(get_db),
-    current_user: UserOut = Depends(require_user_read_permission)
+    current_user: Principal = Depends(require_user_read_permission)
 ):
     """Get all users in a specific department (Authenticated users only)."""
     user_service = UserService(db)
-    return await user_service.get_users_by_department(department_id, skip=skip, limit=limit)
+    users = await user_service.get_users_by_department(department_id, skip=skip, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, users, limit, UserService.KEYSET)
+    return json_list_response(response, users, USER_OUT.adapter, fields)
@@ -0,0 +1,225 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.slot_events import publish_queued_slot_updates
+
+
+class TTLCache:
+    """In-process LRU cache whose entries also expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= self._timer():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (value, self._timer() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches the predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LocalCacheBackend:
+    """In-process LRU + TTL backend with the subset of the asyncio Redis API the catalog cache uses."""
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self._values = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        # Generation counters live apart from the LRU so evicting them can never resurrect stale entries
+        self._counters: Dict[str, int] = {}
+        self._lock = Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._values.get(key)
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        # Entries share the backend's TTL; `ex` is accepted for API compatibility
+        self._values.set(key, value)
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[int]]:
+        return [self._counters.get(key) for key in keys]
+
+    async def incr(self, key: str) -> int:
+        with self._lock:
+            value = self._counters[key] = self._counters.get(key, 0) + 1
+            return value
+
+    async def flushdb(self) -> None:
+        self._values.clear()
+        with self._lock:
+            self._counters.clear()
+
+
+def payload_digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+
+class CatalogCache:
+    """Read-through cache for catalog reads, invalidated by bumping per-tag generations.
+
+    An entry's key embeds the current generation of each of its tags, so bumping a tag makes every
+    entry under it unreachable at once; they age out by TTL (or LRU) rather than being deleted.
+    Generations are bumped only after the writing transaction commits: a reader that saw the old
+    generation stores its result under the old key, which nobody will read again.
+    """
+
+    def __init__(self, backend: Any, ttl: int, prefix: str = "catalog:"):
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def _generations(self, tags: Sequence[str]) -> List[int]:
+        values = await self.backend.mget([f"{self.prefix}gen:{tag}" for tag in tags])
+        return [int(value or 0) for value in values]
+
+    async def get_or_load(
+        self,
+        name: str,
+        params: dict,
+        tags: Sequence[str],
+        loader: Callable[[], Awaitable[Any]],
+        adapter: TypeAdapter
+    ) -> Any:
+        """Return the cached value for `name` and `params`, loading and storing it on a miss."""
+        value, _ = await self.get_or_load_versioned(name, params, tags, loader, adapter)
+        return value
+
+    async def get_or_load_versioned(
+        self,
+        name: str,
+        params: dict,
+        tags: Sequence[str],
+        loader: Callable[[], Awaitable[Any]],
+        adapter: TypeAdapter
+    ) -> Tuple[Any, str]:
+        """get_or_load, plus a digest of the JSON the value was cached as.
+
+        An ETag taken from the digest describes the copy actually served, which can lag the
+        database until its tags are bumped (or, with the per-worker memory backend, until it expires).
+        """
+        if self.backend is None:
+            value = await loader()
+            return value, payload_digest(adapter.dump_json(value))
+        
+        generations = await self._generations(tags)
+        key = (
+            f"{self.prefix}{name}:"
+            + ",".join(f"{tag}={generation}" for tag, generation in zip(tags, generations))
+            + ":" + json.dumps(params, sort_keys=True, default=str)
+        )
+        cached = await self.backend.get(key)
+        if cached is not None:
+            catalog_cache_requests.inc(name, "hit")
+            return adapter.validate_json(cached), payload_digest(cached)
+        
+        catalog_cache_requests.inc(name, "miss")
+        value = await loader()
+        payload = adapter.dump_json(value)
+        await self.backend.set(key, payload, ex=self.ttl)
+        return value, payload_digest(payload)
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        if self.backend is None:
+            return
+        for tag in sorted(set(tags)):
+            await self.backend.incr(f"{self.prefix}gen:{tag}")
+
+    async def clear(self) -> None:
+        if self.backend is not None:
+            await self.backend.flushdb()
+
+
+catalog_cache_requests = metrics_registry.counter(
+    "catalog_cache_requests_total", "Catalog cache lookups by cached read and result", ("name", "result")
+)
+
+
+def build_cache_backend() -> Any:
+    """The backend named by CACHE_BACKEND: "memory", "redis" (needs the redis package) or "none"."""
+    if settings.CACHE_BACKEND == "none":
+        return None
+    if settings.CACHE_BACKEND == "redis":
+        from redis.asyncio import Redis
+        return Redis.from_url(settings.CACHE_URL)
+    if settings.CACHE_BACKEND == "memory":
+        return LocalCacheBackend(maxsize=settings.CACHE_MAX_SIZE, ttl=settings.CACHE_TTL_SECONDS)
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND}")
+
+
+catalog_cache = CatalogCache(build_cache_backend(), ttl=settings.CACHE_TTL_SECONDS)
+
+
+# Catalog tags: what each cached read depends on
+GAMES_TAG = "games"  # every page of games, since each game carries slot counts
+SLOT_RANGES_TAG = "slots:range"  # every date-range page of slots
+
+
+def game_tag(game_id: int) -> str:
+    return f"game:{game_id}"
+
+
+def game_slots_tag(game_id: int) -> str:
+    return f"slots:game:{game_id}"
+
+
+_STALE_TAGS = "catalog_stale_tags"
+
+
+def mark_stale(db: AsyncSession, *tags: str) -> None:
+    """Record tags the session's pending transaction makes stale."""
+    db.info.setdefault(_STALE_TAGS, set()).update(tags)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_stale_tags(session, previous_transaction):
+    # A rolled-back write changed nothing, so a later commit on the session mustn't invalidate for it
+    session.info.pop(_STALE_TAGS, None)
+
+
+async def commit_and_invalidate(db: AsyncSession) -> None:
+    """Commit, then invalidate the tags marked stale and publish the slot updates queued during the transaction."""
+    await db.commit()
+    tags = db.info.pop(_STALE_TAGS, None)
+    if tags:
+        await catalog_cache.invalidate(tags)
+    await publish_queued_slot_updates(db)
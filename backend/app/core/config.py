@@ -9,6 +9,50 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     DEBUG: bool = False
 
+    # Database engine (per worker process)
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # 0 disables
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100  # 0 when running behind pgbouncer in transaction mode
+    SLOW_QUERY_THRESHOLD_MS: float = 500  # statements at least this slow are logged; 0 disables
+
+    # Authenticated principals (id, role, department) cached per token to skip the user lookup
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # Read-through cache for game and slot catalog reads: "memory" (per worker), "redis" or "none"
+    CACHE_BACKEND: str = "memory"
+    CACHE_URL: str = "redis://localhost:6379/0"
+    CACHE_TTL_SECONDS: int = 30
+    CACHE_MAX_SIZE: int = 10000
+
+    # Slot occupancy streaming: "memory" fans out within one worker, "redis" across workers
+    SLOT_EVENTS_BACKEND: str = "memory"
+    SLOT_EVENTS_URL: str = "redis://localhost:6379/0"
+    SLOT_EVENTS_BUFFER_SIZE: int = 500  # distinct slots pending per client before it is told to resync
+    SLOT_EVENTS_KEEPALIVE_SECONDS: float = 15
+    SLOT_EVENTS_RETRY_MS: int = 3000  # EventSource reconnect delay
+
+    # bcrypt runs on its own thread pool; beyond MAX_PENDING queued calls, requests get a 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # IANA zone whose calendar day "reset current day" clears; slot times are stored as naive UTC
+    BOOKING_TIMEZONE: str = "UTC"
+
+    # Rows fetched per round trip by the server-side cursor behind the bookings export
+    BOOKING_EXPORT_BATCH_SIZE: int = 1000
+
+    # Usage analytics read the hourly rollup tables instead of aggregating slots and bookings live;
+    # refresh them with `python -m app.db.usage_rollup` (the first refresh after enabling is a full rebuild)
+    ANALYTICS_ROLLUP: bool = False
+    # Rows updated this long before a refresh are re-read by the next one, covering transactions in flight
+    ANALYTICS_ROLLUP_OVERLAP_SECONDS: int = 300
+
     class Config:
         env_file = ".env"
 
@@ -1,12 +1,15 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
 from typing import Optional
 
 from app.db.session import get_db
 from app.services.auth_service import AuthService
 from app.schemas.user import UserOut
 from app.schemas.user import UserRole
+from app.core.cache import TTLCache
+from app.core.config import settings
 
 # Security scheme for JWT Bearer tokens
 security = HTTPBearer(
@@ -15,6 +18,43 @@ security = HTTPBearer(
 )
 
 
+class Principal(BaseModel):
+    """The authenticated caller, reduced to what permission and ownership checks use."""
+    id: int
+    role: UserRole
+    department_id: Optional[int] = None
+
+
+# Keyed by (user_id, token), so a new token never sees an older token's entry
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Forget cached principals for a user whose role, department or existence changed."""
+    principal_cache.discard_where(lambda key: key[0] == user_id)
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """Dependency to get the authenticated principal, from cache when possible."""
+    auth_service = AuthService(db)
+    token = credentials.credentials
+    # Decoding still checks the signature and expiry on every request
+    user_id = auth_service.get_token_user_id(token)
+    
+    principal = principal_cache.get((user_id, token))
+    if principal is None:
+        access = await auth_service.get_user_access(user_id)
+        principal = Principal(id=access.id, role=access.role.value, department_id=access.department_id)
+        principal_cache.set((user_id, token), principal)
+    return principal
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
@@ -34,8 +74,8 @@ async def get_current_active_user(
 
 
 async def get_current_admin_user(
-    current_user: UserOut = Depends(get_current_user)
-) -> UserOut:
+    current_user: Principal = Depends(get_current_principal)
+) -> Principal:
     """Dependency to get current admin user."""
     if current_user.role != UserRole.admin:
         raise HTTPException(
@@ -1,10 +1,11 @@
 from fastapi import FastAPI
-from app.db.session import AsyncSessionLocal
+from app.db.session import AsyncSessionLocal, describe_engine_config
 from app.db.init_db import init_db
 
 def init_app_events(app: FastAPI):
     @app.on_event("startup")
     async def on_startup():
+        print(describe_engine_config())
         async with AsyncSessionLocal() as db:
             await init_db(db)   # make sure init_db is async
 
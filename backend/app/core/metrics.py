@@ -0,0 +1,226 @@
+"""Prometheus text-format metrics, recorded into per-thread shards so recording never takes a lock."""
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class ThreadShards:
+    """One dict per recording thread; each thread only writes its own and readers copy them all.
+
+    Almost everything records from the event loop thread, so there is usually a single shard,
+    but threads (bcrypt pool, sync callers) never contend on or corrupt each other's values.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+
+    def local(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            self._shards.append(shard)
+        return shard
+
+    def copies(self) -> List[dict]:
+        # dict.copy() doesn't release the GIL, so a shard can't change size mid-copy
+        return [shard.copy() for shard in list(self._shards)]
+
+    def clear(self) -> None:
+        for shard in list(self._shards):
+            shard.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._shards = ThreadShards()
+
+    def _key(self, labels: Sequence) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels}")
+        return tuple(str(label) for label in labels)
+
+    def _merged(self) -> Dict[Tuple[str, ...], float]:
+        totals: Dict[Tuple[str, ...], float] = {}
+        for shard in self._shards.copies():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def value(self, *labels) -> float:
+        """Current value for one label set, summed across shards."""
+        return self._merged().get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        for key, value in sorted(self._merged().items()):
+            yield self.name, self.labelnames, key, value
+
+    def clear(self) -> None:
+        self._shards.clear()
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        shard = self._shards.local()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+
+class Gauge(Counter):
+    """Sharded up/down gauge; each shard holds its own net change and the value is their sum."""
+    type = "gauge"
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class CallbackGauge(Metric):
+    """Gauge read at scrape time from a callback returning a value, or values keyed by label tuple."""
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], object],
+        labelnames: Sequence[str] = ()
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _merged(self) -> Dict[Tuple[str, ...], float]:
+        values = self.callback()
+        if values is None:
+            return {}
+        if not isinstance(values, dict):
+            return {(): values}
+        return {self._key(labels): value for labels, value in values.items()}
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels) -> None:
+        shard = self._shards.local()
+        key = self._key(labels)
+        # Per-bucket counts (the last one is +Inf), then the sum
+        state = shard.get(key)
+        if state is None:
+            state = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def _merged(self) -> Dict[Tuple[str, ...], List[float]]:
+        totals: Dict[Tuple[str, ...], List[float]] = {}
+        for shard in self._shards.copies():
+            for key, state in shard.items():
+                total = totals.setdefault(key, [0] * len(state))
+                for index, value in enumerate(list(state)):
+                    total[index] += value
+        return totals
+
+    def value(self, *labels) -> float:
+        """Observation count for one label set."""
+        state = self._merged().get(self._key(labels))
+        return sum(state[:-1]) if state else 0
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        bucket_labels = self.labelnames + ("le",)
+        for key, state in sorted(self._merged().items()):
+            running = 0
+            for bound, count in zip(self.buckets + (math.inf,), state[:-1]):
+                running += count
+                yield f"{self.name}_bucket", bucket_labels, key + (_format_value(bound),), running
+            yield f"{self.name}_sum", self.labelnames, key, state[-1]
+            yield f"{self.name}_count", self.labelnames, key, running
+
+
+class MetricsRegistry:
+    """The metrics a worker exposes at /metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def callback_gauge(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], object],
+        labelnames: Sequence[str] = ()
+    ) -> CallbackGauge:
+        return self.register(CallbackGauge(name, documentation, callback, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            documentation = metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+            lines.append(f"# HELP {metric.name} {documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labelnames, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
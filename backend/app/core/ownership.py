@@ -1,13 +1,14 @@
 from fastapi import HTTPException, status
-from app.schemas.user import UserOut, UserRole
+from app.schemas.user import UserRole
+from app.core.dependencies import Principal
 
 
-def check_self_or_admin(user: UserOut, resource_user_id: int) -> bool:
+def check_self_or_admin(user: Principal, resource_user_id: int) -> bool:
     """Check if user can access a resource (own data or admin)."""
     return user.role == UserRole.admin or user.id == resource_user_id
 
 
-def require_self_or_admin(user: UserOut, resource_user_id: int) -> None:
+def require_self_or_admin(user: Principal, resource_user_id: int) -> None:
     """Require that user can access the resource (own data or admin)."""
     if not check_self_or_admin(user, resource_user_id):
         raise HTTPException(
@@ -16,12 +17,12 @@ def require_self_or_admin(user: UserOut, resource_user_id: int) -> None:
         )
 
 
-def check_booking_ownership(user: UserOut, booking_user_id: int) -> bool:
+def check_booking_ownership(user: Principal, booking_user_id: int) -> bool:
     """Check if user can access a booking (own booking or admin)."""
     return user.role == UserRole.admin or user.id == booking_user_id
 
 
-def require_booking_ownership(user: UserOut, booking_user_id: int) -> None:
+def require_booking_ownership(user: Principal, booking_user_id: int) -> None:
     """Require that user can access the booking (own booking or admin)."""
     if not check_booking_ownership(user, booking_user_id):
         raise HTTPException(
@@ -30,12 +31,12 @@ def require_booking_ownership(user: UserOut, booking_user_id: int) -> None:
         )
 
 
-def check_user_ownership(user: UserOut, target_user_id: int) -> bool:
+def check_user_ownership(user: Principal, target_user_id: int) -> bool:
     """Check if user can access another user's data (own data or admin)."""
     return user.role == UserRole.admin or user.id == target_user_id
 
 
-def require_user_ownership(user: UserOut, target_user_id: int) -> None:
+def require_user_ownership(user: Principal, target_user_id: int) -> None:
     """Require that user can access the target user's data (own data or admin)."""
     if not check_user_ownership(user, target_user_id):
         raise HTTPException(
@@ -44,7 +45,7 @@ def require_user_ownership(user: UserOut, target_user_id: int) -> None:
         )
 
 
-def require_admin(user: UserOut) -> None:
+def require_admin(user: Principal) -> None:
     """Require that user is an admin."""
     if user.role != UserRole.admin:
         raise HTTPException(
@@ -53,6 +54,6 @@ def require_admin(user: UserOut) -> None:
         )
 
 
-def is_admin(user: UserOut) -> bool:
+def is_admin(user: Principal) -> bool:
     """Check if user is an admin."""
     return user.role == UserRole.admin
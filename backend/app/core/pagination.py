@@ -0,0 +1,87 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode keyset values into an opaque, URL-safe cursor."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keyset: Sequence) -> tuple:
+    """Decode a cursor back into values typed for the keyset columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keyset):
+            raise ValueError("cursor does not match the keyset")
+        return tuple(_decode_value(column, value) for column, value in zip(keyset, values))
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def paginate(
+    query,
+    keyset: Sequence,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    descending: bool = False
+):
+    """Order a query by its keyset and page it by cursor (seek) or, without one, by skip (offset)."""
+    query = query.order_by(*(column.desc() if descending else column for column in keyset))
+    if cursor:
+        values = decode_cursor(cursor, keyset)
+        if len(keyset) == 1:
+            position, after = keyset[0], values[0]
+        else:
+            position, after = tuple_(*keyset), tuple_(*values)
+        query = query.where(position < after if descending else position > after)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def next_cursor(items: List[Any], limit: int, keyset: Sequence) -> Optional[str]:
+    """Cursor for the page after `items`, or None when this page was the last one."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    # Sparse fieldsets come back as dicts
+    if isinstance(last, dict):
+        return encode_cursor([last[column.key] for column in keyset])
+    return encode_cursor([getattr(last, column.key) for column in keyset])
+
+
+def set_next_cursor(response: Response, items: List[Any], limit: int, keyset: Sequence) -> None:
+    """Expose the next page's cursor on the response."""
+    cursor = next_cursor(items, limit, keyset)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -2,8 +2,8 @@ from enum import Enum
 from typing import List, Dict, Set, Optional
 from functools import wraps
 from fastapi import HTTPException, status, Depends
-from app.schemas.user import UserOut, UserRole
-from app.core.dependencies import get_current_user
+from app.schemas.user import UserRole
+from app.core.dependencies import Principal, get_current_principal
 
 
 class Permission(str, Enum):
@@ -88,22 +88,22 @@ class PermissionManager:
             }
         }
     
-    def has_permission(self, user: UserOut, permission: Permission) -> bool:
+    def has_permission(self, user: Principal, permission: Permission) -> bool:
         """Check if user has a specific permission."""
         user_permissions = self._role_permissions.get(user.role, set())
         return permission in user_permissions
     
-    def has_any_permission(self, user: UserOut, permissions: List[Permission]) -> bool:
+    def has_any_permission(self, user: Principal, permissions: List[Permission]) -> bool:
         """Check if user has any of the specified permissions."""
         user_permissions = self._role_permissions.get(user.role, set())
         return any(permission in user_permissions for permission in permissions)
     
-    def has_all_permissions(self, user: UserOut, permissions: List[Permission]) -> bool:
+    def has_all_permissions(self, user: Principal, permissions: List[Permission]) -> bool:
         """Check if user has all of the specified permissions."""
         user_permissions = self._role_permissions.get(user.role, set())
         return all(permission in user_permissions for permission in permissions)
     
-    def get_user_permissions(self, user: UserOut) -> Set[Permission]:
+    def get_user_permissions(self, user: Principal) -> Set[Permission]:
         """Get all permissions for a user."""
         return self._role_permissions.get(user.role, set())
 
@@ -183,7 +183,7 @@ def require_all_permissions(permissions: List[Permission]):
 
 
 # Permission dependency functions
-def require_user_read_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_user_read_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require user read permission."""
     if not permission_manager.has_permission(current_user, Permission.USER_READ):
         raise HTTPException(
@@ -193,7 +193,7 @@ def require_user_read_permission(current_user: UserOut = Depends(get_current_use
     return current_user
 
 
-def require_user_create_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_user_create_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require user create permission (for admin user management)."""
     if not permission_manager.has_permission(current_user, Permission.USER_CREATE):
         raise HTTPException(
@@ -203,7 +203,7 @@ def require_user_create_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_user_update_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_user_update_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require user update permission."""
     if not permission_manager.has_permission(current_user, Permission.USER_UPDATE):
         raise HTTPException(
@@ -213,7 +213,7 @@ def require_user_update_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_user_delete_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_user_delete_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require user delete permission."""
     if not permission_manager.has_permission(current_user, Permission.USER_DELETE):
         raise HTTPException(
@@ -223,7 +223,7 @@ def require_user_delete_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_department_read_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_department_read_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require department read permission."""
     if not permission_manager.has_permission(current_user, Permission.DEPARTMENT_READ):
         raise HTTPException(
@@ -233,7 +233,7 @@ def require_department_read_permission(current_user: UserOut = Depends(get_curre
     return current_user
 
 
-def require_department_create_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_department_create_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require department create permission."""
     if not permission_manager.has_permission(current_user, Permission.DEPARTMENT_CREATE):
         raise HTTPException(
@@ -243,7 +243,7 @@ def require_department_create_permission(current_user: UserOut = Depends(get_cur
     return current_user
 
 
-def require_department_update_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_department_update_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require department update permission."""
     if not permission_manager.has_permission(current_user, Permission.DEPARTMENT_UPDATE):
         raise HTTPException(
@@ -253,7 +253,7 @@ def require_department_update_permission(current_user: UserOut = Depends(get_cur
     return current_user
 
 
-def require_department_delete_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_department_delete_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require department delete permission."""
     if not permission_manager.has_permission(current_user, Permission.DEPARTMENT_DELETE):
         raise HTTPException(
@@ -263,7 +263,7 @@ def require_department_delete_permission(current_user: UserOut = Depends(get_cur
     return current_user
 
 
-def require_game_read_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_game_read_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require game read permission."""
     if not permission_manager.has_permission(current_user, Permission.GAME_READ):
         raise HTTPException(
@@ -273,7 +273,7 @@ def require_game_read_permission(current_user: UserOut = Depends(get_current_use
     return current_user
 
 
-def require_game_create_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_game_create_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require game create permission."""
     if not permission_manager.has_permission(current_user, Permission.GAME_CREATE):
         raise HTTPException(
@@ -283,7 +283,7 @@ def require_game_create_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_game_update_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_game_update_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require game update permission."""
     if not permission_manager.has_permission(current_user, Permission.GAME_UPDATE):
         raise HTTPException(
@@ -293,7 +293,7 @@ def require_game_update_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_game_delete_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_game_delete_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require game delete permission."""
     if not permission_manager.has_permission(current_user, Permission.GAME_DELETE):
         raise HTTPException(
@@ -303,7 +303,7 @@ def require_game_delete_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_slot_read_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_slot_read_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require slot read permission."""
     if not permission_manager.has_permission(current_user, Permission.SLOT_READ):
         raise HTTPException(
@@ -313,7 +313,7 @@ def require_slot_read_permission(current_user: UserOut = Depends(get_current_use
     return current_user
 
 
-def require_slot_create_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_slot_create_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require slot create permission."""
     if not permission_manager.has_permission(current_user, Permission.SLOT_CREATE):
         raise HTTPException(
@@ -323,7 +323,7 @@ def require_slot_create_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_slot_update_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_slot_update_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require slot update permission."""
     if not permission_manager.has_permission(current_user, Permission.SLOT_UPDATE):
         raise HTTPException(
@@ -333,7 +333,7 @@ def require_slot_update_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_slot_delete_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_slot_delete_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require slot delete permission."""
     if not permission_manager.has_permission(current_user, Permission.SLOT_DELETE):
         raise HTTPException(
@@ -343,7 +343,7 @@ def require_slot_delete_permission(current_user: UserOut = Depends(get_current_u
     return current_user
 
 
-def require_booking_read_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_booking_read_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require booking read permission."""
     if not permission_manager.has_permission(current_user, Permission.BOOKING_READ):
         raise HTTPException(
@@ -353,7 +353,7 @@ def require_booking_read_permission(current_user: UserOut = Depends(get_current_
     return current_user
 
 
-def require_booking_create_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_booking_create_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require booking create permission."""
     if not permission_manager.has_permission(current_user, Permission.BOOKING_CREATE):
         raise HTTPException(
@@ -363,7 +363,7 @@ def require_booking_create_permission(current_user: UserOut = Depends(get_curren
     return current_user
 
 
-def require_booking_update_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_booking_update_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require booking update permission."""
     if not permission_manager.has_permission(current_user, Permission.BOOKING_UPDATE):
         raise HTTPException(
@@ -373,7 +373,7 @@ def require_booking_update_permission(current_user: UserOut = Depends(get_curren
     return current_user
 
 
-def require_booking_delete_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_booking_delete_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require booking delete permission."""
     if not permission_manager.has_permission(current_user, Permission.BOOKING_DELETE):
         raise HTTPException(
@@ -383,7 +383,7 @@ def require_booking_delete_permission(current_user: UserOut = Depends(get_curren
     return current_user
 
 
-def require_booking_confirm_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_booking_confirm_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require booking confirm permission."""
     if not permission_manager.has_permission(current_user, Permission.BOOKING_CONFIRM):
         raise HTTPException(
@@ -393,7 +393,7 @@ def require_booking_confirm_permission(current_user: UserOut = Depends(get_curre
     return current_user
 
 
-def require_booking_reset_permission(current_user: UserOut = Depends(get_current_user)) -> UserOut:
+def require_booking_reset_permission(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require booking reset permission."""
     if not permission_manager.has_permission(current_user, Permission.BOOKING_RESET):
         raise HTTPException(
@@ -0,0 +1,63 @@
+"""Column projections: reads that select exactly the columns a response schema needs."""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select
+
+
+class Projection:
+    """A response schema's fields as SQL expressions.
+
+    Rows map straight onto the schema, with no ORM entities or relationships loaded. A subset of
+    fields can be selected for sparse fieldsets; the `always` fields (the keyset) are kept so
+    cursors still work.
+    """
+
+    def __init__(self, schema: Type[BaseModel], expressions: Dict[str, Any], always: Sequence[str] = ("id",)):
+        missing = set(schema.model_fields) - set(expressions)
+        if missing:
+            raise ValueError(f"{schema.__name__} fields without an expression: {', '.join(sorted(missing))}")
+        self.schema = schema
+        self.expressions = expressions
+        self.always = tuple(always)
+        self.adapter = TypeAdapter(List[schema])
+
+    def names(self, fields: Optional[Sequence[str]] = None) -> List[str]:
+        if fields is None:
+            return list(self.schema.model_fields)
+        return [*self.always, *(name for name in fields if name not in self.always)]
+
+    def select(self, fields: Optional[Sequence[str]] = None):
+        """SELECT of the labelled expressions for `fields`, or for the whole schema."""
+        return select(*(self.expressions[name].label(name) for name in self.names(fields)))
+
+    def load(self, rows: Sequence, fields: Optional[Sequence[str]] = None) -> list:
+        """Schema instances, or plain dicts of just the selected fields for a sparse fieldset."""
+        if fields is None:
+            return self.adapter.validate_python([row._mapping for row in rows])
+        return [dict(row._mapping) for row in rows]
+
+
+def sparse_fields(schema: Type[BaseModel]) -> Callable[..., Optional[List[str]]]:
+    """Dependency parsing a comma-separated `fields` query parameter against a schema's fields."""
+    allowed = list(schema.model_fields)
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None, description=f"Comma-separated fields to return (id is always included): {', '.join(allowed)}"
+        )
+    ) -> Optional[List[str]]:
+        if not fields:
+            return None
+        names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+        return names or None
+
+    return dependency
+
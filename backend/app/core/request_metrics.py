@@ -0,0 +1,266 @@
+"""Per-request SQL statement counts and timings, reported as Server-Timing and aggregated per route."""
+import logging
+import re
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import ThreadShards, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+FINGERPRINT_MAX_LENGTH = 200
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Statement with literals and bind parameters replaced by ?, so repeats of one query group together."""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    # Expanded IN lists differ in length between calls
+    statement = _PLACEHOLDER_LIST.sub("(?...)", statement)
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    if len(statement) > FINGERPRINT_MAX_LENGTH:
+        statement = statement[:FINGERPRINT_MAX_LENGTH - 3] + "..."
+    return statement
+
+
+@dataclass
+class RequestQueryStats:
+    """Statements run on behalf of one request."""
+    count: int = 0
+    db_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.db_seconds += seconds
+        if self.slowest_statement is None or seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    @property
+    def slowest_fingerprint(self) -> Optional[str]:
+        return fingerprint(self.slowest_statement) if self.slowest_statement else None
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+# Registered on the Engine class, so every engine (app, tests, benchmarks) is covered
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["query_started"].pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+
+    threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+    if threshold_ms and seconds * 1000 >= threshold_ms:
+        logger.warning("Slow query (%.1f ms): %s", seconds * 1000, fingerprint(statement))
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute
+    if context.connection is not None and context.connection.info.get("query_started"):
+        context.connection.info["query_started"].pop()
+
+
+class Histogram:
+    """Counts of observations per bucket, reported cumulatively like Prometheus histograms."""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        merged = Histogram(self.bounds)
+        merged.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        merged.total = self.total + other.total
+        merged.max = max(self.max, other.max)
+        return merged
+
+    def snapshot(self) -> dict:
+        buckets = []
+        running = 0
+        for bound, count in zip(list(self.bounds) + ["+Inf"], self.counts):
+            running += count
+            buckets.append({"le": bound, "count": running})
+        return {
+            "count": running,
+            "sum": round(self.total, 3),
+            "max": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class RouteMetrics:
+    requests: int = 0
+    server_errors: int = 0
+    duration_ms: Histogram = field(default_factory=lambda: Histogram(DURATION_BUCKETS_MS))
+    db_ms: Histogram = field(default_factory=lambda: Histogram(DURATION_BUCKETS_MS))
+    queries: Histogram = field(default_factory=lambda: Histogram(QUERY_COUNT_BUCKETS))
+    slowest_query_ms: float = 0.0
+    slowest_query: Optional[str] = None
+
+    def merge(self, other: "RouteMetrics") -> "RouteMetrics":
+        slowest = self if self.slowest_query_ms >= other.slowest_query_ms else other
+        return RouteMetrics(
+            requests=self.requests + other.requests,
+            server_errors=self.server_errors + other.server_errors,
+            duration_ms=self.duration_ms.merge(other.duration_ms),
+            db_ms=self.db_ms.merge(other.db_ms),
+            queries=self.queries.merge(other.queries),
+            slowest_query_ms=slowest.slowest_query_ms,
+            slowest_query=slowest.slowest_query,
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "server_errors": self.server_errors,
+            "duration_ms": self.duration_ms.snapshot(),
+            "db_ms": self.db_ms.snapshot(),
+            "queries": self.queries.snapshot(),
+            "slowest_query_ms": round(self.slowest_query_ms, 3),
+            "slowest_query": self.slowest_query,
+        }
+
+
+class RequestMetricsRegistry:
+    """Per-route aggregates of request duration, DB time and statement counts, sharded per thread."""
+
+    def __init__(self):
+        self._shards = ThreadShards()
+
+    def observe(self, route: str, status_code: int, duration_seconds: float, stats: RequestQueryStats) -> None:
+        routes = self._shards.local()
+        metrics = routes.get(route)
+        if metrics is None:
+            metrics = routes[route] = RouteMetrics()
+        metrics.requests += 1
+        if status_code >= 500:
+            metrics.server_errors += 1
+        metrics.duration_ms.observe(duration_seconds * 1000)
+        metrics.db_ms.observe(stats.db_seconds * 1000)
+        metrics.queries.observe(stats.count)
+        if stats.slowest_statement and stats.slowest_seconds * 1000 > metrics.slowest_query_ms:
+            metrics.slowest_query_ms = stats.slowest_seconds * 1000
+            metrics.slowest_query = stats.slowest_fingerprint
+
+    def snapshot(self) -> Dict[str, dict]:
+        merged: Dict[str, RouteMetrics] = {}
+        for routes in self._shards.copies():
+            for route, metrics in routes.items():
+                merged[route] = merged[route].merge(metrics) if route in merged else metrics
+        return {route: metrics.snapshot() for route, metrics in sorted(merged.items())}
+
+    def clear(self) -> None:
+        self._shards.clear()
+
+
+request_metrics = RequestMetricsRegistry()
+
+http_requests = metrics_registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status", ("method", "route", "status")
+)
+http_request_duration = metrics_registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template", ("method", "route")
+)
+http_request_statements = metrics_registry.histogram(
+    "http_request_db_statements", "SQL statements run per HTTP request", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+http_requests_in_flight = metrics_registry.gauge("http_requests_in_flight", "HTTP requests being served")
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def server_timing(stats: RequestQueryStats, duration_seconds: float, include_statement: bool = False) -> str:
+    """Server-Timing header value: DB time and statement count, the slowest statement, and the total."""
+    metrics: List[str] = [f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.count} queries"']
+    if stats.slowest_statement:
+        slowest = f"db-slowest;dur={stats.slowest_seconds * 1000:.2f}"
+        if include_statement:
+            slowest += f";desc={_quote(stats.slowest_fingerprint)}"
+        metrics.append(slowest)
+    metrics.append(f"total;dur={duration_seconds * 1000:.2f}")
+    return ", ".join(metrics)
+
+
+class QueryMetricsMiddleware:
+    """ASGI middleware collecting the statements each HTTP request runs.
+
+    Adds a Server-Timing header and feeds `request_metrics` and the Prometheus request metrics,
+    keyed by method and route template.
+    The slowest statement's text only goes into the header in DEBUG, since it describes the schema.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+        http_requests_in_flight.inc()
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                header = server_timing(stats, time.perf_counter() - started, include_statement=settings.DEBUG)
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", header.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            http_requests_in_flight.dec()
+            duration = time.perf_counter() - started
+            # The router records the matched route in the scope; unmatched paths share one entry
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "<unmatched>"
+            method = scope["method"]
+            request_metrics.observe(f"{method} {path}", status_code, duration, stats)
+            http_requests.inc(method, path, status_code)
+            http_request_duration.observe(duration, method, path)
+            http_request_statements.observe(stats.count, method, path)
@@ -0,0 +1,26 @@
+"""Fast path for list responses: serialize with a prebuilt TypeAdapter straight to JSON bytes."""
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# Sparse fieldsets are plain dicts of the selected columns
+SPARSE_ROWS = TypeAdapter(List[Dict[str, Any]])
+
+
+def json_list_response(
+    response: Response,
+    items: list,
+    adapter: TypeAdapter,
+    fields: Optional[Sequence[str]] = None
+) -> Response:
+    """Dump items with `adapter` (or as sparse rows) into a raw JSON Response.
+
+    The route's response_model still documents the list, but returning a Response skips
+    FastAPI re-validating every item against it and encoding the result a second time
+    through jsonable_encoder and json.dumps. Items must already be instances of the
+    adapter's type. A returned Response doesn't pick up headers set on the injected one,
+    so they are copied over.
+    """
+    body = (adapter if fields is None else SPARSE_ROWS).dump_json(items)
+    return Response(body, media_type="application/json", headers=dict(response.headers))
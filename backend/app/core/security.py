@@ -1,7 +1,14 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwt
 from app.core.config import settings
+from app.core.metrics import metrics_registry
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -15,6 +22,109 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+@dataclass
+class PasswordHashMetrics:
+    """Running totals for bcrypt calls made through the hashing pool."""
+    calls: int = 0
+    rejected: int = 0
+    pending: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    duration_seconds_total: float = 0.0
+    duration_seconds_max: float = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "pending": self.pending,
+            "wait_seconds_avg": self.wait_seconds_total / self.calls if self.calls else 0.0,
+            "wait_seconds_max": self.wait_seconds_max,
+            "duration_seconds_avg": self.duration_seconds_total / self.calls if self.calls else 0.0,
+            "duration_seconds_max": self.duration_seconds_max,
+        }
+
+
+password_hash_metrics = PasswordHashMetrics()
+_password_hash_lock = Lock()
+
+password_hash_duration = metrics_registry.histogram(
+    "password_hash_duration_seconds", "Time bcrypt calls spend hashing",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 2, 5)
+)
+password_hash_wait = metrics_registry.histogram(
+    "password_hash_wait_seconds", "Time bcrypt calls wait for a hashing thread"
+)
+password_hash_rejections = metrics_registry.counter(
+    "password_hash_rejected_total", "bcrypt calls rejected with 503 because too many were queued"
+)
+metrics_registry.callback_gauge(
+    "password_hash_pending", "bcrypt calls queued or running", lambda: password_hash_metrics.pending
+)
+jwt_decode_failures = metrics_registry.counter(
+    "jwt_decode_failures_total", "Access tokens rejected while decoding, by reason", ("reason",)
+)
+
+# bcrypt releases the GIL, so threads give real parallelism without blocking the event loop
+password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
+
+async def _run_password_hash(func, *args):
+    """Run a bcrypt call on the hashing pool, rejecting with 503 when too many are queued."""
+    with _password_hash_lock:
+        if password_hash_metrics.pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            password_hash_metrics.rejected += 1
+            password_hash_rejections.inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please try again",
+                headers={"Retry-After": "1"}
+            )
+        password_hash_metrics.pending += 1
+
+    submitted = time.perf_counter()
+
+    def timed_call():
+        started = time.perf_counter()
+        result = func(*args)
+        return result, started - submitted, time.perf_counter() - started
+
+    def release(_future):
+        with _password_hash_lock:
+            password_hash_metrics.pending -= 1
+
+    try:
+        future = password_hash_executor.submit(timed_call)
+    except BaseException:
+        release(None)
+        raise
+    # Released when the job finishes, not when the caller stops waiting: a cancelled request
+    # (client gone) leaves its bcrypt call running, and it still counts towards the limit
+    future.add_done_callback(release)
+    result, wait, duration = await asyncio.wrap_future(future)
+
+    with _password_hash_lock:
+        password_hash_metrics.calls += 1
+        password_hash_metrics.wait_seconds_total += wait
+        password_hash_metrics.wait_seconds_max = max(password_hash_metrics.wait_seconds_max, wait)
+        password_hash_metrics.duration_seconds_total += duration
+        password_hash_metrics.duration_seconds_max = max(password_hash_metrics.duration_seconds_max, duration)
+    password_hash_wait.observe(wait)
+    password_hash_duration.observe(duration)
+    return result
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_password_hash(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_hash(verify_password, plain_password, hashed_password)
+
+
 # JWT Token
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
@@ -28,5 +138,9 @@ def decode_access_token(token: str) -> dict | None:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
+    except ExpiredSignatureError:
+        jwt_decode_failures.inc("expired")
+        return None
     except JWTError:
+        jwt_decode_failures.inc("invalid")
         return None
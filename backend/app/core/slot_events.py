@@ -0,0 +1,255 @@
+"""Slot occupancy updates, published after each committed write and fanned out to streaming clients."""
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence, Set, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.models.slot import Slot
+from app.schemas.slot import SlotOccupancy
+
+logger = logging.getLogger(__name__)
+
+# What an occupancy update is built from, in order; writes read these back with RETURNING
+OCCUPANCY_COLUMNS = (Slot.id, Slot.game_id, Slot.start_time, Slot.end_time, Slot.booked_count, Slot.capacity)
+
+SLOT_UPDATES = TypeAdapter(List[SlotOccupancy])
+
+REDIS_CHANNEL = "slot-occupancy"
+
+
+def slot_occupancy(values: Sequence, removed: bool = False) -> SlotOccupancy:
+    """Occupancy update from values in OCCUPANCY_COLUMNS order."""
+    slot_id, game_id, start_time, end_time, booked_count, capacity = values
+    return SlotOccupancy(
+        slot_id=slot_id,
+        game_id=game_id,
+        start_time=start_time,
+        end_time=end_time,
+        booked_count=booked_count,
+        capacity=capacity,
+        is_full=booked_count >= capacity,
+        removed=removed
+    )
+
+
+def occupancy_of(slot: Slot, removed: bool = False) -> SlotOccupancy:
+    return slot_occupancy([getattr(slot, column.key) for column in OCCUPANCY_COLUMNS], removed)
+
+
+class Subscription:
+    """One client's filtered, bounded buffer of pending updates.
+
+    Updates are kept per slot, so a burst on one slot collapses into its latest counts. A client too
+    slow to drain more than `maxsize` distinct slots loses the buffer and is told to resync instead,
+    so memory per client stays bounded however far behind it falls.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        game_ids: Optional[Iterable[int]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
+        self.maxsize = maxsize
+        self.game_ids = set(game_ids) if game_ids else None
+        self.start_date = start_date
+        self.end_date = end_date
+        self._pending: "OrderedDict[int, SlotOccupancy]" = OrderedDict()
+        self._overflowed = False
+        self._ready = asyncio.Event()
+
+    def matches(self, update: SlotOccupancy) -> bool:
+        """Same filters as the game and date-range slot listings."""
+        if self.game_ids is not None and update.game_id not in self.game_ids:
+            return False
+        if self.start_date is not None and update.start_time < self.start_date:
+            return False
+        if self.end_date is not None and update.end_time > self.end_date:
+            return False
+        return True
+
+    def put(self, update: SlotOccupancy) -> None:
+        if not self.matches(update) or self._overflowed:
+            return
+        if update.slot_id in self._pending:
+            del self._pending[update.slot_id]
+        elif len(self._pending) >= self.maxsize:
+            self.resync()
+            return
+        self._pending[update.slot_id] = update
+        self._ready.set()
+
+    def resync(self) -> None:
+        """Drop whatever is pending and tell the client to reload instead."""
+        self._pending.clear()
+        self._overflowed = True
+        self._ready.set()
+        slot_stream_resyncs.inc()
+
+    async def next_batch(self, timeout: float) -> Tuple[bool, List[SlotOccupancy]]:
+        """(resync, updates) once anything is pending, or (False, []) after `timeout` seconds of quiet."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False, []
+        self._ready.clear()
+        resync, self._overflowed = self._overflowed, False
+        updates = list(self._pending.values())
+        self._pending.clear()
+        return resync, updates
+
+
+class LocalBroker:
+    """Fans updates out to this worker's subscriptions; enough when the app runs a single worker."""
+
+    def __init__(self):
+        self._subscriptions: Set[Subscription] = set()
+
+    async def publish(self, updates: List[SlotOccupancy]) -> None:
+        self.deliver(updates)
+
+    def deliver(self, updates: List[SlotOccupancy]) -> None:
+        for subscription in list(self._subscriptions):
+            try:
+                for update in updates:
+                    subscription.put(update)
+            except Exception:
+                # One broken subscription mustn't cost the others this update, or end the Redis listener
+                logger.exception("Failed to deliver slot updates to a subscription")
+                subscription.resync()
+
+    def subscribe(self, **filters) -> Subscription:
+        subscription = Subscription(settings.SLOT_EVENTS_BUFFER_SIZE, **filters)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscriptions)
+
+
+class RedisBroker(LocalBroker):
+    """Relays updates through a Redis channel, so every worker's clients see every worker's writes."""
+
+    def __init__(self, redis: Any, channel: str = REDIS_CHANNEL, retry_seconds: float = 1):
+        super().__init__()
+        self.redis = redis
+        self.channel = channel
+        self.retry_seconds = retry_seconds
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(self, updates: List[SlotOccupancy]) -> None:
+        await self.redis.publish(self.channel, SLOT_UPDATES.dump_json(updates))
+
+    def subscribe(self, **filters) -> Subscription:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return super().subscribe(**filters)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.deliver(SLOT_UPDATES.validate_json(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Slot update listener lost its Redis subscription; retrying")
+            # Anything published while disconnected is gone, so every client has to reload
+            for subscription in list(self._subscriptions):
+                subscription.resync()
+            await asyncio.sleep(self.retry_seconds)
+
+
+def build_slot_broker() -> LocalBroker:
+    """The broker named by SLOT_EVENTS_BACKEND: "memory" or "redis" (needs the redis package)."""
+    if settings.SLOT_EVENTS_BACKEND == "redis":
+        from redis.asyncio import Redis
+        return RedisBroker(Redis.from_url(settings.SLOT_EVENTS_URL))
+    if settings.SLOT_EVENTS_BACKEND == "memory":
+        return LocalBroker()
+    raise ValueError(f"Unknown SLOT_EVENTS_BACKEND: {settings.SLOT_EVENTS_BACKEND}")
+
+
+slot_broker = build_slot_broker()
+
+slot_updates_published = metrics_registry.counter(
+    "slot_updates_published_total", "Slot occupancy updates published after commit"
+)
+slot_stream_resyncs = metrics_registry.counter(
+    "slot_stream_resyncs_total", "Slot streams told to reload because they fell behind or the broker dropped"
+)
+metrics_registry.callback_gauge(
+    "slot_stream_subscribers", "Open slot occupancy streams in this worker", lambda: slot_broker.subscribers
+)
+
+
+_PENDING_UPDATES = "slot_occupancy_updates"
+
+
+def queue_slot_updates(db: AsyncSession, updates: Iterable[SlotOccupancy]) -> None:
+    """Record updates to publish once the session's pending transaction commits."""
+    pending = db.info.setdefault(_PENDING_UPDATES, {})
+    for update in updates:
+        # A slot changed twice in one transaction is published once, with its final counts
+        pending.pop(update.slot_id, None)
+        pending[update.slot_id] = update
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_updates(session, previous_transaction):
+    # Counts from a rolled-back transaction were never visible to anyone
+    session.info.pop(_PENDING_UPDATES, None)
+
+
+async def publish_queued_slot_updates(db: AsyncSession) -> None:
+    """Publish the updates queued during the transaction that just committed."""
+    pending = db.info.pop(_PENDING_UPDATES, None)
+    if not pending:
+        return
+    try:
+        await slot_broker.publish(list(pending.values()))
+    except Exception:
+        # The write itself succeeded; streaming clients recover on their next reload
+        logger.exception("Failed to publish %d slot updates", len(pending))
+        return
+    slot_updates_published.inc(amount=len(pending))
+
+
+def _server_sent_event(name: str, data: str) -> str:
+    return f"event: {name}\ndata: {data}\n\n"
+
+
+async def slot_event_stream(broker: LocalBroker, **filters) -> AsyncIterator[str]:
+    """Server-Sent Events for one client: an `occupancy` event per changed slot, `resync` after falling behind.
+
+    Comment lines keep idle connections from being closed by proxies.
+    """
+    subscription = broker.subscribe(**filters)
+    try:
+        yield f"retry: {settings.SLOT_EVENTS_RETRY_MS}\n\n"
+        while True:
+            resync, updates = await subscription.next_batch(settings.SLOT_EVENTS_KEEPALIVE_SECONDS)
+            if resync:
+                yield _server_sent_event("resync", "{}")
+            for update in updates:
+                yield _server_sent_event("occupancy", update.model_dump_json())
+            if not resync and not updates:
+                yield ": keepalive\n\n"
+    finally:
+        broker.unsubscribe(subscription)
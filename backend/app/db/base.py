@@ -4,6 +4,10 @@ from app.models.department import Department
 from app.models.slot import Slot
 from app.models.game import Game
 from app.models.booking import Booking
+from app.models.usage_rollup import SlotUsageHourly, BookingUsageHourly, UsageRollupDirty, UsageRollupState
 
 # This ensures Alembic sees all models when running migrations
-__all__ = ["Base", "User", "Department", "Slot", "Game", "Booking"]
+__all__ = [
+    "Base", "User", "Department", "Slot", "Game", "Booking",
+    "SlotUsageHourly", "BookingUsageHourly", "UsageRollupDirty", "UsageRollupState"
+]
@@ -2,7 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.models.user import User, UserRole
 from app.models.department import Department
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 
 
 async def init_db(db: AsyncSession) -> None:
@@ -24,7 +24,7 @@ async def init_db(db: AsyncSession) -> None:
         user = User(
             email="admin@example.com",
             username="admin",
-            password=get_password_hash("admin123"),  # hashed!
+            password=await get_password_hash_async("admin123"),  # hashed!
             role=UserRole.ADMIN,
             department_id=department.id,
         )
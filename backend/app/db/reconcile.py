@@ -0,0 +1,67 @@
+"""Recompute slots.booked_count from bookings and report drift.
+
+Usage:
+    python -m app.db.reconcile          # report only
+    python -m app.db.reconcile --fix    # report and repair
+"""
+import argparse
+import asyncio
+from dataclasses import dataclass
+from typing import List
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.slot import Slot, active_booking_count
+
+
+@dataclass
+class SlotCountDrift:
+    slot_id: int
+    stored: int
+    actual: int
+
+
+async def reconcile_slot_booked_counts(db: AsyncSession, fix: bool = False) -> List[SlotCountDrift]:
+    """Find slots whose booked_count disagrees with their active bookings, optionally repairing them."""
+    actual = active_booking_count()
+    query = select(Slot.id, Slot.booked_count, actual.label("actual")).where(
+        Slot.booked_count != actual
+    ).order_by(Slot.id)
+
+    result = await db.execute(query)
+    drift = [SlotCountDrift(slot_id=row.id, stored=row.booked_count, actual=row.actual) for row in result.all()]
+
+    if fix and drift:
+        # Recompute in SQL rather than writing the values read above, so bookings
+        # committed in between are still counted
+        await db.execute(
+            update(Slot)
+            .where(Slot.id.in_([item.slot_id for item in drift]))
+            .values(booked_count=active_booking_count())
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    return drift
+
+
+async def main(fix: bool) -> int:
+    from app.db.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        drift = await reconcile_slot_booked_counts(db, fix=fix)
+
+    for item in drift:
+        print(f"slot {item.slot_id}: stored={item.stored} actual={item.actual}")
+    action = "repaired" if fix else "found"
+    print(f"{len(drift)} slot(s) with booked_count drift {action}.")
+    return 1 if drift and not fix else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fix", action="store_true", help="rewrite drifted counters")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.fix)))
@@ -1,12 +1,67 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+pool_wait = metrics_registry.histogram(
+    "db_pool_wait_seconds", "Time spent getting a connection from the pool, including new connections"
+)
+pool_timeouts = metrics_registry.counter(
+    "db_pool_timeouts_total", "Checkouts that gave up after DB_POOL_TIMEOUT"
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_timeouts.inc()
+            raise
+        finally:
+            pool_wait.observe(time.perf_counter() - started)
+
+
+def engine_options(database_url: str) -> dict:
+    """create_async_engine keyword arguments for a database URL, taken from settings."""
+    url = make_url(database_url)
+    options = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    # SQLite engines don't use a sized queue pool
+    if url.get_backend_name() != "sqlite":
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    if url.get_driver_name() == "asyncpg":
+        server_settings = {"application_name": settings.PROJECT_NAME}
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        options["connect_args"] = {
+            "server_settings": server_settings,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
 
 # Use async engine with asyncpg
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=True,
-    future=True
+    future=True,
+    **engine_options(settings.DATABASE_URL)
 )
 
 # Async session factory
@@ -18,6 +73,38 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False
 )
 
+
+def describe_engine_config() -> str:
+    """Summarize the pool configuration the engine actually runs with."""
+    pool = engine.pool
+    return (
+        f"Database pool: {type(pool).__name__} "
+        f"size={pool.size() if hasattr(pool, 'size') else 'n/a'} "
+        f"max_overflow={getattr(pool, '_max_overflow', 'n/a')} "
+        f"timeout={getattr(pool, '_timeout', 'n/a')}s "
+        f"recycle={pool._recycle}s pre_ping={pool._pre_ping} "
+        f"statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS or 'off'}ms "
+        f"prepared_statement_cache={settings.DB_PREPARED_STATEMENT_CACHE_SIZE} "
+        f"echo={engine.echo}"
+    )
+
+
+def _pool_stat(name: str):
+    # SQLite's static and null pools have no size or overflow to report
+    stat = getattr(engine.pool, name, None)
+    return stat() if callable(stat) else None
+
+
+metrics_registry.callback_gauge("db_pool_size", "Connections the pool keeps open", lambda: _pool_stat("size"))
+metrics_registry.callback_gauge(
+    "db_pool_checked_out", "Connections currently checked out of the pool", lambda: _pool_stat("checkedout")
+)
+metrics_registry.callback_gauge(
+    "db_pool_overflow", "Connections open beyond the pool size; negative while the pool is not yet full",
+    lambda: _pool_stat("overflow")
+)
+
+
 # Dependency for FastAPI routes
 async def get_db():
     async with AsyncSessionLocal() as session:
@@ -0,0 +1,169 @@
+"""Refresh the hourly slot and booking usage rollup that analytics read when ANALYTICS_ROLLUP is on.
+
+Usage:
+    python -m app.db.usage_rollup          # recompute hours changed since the last refresh
+    python -m app.db.usage_rollup --full   # rebuild the whole rollup
+"""
+import argparse
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import case, delete, func, insert, union
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.config import settings
+from app.models.booking import Booking, BookingStatus, ACTIVE_BOOKING_STATUSES
+from app.models.slot import Slot
+from app.models.user import User
+from app.models.usage_rollup import (
+    SlotUsageHourly, BookingUsageHourly, UsageRollupDirty, UsageRollupState, hour_start
+)
+
+SLOT_USAGE_COLUMNS = ("hour", "game_id", "slots", "capacity")
+BOOKING_USAGE_COLUMNS = ("hour", "game_id", "department_id", "bookings", "active_bookings", "cancelled_bookings")
+
+
+def hourly_slot_usage(*conditions):
+    """SELECT of slots and seats per (hour, game) straight from `slots`; the rollup stores the same rows."""
+    hour = hour_start(Slot.start_time)
+    return (
+        select(
+            hour.label("hour"),
+            Slot.game_id.label("game_id"),
+            func.count(Slot.id).label("slots"),
+            func.sum(Slot.capacity).label("capacity")
+        )
+        .where(*conditions)
+        .group_by(hour, Slot.game_id)
+    )
+
+
+def hourly_booking_usage(*conditions):
+    """SELECT of bookings per (hour, game, department) straight from `bookings`; the rollup stores the same rows."""
+    hour = hour_start(Slot.start_time)
+    return (
+        select(
+            hour.label("hour"),
+            Slot.game_id.label("game_id"),
+            User.department_id.label("department_id"),
+            func.count(Booking.id).label("bookings"),
+            func.sum(case((Booking.status.in_(ACTIVE_BOOKING_STATUSES), 1), else_=0)).label("active_bookings"),
+            func.sum(case((Booking.status == BookingStatus.CANCELLED, 1), else_=0)).label("cancelled_bookings")
+        )
+        .join(Slot, Booking.slot_id == Slot.id)
+        .join(User, Booking.user_id == User.id)
+        .where(*conditions)
+        .group_by(hour, Slot.game_id, User.department_id)
+    )
+
+
+async def mark_usage_stale(db: AsyncSession, *slot_conditions) -> None:
+    """Queue the hours of the matching slots for the next refresh, inside the caller's transaction.
+
+    Inserts and updates are found through updated_at; this is for changes that leave no row
+    behind to find: deleted bookings and slots, slots moved to another hour, users changing
+    department. Call it before a slot is deleted or moved. A no-op while the rollup is off.
+    """
+    if not settings.ANALYTICS_ROLLUP:
+        return
+    await db.execute(
+        insert(UsageRollupDirty).from_select(
+            ["hour"], select(hour_start(Slot.start_time)).where(*slot_conditions).distinct()
+        )
+    )
+
+
+@dataclass
+class UsageRollupRefresh:
+    full: bool
+    hours: int
+
+
+async def _replace_hours(db: AsyncSession, dirty) -> None:
+    """Recompute the rollup rows of the hours selected by `dirty`, or of every hour when it is None."""
+    slot_conditions = []
+    if dirty is not None:
+        bounds = (await db.execute(select(func.min(dirty.c.hour), func.max(dirty.c.hour)))).one()
+        if bounds[0] is None:
+            return
+        # The range keeps the slot scan on ix_slots_start_time; the IN picks the exact hours
+        slot_conditions = [
+            Slot.start_time >= bounds[0],
+            Slot.start_time < bounds[1] + timedelta(hours=1),
+            hour_start(Slot.start_time).in_(select(dirty.c.hour))
+        ]
+
+    for model in (SlotUsageHourly, BookingUsageHourly):
+        query = delete(model)
+        if dirty is not None:
+            query = query.where(model.hour.in_(select(dirty.c.hour)))
+        await db.execute(query)
+    await db.execute(insert(SlotUsageHourly).from_select(SLOT_USAGE_COLUMNS, hourly_slot_usage(*slot_conditions)))
+    await db.execute(
+        insert(BookingUsageHourly).from_select(BOOKING_USAGE_COLUMNS, hourly_booking_usage(*slot_conditions))
+    )
+
+
+async def refresh_usage_rollup(db: AsyncSession, full: bool = False) -> UsageRollupRefresh:
+    """Bring the rollup up to date in one transaction, recomputing whole hours.
+
+    Hours are stale when a slot or booking in them was updated after the stored watermark, or
+    when mark_usage_stale queued them. The watermark trails the refresh by
+    ANALYTICS_ROLLUP_OVERLAP_SECONDS, so a transaction that started earlier but commits after
+    this refresh is still picked up by the next one.
+    """
+    started = await db.scalar(select(func.now()))
+    # Locking the state row keeps concurrent refreshes from interleaving
+    state = await db.get(UsageRollupState, 1, with_for_update=True)
+    if state is None:
+        state = UsageRollupState(id=1)
+        db.add(state)
+    full = full or state.refreshed_until is None
+
+    if not full:
+        watermark = state.refreshed_until
+        changed = union(
+            select(hour_start(Slot.start_time).label("hour")).where(Slot.updated_at > watermark),
+            select(hour_start(Slot.start_time).label("hour"))
+            .join(Booking, Booking.slot_id == Slot.id)
+            .where(Booking.updated_at > watermark)
+        ).subquery()
+        # Stage them with the queued hours so every statement below reads the same set
+        await db.execute(insert(UsageRollupDirty).from_select(["hour"], select(changed.c.hour)))
+    # Hours queued after this point wait for the next refresh
+    last_mark = await db.scalar(select(func.max(UsageRollupDirty.id)))
+
+    dirty = None
+    if not full:
+        dirty = select(UsageRollupDirty.hour).where(UsageRollupDirty.id <= (last_mark or 0)).distinct().subquery()
+    await _replace_hours(db, dirty)
+    if full:
+        hours = await db.scalar(select(func.count()).select_from(select(SlotUsageHourly.hour).distinct().subquery()))
+    else:
+        hours = await db.scalar(select(func.count()).select_from(dirty))
+
+    if last_mark is not None:
+        await db.execute(delete(UsageRollupDirty).where(UsageRollupDirty.id <= last_mark))
+    state.refreshed_until = started - timedelta(seconds=settings.ANALYTICS_ROLLUP_OVERLAP_SECONDS)
+    await db.commit()
+    return UsageRollupRefresh(full=full, hours=hours)
+
+
+async def main(full: bool) -> int:
+    from app.db.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        refresh = await refresh_usage_rollup(db, full=full)
+
+    kind = "Rebuilt" if refresh.full else "Refreshed"
+    print(f"{kind} {refresh.hours} hour(s) of usage rollup.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--full", action="store_true", help="rebuild every hour instead of the changed ones")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.full)))
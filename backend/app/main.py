@@ -5,7 +5,10 @@ from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.events import init_app_events
+from app.core.security import password_hash_metrics
+from app.core.request_metrics import QueryMetricsMiddleware
 from app.api.v1.api import api_router
+from app.api import metrics
 from app.db.session import get_db
 
 app = FastAPI(
@@ -17,6 +20,7 @@ app = FastAPI(
         {"name": "Games", "description": "Game management operations"},
         {"name": "Slots", "description": "Slot management operations"},
         {"name": "Bookings", "description": "Booking management operations"},
+        {"name": "Admin", "description": "Operational metrics"},
     ]
 )
 
@@ -36,9 +40,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Statement counts and DB time per request, as Server-Timing and per-route aggregates
+app.add_middleware(QueryMetricsMiddleware)
+
 init_app_events(app)
 
 app.include_router(api_router, prefix="/api/v1")
+# Prometheus scrape target, outside the versioned API
+app.include_router(metrics.router)
 
 @app.get("/")
 async def root(db: AsyncSession = Depends(get_db)):
@@ -52,4 +61,5 @@ async def root(db: AsyncSession = Depends(get_db)):
     return {
         "message": "Slot Booking App API is running",
         "database": db_status,
+        "password_hashing": password_hash_metrics.snapshot(),
     }
\ No newline at end of file
@@ -4,5 +4,9 @@ from .department import Department
 from .slot import Slot
 from .booking import Booking
 from .game import Game
+from .usage_rollup import SlotUsageHourly, BookingUsageHourly, UsageRollupDirty, UsageRollupState
 
-__all__ = ["Base", "User", "Department", "Slot", "Booking", "Game"]
+__all__ = [
+    "Base", "User", "Department", "Slot", "Booking", "Game",
+    "SlotUsageHourly", "BookingUsageHourly", "UsageRollupDirty", "UsageRollupState"
+]
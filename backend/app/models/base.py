@@ -1,5 +1,13 @@
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import Column, DateTime, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import functions
+
+
+@compiles(functions.now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    # CURRENT_TIMESTAMP only has whole seconds, too coarse for telling updates apart by updated_at
+    return "strftime('%Y-%m-%d %H:%M:%f', 'now')"
 
 
 class Base(DeclarativeBase):
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Enum
+from sqlalchemy import Column, Integer, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 
@@ -11,6 +11,17 @@ class BookingStatus(enum.Enum):
     CANCELLED = "CANCELLED"
 
 
+# Statuses that hold a seat in a slot
+ACTIVE_BOOKING_STATUSES = (BookingStatus.CONFIRMED, BookingStatus.PENDING)
+
+
+def holds_seat(status) -> bool:
+    """Check if a booking in the given status (model or schema enum) occupies a seat."""
+    if status is None:
+        return False
+    return BookingStatus(getattr(status, "value", status)) in ACTIVE_BOOKING_STATUSES
+
+
 class Booking(Base):
     __tablename__ = "bookings"
 
@@ -24,3 +35,20 @@ class Booking(Base):
     # Relationships
     user = relationship("User", back_populates="bookings")
     slot = relationship("Slot", back_populates="bookings")
+
+    __table_args__ = (
+        Index("ix_bookings_user_id_status", "user_id", "status"),
+        Index("ix_bookings_slot_id_status", "slot_id", "status"),
+        Index("ix_bookings_status_id", "status", "id"),
+        # Finding bookings changed since the last usage rollup refresh
+        Index("ix_bookings_updated_at", "updated_at"),
+        # At most one active booking per user and slot
+        Index(
+            "uq_bookings_user_slot_active",
+            "user_id",
+            "slot_id",
+            unique=True,
+            postgresql_where=status.in_(ACTIVE_BOOKING_STATUSES),
+            sqlite_where=status.in_(ACTIVE_BOOKING_STATUSES),
+        ),
+    )
@@ -11,11 +11,3 @@ class Department(Base):
 
     users = relationship("User", back_populates="department")
 
-    @property
-    def slot_booked(self) -> int:
-        """Calculate total slots booked by all users in this department."""
-        try:
-            return sum(len(user.bookings) for user in self.users)
-        except Exception:
-            # If relationships are not loaded or there's an async context issue, return 0
-            return 0
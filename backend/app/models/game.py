@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, select, func
+from sqlalchemy.orm import relationship, column_property
 from app.models.base import Base
+from app.models.slot import Slot
 
 class Game(Base):
     __tablename__ = "games"
@@ -12,12 +13,16 @@ class Game(Base):
 
     slots = relationship("Slot", back_populates="game")
 
-    @property
-    def total_slots(self) -> int:
-        """Calculate total number of slots for this game."""
-        return len(self.slots)
-
-    @property
-    def available_slots(self) -> int:
-        """Calculate available slots (not full) for this game."""
-        return sum(1 for slot in self.slots if not slot.is_full)
+    # Counted in the same SELECT as the game, so reading a game never loads its slots
+    total_slots = column_property(
+        select(func.count(Slot.id))
+        .where(Slot.game_id == id)
+        .correlate_except(Slot)
+        .scalar_subquery()
+    )
+    available_slots = column_property(
+        select(func.count(Slot.id))
+        .where(Slot.game_id == id, ~Slot.is_full)
+        .correlate_except(Slot)
+        .scalar_subquery()
+    )
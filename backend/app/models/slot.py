@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, select, func
+from sqlalchemy.orm import relationship, synonym
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.models.base import Base
+from app.models.booking import Booking, ACTIVE_BOOKING_STATUSES
 
 class Slot(Base):
     __tablename__ = "slots"
@@ -10,15 +12,37 @@ class Slot(Base):
     end_time = Column(DateTime, nullable=False)
     capacity = Column(Integer, default=2)
 
+    # Active bookings, kept in step with `bookings` by BookingService in the same transaction
+    booked_count = Column(Integer, default=0, server_default="0", nullable=False)
+    slots_booked_count = synonym("booked_count")
+
     game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
     game = relationship("Game", back_populates="slots")
 
     bookings = relationship("Booking", back_populates="slot", cascade="all, delete-orphan")
 
-    @property
-    def slots_booked_count(self) -> int:
-        return len(self.bookings)
+    __table_args__ = (
+        # Per-game listings and the overlap check in SlotService.create_slot/update_slot
+        Index("ix_slots_game_id_start_time_end_time", "game_id", "start_time", "end_time"),
+        # Date-range listings and the current-day reset
+        Index("ix_slots_start_time", "start_time"),
+        # Finding slots changed since the last usage rollup refresh
+        Index("ix_slots_updated_at", "updated_at"),
+    )
 
-    @property
+    @hybrid_property
     def is_full(self) -> bool:
-        return self.slots_booked_count >= self.capacity
+        return self.booked_count >= self.capacity
+
+
+def active_booking_count():
+    """Correlated COUNT of active bookings per slot, the source of truth for `Slot.booked_count`."""
+    return (
+        select(func.count(Booking.id))
+        .where(
+            Booking.slot_id == Slot.id,
+            Booking.status.in_(ACTIVE_BOOKING_STATUSES)
+        )
+        .correlate(Slot)
+        .scalar_subquery()
+    )
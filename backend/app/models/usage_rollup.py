@@ -0,0 +1,86 @@
+from sqlalchemy import Column, Integer, DateTime, Index
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+from app.models.base import Base
+
+
+class hour_start(FunctionElement):
+    """A timestamp truncated to the start of its hour."""
+    type = DateTime()
+    name = "hour_start"
+    inherit_cache = True
+
+
+@compiles(hour_start)
+def _hour_start(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return f"date_trunc('hour', {value})"
+
+
+@compiles(hour_start, "sqlite")
+def _sqlite_hour_start(element, compiler, **kw):
+    # Same text layout SQLAlchemy stores DateTime values in, so results compare and parse as datetimes
+    value = compiler.process(element.clauses, **kw)
+    return f"strftime('%Y-%m-%d %H:00:00.000000', {value})"
+
+
+class hour_of_week(FunctionElement):
+    """Hour-of-week bucket of a timestamp, 0-167, counting from Sunday 00:00."""
+    type = Integer()
+    name = "hour_of_week"
+    inherit_cache = True
+
+
+@compiles(hour_of_week)
+def _hour_of_week(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return f"CAST(EXTRACT(DOW FROM {value}) * 24 + EXTRACT(HOUR FROM {value}) AS INTEGER)"
+
+
+@compiles(hour_of_week, "sqlite")
+def _sqlite_hour_of_week(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return f"(CAST(strftime('%w', {value}) AS INTEGER) * 24 + CAST(strftime('%H', {value}) AS INTEGER))"
+
+
+class SlotUsageHourly(Base):
+    """Slots and seats offered per game, per hour of slot start time (naive UTC)."""
+    __tablename__ = "slot_usage_hourly"
+
+    hour = Column(DateTime, primary_key=True)
+    game_id = Column(Integer, primary_key=True)
+    slots = Column(Integer, nullable=False)
+    capacity = Column(Integer, nullable=False)
+
+
+class BookingUsageHourly(Base):
+    """Bookings per game and booker's department, per hour of slot start time (naive UTC)."""
+    __tablename__ = "booking_usage_hourly"
+
+    hour = Column(DateTime, primary_key=True)
+    game_id = Column(Integer, primary_key=True)
+    department_id = Column(Integer, primary_key=True)
+    bookings = Column(Integer, nullable=False)
+    active_bookings = Column(Integer, nullable=False)
+    cancelled_bookings = Column(Integer, nullable=False)
+
+
+class UsageRollupDirty(Base):
+    """Hours to recompute on the next refresh that the updated_at watermark can't see (deletes, moved slots)."""
+    __tablename__ = "usage_rollup_dirty"
+
+    id = Column(Integer, primary_key=True)
+    hour = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_usage_rollup_dirty_hour", "hour"),
+    )
+
+
+class UsageRollupState(Base):
+    """Single row holding the refresh watermark: rows updated after it are not in the rollup yet."""
+    __tablename__ = "usage_rollup_state"
+
+    id = Column(Integer, primary_key=True)
+    refreshed_until = Column(DateTime(timezone=True), nullable=True)
@@ -19,7 +19,7 @@ class User(Base):
     description = Column(Text, nullable=True)
     role = Column(Enum(UserRole), default=UserRole.NORMAL, nullable=False)
 
-    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False)
+    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False, index=True)
     department = relationship("Department", back_populates="users")
 
     bookings = relationship("Booking", back_populates="user", cascade="all, delete-orphan")
@@ -0,0 +1,41 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+# ------------------ Usage ------------------ #
+class UsageStats(BaseModel):
+    """Booking counts and rates over a date range.
+
+    utilization is active bookings over seats offered, cancellation_rate cancelled over all
+    bookings; either is None when there is nothing to divide by.
+    """
+    bookings: int
+    active_bookings: int
+    cancelled_bookings: int
+    utilization: Optional[float] = None
+    cancellation_rate: Optional[float] = None
+
+
+class GameUsage(UsageStats):
+    """A game's slots, seats and bookings; the peak is the hour-of-week bucket with the most active bookings."""
+    game_id: int
+    game_title: str
+    slots: int
+    capacity: int
+    peak_hour_of_week: Optional[int] = None
+
+
+class DepartmentUsage(UsageStats):
+    """Bookings made by a department's users; utilization is their share of all seats offered."""
+    department_id: int
+    department_title: str
+    peak_hour_of_week: Optional[int] = None
+
+
+class HourOfWeekUsage(UsageStats):
+    """Slots starting in one hour of the week (UTC); hour_of_week = day_of_week * 24 + hour, Sunday is day 0."""
+    hour_of_week: int
+    day_of_week: int
+    hour: int
+    slots: int
+    capacity: int
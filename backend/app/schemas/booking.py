@@ -1,6 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+from datetime import datetime, timezone
 from enum import Enum
 
 
@@ -40,6 +40,126 @@ class BookingOut(BaseModel):
         from_attributes = True
 
 
+# ------------------ Timeline ------------------ #
+class BookingTimelinePeriod(str, Enum):
+    upcoming = "upcoming"
+    past = "past"
+    all = "all"
+
+
+class BookingTimelineItem(BaseModel):
+    """A booking with its slot's window and game title, as one entry of a user's timeline."""
+    id: int
+    status: BookingStatus
+    slot_id: int
+    start_time: datetime
+    end_time: datetime
+    game_id: int
+    game_title: str
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# ------------------ Export ------------------ #
+class BookingExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+class BookingExportRow(BaseModel):
+    """A booking flattened with its user, department, slot and game, as one row of an export."""
+    id: int
+    status: BookingStatus
+    created_at: datetime
+    updated_at: datetime
+    user_id: int
+    username: Optional[str] = None
+    email: Optional[str] = None
+    department_id: int
+    department_title: str
+    slot_id: int
+    start_time: datetime
+    end_time: datetime
+    game_id: int
+    game_title: str
+
+
 # ------------------ Delete Response ------------------ #
 class BookingDeleteResponse(BaseModel):
     message: str
+
+
+# ------------------ Purge ------------------ #
+class BookingPurge(BaseModel):
+    """Bookings to delete: those on slots starting in [start_time, end_time), for a game and/or in a status."""
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    game_id: Optional[int] = None
+    status: Optional[BookingStatus] = None
+    batch_size: int = Field(1000, ge=1, le=10000)
+
+    @model_validator(mode="after")
+    def check_filters(self):
+        if all(value is None for value in (self.start_time, self.end_time, self.game_id, self.status)):
+            raise ValueError("At least one of start_time, end_time, game_id or status is required")
+        # Slot times are stored as naive UTC, so normalize offset-aware bounds to match
+        for name in ("start_time", "end_time"):
+            value = getattr(self, name)
+            if value is not None and value.tzinfo is not None:
+                setattr(self, name, value.astimezone(timezone.utc).replace(tzinfo=None))
+        if self.start_time and self.end_time and self.start_time >= self.end_time:
+            raise ValueError("start_time must be before end_time")
+        return self
+
+
+# ------------------ Batch ------------------ #
+MAX_BATCH_ITEMS = 500
+
+
+class BookingBatchOperation(str, Enum):
+    create = "create"
+    cancel = "cancel"
+    confirm = "confirm"
+
+
+class BookingBatchItem(BaseModel):
+    """One operation: cancel/confirm take booking_id, create takes user_id, slot_id and status."""
+    operation: BookingBatchOperation
+    booking_id: Optional[int] = None
+    user_id: Optional[int] = None
+    slot_id: Optional[int] = None
+    status: BookingStatus = BookingStatus.confirmed
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if self.operation == BookingBatchOperation.create:
+            if self.user_id is None or self.slot_id is None:
+                raise ValueError("create requires user_id and slot_id")
+        elif self.booking_id is None:
+            raise ValueError(f"{self.operation.value} requires booking_id")
+        return self
+
+
+class BookingBatchRequest(BaseModel):
+    items: List[BookingBatchItem] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+    # Apply nothing if any item fails, instead of applying the items that succeed
+    all_or_nothing: bool = False
+
+
+class BookingBatchItemResult(BaseModel):
+    index: int
+    operation: BookingBatchOperation
+    success: bool
+    booking_id: Optional[int] = None
+    status: Optional[BookingStatus] = None
+    error: Optional[str] = None
+
+
+class BookingBatchResponse(BaseModel):
+    results: List[BookingBatchItemResult]
+    succeeded: int
+    failed: int
+    committed: bool
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+from datetime import date, datetime, time
+from enum import Enum
 
 
 # ------------------ Base ------------------ #
@@ -16,6 +17,46 @@ class SlotCreate(SlotBase):
     pass
 
 
+# ------------------ Bulk Create ------------------ #
+class Weekday(str, Enum):
+    MO = "MO"
+    TU = "TU"
+    WE = "WE"
+    TH = "TH"
+    FR = "FR"
+    SA = "SA"
+    SU = "SU"
+
+
+class SlotBulkCreate(BaseModel):
+    """A recurring schedule: back-to-back slots between day_start and day_end on the chosen weekdays."""
+    game_id: int
+    start_date: date
+    end_date: date  # inclusive
+    day_start: time
+    day_end: time
+    slot_minutes: int = Field(..., gt=0, le=24 * 60)
+    capacity: Optional[int] = 2
+    weekdays: List[Weekday] = Field(default_factory=lambda: list(Weekday), min_length=1)
+    # Skip generated slots that overlap existing ones instead of rejecting the whole schedule
+    skip_overlapping: bool = True
+
+    @model_validator(mode="after")
+    def check_window(self):
+        if self.start_date > self.end_date:
+            raise ValueError("start_date must not be after end_date")
+        if self.day_start >= self.day_end:
+            raise ValueError("day_start must be before day_end")
+        return self
+
+
+class SlotBulkCreateResponse(BaseModel):
+    created: int
+    skipped_overlapping: int
+    first_start_time: Optional[datetime] = None
+    last_end_time: Optional[datetime] = None
+
+
 # ------------------ Update ------------------ #
 class SlotUpdate(BaseModel):
     start_time: Optional[datetime] = None
@@ -40,6 +81,19 @@ class SlotOut(BaseModel):
         from_attributes = True
 
 
+# ------------------ Occupancy Stream ------------------ #
+class SlotOccupancy(BaseModel):
+    """A slot's seat counts after a committed change, as pushed on /slots/stream."""
+    slot_id: int
+    game_id: int
+    start_time: datetime
+    end_time: datetime
+    booked_count: int
+    capacity: int
+    is_full: bool
+    removed: bool = False
+
+
 # ------------------ Delete Response ------------------ #
 class SlotDeleteResponse(BaseModel):
     message: str
@@ -0,0 +1,227 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import Float, and_, cast, func
+from typing import List, Optional
+from fastapi import HTTPException, status
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.db.usage_rollup import (
+    BOOKING_USAGE_COLUMNS, SLOT_USAGE_COLUMNS, hourly_booking_usage, hourly_slot_usage
+)
+from app.models.department import Department
+from app.models.game import Game
+from app.models.slot import Slot
+from app.models.usage_rollup import BookingUsageHourly, SlotUsageHourly, hour_of_week
+from app.schemas.analytics import DepartmentUsage, GameUsage, HourOfWeekUsage
+from app.services.booking_service import naive_utc
+
+
+def _ratio(numerator, denominator):
+    """numerator / denominator as a float, NULL when the denominator is zero."""
+    return cast(numerator, Float) / func.nullif(denominator, 0)
+
+
+def _booking_totals(bookings, key):
+    """Booking counts of the hourly booking usage summed per `key`."""
+    return (
+        select(
+            key.label("key"),
+            func.sum(bookings.c.bookings).label("bookings"),
+            func.sum(bookings.c.active_bookings).label("active_bookings"),
+            func.sum(bookings.c.cancelled_bookings).label("cancelled_bookings")
+        )
+        .group_by(key)
+        .subquery()
+    )
+
+
+def _peak_hours(bookings, key):
+    """Hour-of-week buckets per `key` ranked by active bookings; rank 1 is the peak, ties go to the earlier hour."""
+    bucket = hour_of_week(bookings.c.hour)
+    active = func.sum(bookings.c.active_bookings)
+    return (
+        select(
+            key.label("key"),
+            bucket.label("hour_of_week"),
+            func.row_number().over(partition_by=key, order_by=(active.desc(), bucket)).label("rank")
+        )
+        .where(bookings.c.active_bookings > 0)
+        .group_by(key, bucket)
+        .subquery()
+    )
+
+
+class AnalyticsService:
+    """Usage reports over slots starting in a date range, each computed in one grouped SELECT.
+
+    They aggregate hourly usage rows: the rollup tables when ANALYTICS_ROLLUP is on, otherwise the
+    same rows computed live from slots and bookings. Range bounds are widened to whole hours so
+    both sources cover the same slots.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _hour_range(self, start_date: datetime, end_date: datetime) -> tuple:
+        start, end = naive_utc(start_date), naive_utc(end_date)
+        if start >= end:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must be before end_date"
+            )
+        start = start.replace(minute=0, second=0, microsecond=0)
+        end_hour = end.replace(minute=0, second=0, microsecond=0)
+        return start, end_hour if end_hour == end else end_hour + timedelta(hours=1)
+
+    def _slot_usage(self, start: datetime, end: datetime, game_ids: Optional[List[int]]):
+        if settings.ANALYTICS_ROLLUP:
+            conditions = [SlotUsageHourly.hour >= start, SlotUsageHourly.hour < end]
+            if game_ids:
+                conditions.append(SlotUsageHourly.game_id.in_(game_ids))
+            query = select(*(getattr(SlotUsageHourly, name) for name in SLOT_USAGE_COLUMNS)).where(*conditions)
+        else:
+            query = hourly_slot_usage(*self._slot_conditions(start, end, game_ids))
+        return query.cte("slot_usage")
+
+    def _booking_usage(self, start: datetime, end: datetime, game_ids: Optional[List[int]]):
+        if settings.ANALYTICS_ROLLUP:
+            conditions = [BookingUsageHourly.hour >= start, BookingUsageHourly.hour < end]
+            if game_ids:
+                conditions.append(BookingUsageHourly.game_id.in_(game_ids))
+            query = select(*(getattr(BookingUsageHourly, name) for name in BOOKING_USAGE_COLUMNS)).where(*conditions)
+        else:
+            query = hourly_booking_usage(*self._slot_conditions(start, end, game_ids))
+        return query.cte("booking_usage")
+
+    def _slot_conditions(self, start: datetime, end: datetime, game_ids: Optional[List[int]]) -> list:
+        conditions = [Slot.start_time >= start, Slot.start_time < end]
+        if game_ids:
+            conditions.append(Slot.game_id.in_(game_ids))
+        return conditions
+
+    def _counts(self, totals) -> tuple:
+        """Booking count columns of a _booking_totals subquery, 0 where nothing was booked."""
+        return tuple(
+            func.coalesce(totals.c[name], 0).label(name)
+            for name in ("bookings", "active_bookings", "cancelled_bookings")
+        )
+
+    async def usage_by_game(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        game_ids: Optional[List[int]] = None
+    ) -> List[GameUsage]:
+        """Slots, seats, bookings, utilization, cancellation rate and peak hour per game with slots in the range."""
+        start, end = self._hour_range(start_date, end_date)
+        slots = self._slot_usage(start, end, game_ids)
+        bookings = self._booking_usage(start, end, game_ids)
+        slot_totals = (
+            select(
+                slots.c.game_id,
+                func.sum(slots.c.slots).label("slots"),
+                func.sum(slots.c.capacity).label("capacity")
+            )
+            .group_by(slots.c.game_id)
+            .subquery()
+        )
+        booking_totals = _booking_totals(bookings, bookings.c.game_id)
+        peaks = _peak_hours(bookings, bookings.c.game_id)
+        total, active, cancelled = self._counts(booking_totals)
+
+        query = (
+            select(
+                Game.id.label("game_id"),
+                Game.title.label("game_title"),
+                slot_totals.c.slots,
+                slot_totals.c.capacity,
+                total,
+                active,
+                cancelled,
+                _ratio(active, slot_totals.c.capacity).label("utilization"),
+                _ratio(cancelled, total).label("cancellation_rate"),
+                peaks.c.hour_of_week.label("peak_hour_of_week")
+            )
+            .join(slot_totals, slot_totals.c.game_id == Game.id)
+            .outerjoin(booking_totals, booking_totals.c.key == Game.id)
+            .outerjoin(peaks, and_(peaks.c.key == Game.id, peaks.c.rank == 1))
+            .order_by(Game.id)
+        )
+        result = await self.db.execute(query)
+        return [GameUsage.model_validate(row._mapping) for row in result.all()]
+
+    async def usage_by_department(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        game_ids: Optional[List[int]] = None
+    ) -> List[DepartmentUsage]:
+        """Bookings, share of seats, cancellation rate and peak hour per department, for slots in the range."""
+        start, end = self._hour_range(start_date, end_date)
+        slots = self._slot_usage(start, end, game_ids)
+        bookings = self._booking_usage(start, end, game_ids)
+        capacity = select(func.sum(slots.c.capacity)).scalar_subquery()
+        booking_totals = _booking_totals(bookings, bookings.c.department_id)
+        peaks = _peak_hours(bookings, bookings.c.department_id)
+        total, active, cancelled = self._counts(booking_totals)
+
+        query = (
+            select(
+                Department.id.label("department_id"),
+                Department.title.label("department_title"),
+                total,
+                active,
+                cancelled,
+                _ratio(active, capacity).label("utilization"),
+                _ratio(cancelled, total).label("cancellation_rate"),
+                peaks.c.hour_of_week.label("peak_hour_of_week")
+            )
+            .outerjoin(booking_totals, booking_totals.c.key == Department.id)
+            .outerjoin(peaks, and_(peaks.c.key == Department.id, peaks.c.rank == 1))
+            .order_by(Department.id)
+        )
+        result = await self.db.execute(query)
+        return [DepartmentUsage.model_validate(row._mapping) for row in result.all()]
+
+    async def usage_by_hour_of_week(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        game_ids: Optional[List[int]] = None
+    ) -> List[HourOfWeekUsage]:
+        """Slots, seats, bookings, utilization and cancellation rate per hour-of-week bucket that has slots in the range."""
+        start, end = self._hour_range(start_date, end_date)
+        slots = self._slot_usage(start, end, game_ids)
+        bookings = self._booking_usage(start, end, game_ids)
+        slot_bucket = hour_of_week(slots.c.hour)
+        slot_totals = (
+            select(
+                slot_bucket.label("hour_of_week"),
+                func.sum(slots.c.slots).label("slots"),
+                func.sum(slots.c.capacity).label("capacity")
+            )
+            .group_by(slot_bucket)
+            .subquery()
+        )
+        booking_totals = _booking_totals(bookings, hour_of_week(bookings.c.hour))
+        total, active, cancelled = self._counts(booking_totals)
+
+        query = (
+            select(
+                slot_totals.c.hour_of_week,
+                (slot_totals.c.hour_of_week // 24).label("day_of_week"),
+                (slot_totals.c.hour_of_week % 24).label("hour"),
+                slot_totals.c.slots,
+                slot_totals.c.capacity,
+                total,
+                active,
+                cancelled,
+                _ratio(active, slot_totals.c.capacity).label("utilization"),
+                _ratio(cancelled, total).label("cancellation_rate")
+            )
+            .outerjoin(booking_totals, booking_totals.c.key == slot_totals.c.hour_of_week)
+            .order_by(slot_totals.c.hour_of_week)
+        )
+        result = await self.db.execute(query)
+        return [HourOfWeekUsage.model_validate(row._mapping) for row in result.all()]
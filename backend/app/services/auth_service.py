@@ -1,6 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 from typing import Optional
 from datetime import timedelta
 from fastapi import HTTPException, status
@@ -8,10 +7,19 @@ from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.auth import LoginRequest, TokenResponse, LogoutResponse, TokenData
 from app.schemas.user import UserOut
-from app.core.security import verify_password, create_access_token, decode_access_token
+from app.services.projections import USER_OUT
+from app.core.security import verify_password_async, create_access_token, decode_access_token
 from app.core.config import settings
 
 
+def credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 class AuthService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -31,7 +39,7 @@ class AuthService:
             return None
         
         # Verify password
-        if not verify_password(login_data.password, user.password):
+        if not await verify_password_async(login_data.password, user.password):
             return None
         
         return user
@@ -74,36 +82,43 @@ class AuthService:
         # a token blacklist in Redis or database.
         return LogoutResponse(message="Successfully logged out")
 
-    async def get_current_user(self, token: str) -> UserOut:
-        """Get current user from JWT token."""
-        credentials_exception = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-        
+    def get_token_user_id(self, token: str) -> int:
+        """Get the user ID from a JWT token."""
         # Decode token
         payload = decode_access_token(token)
         if payload is None:
-            raise credentials_exception
+            raise credentials_exception()
         
         user_id: str = payload.get("sub")
         if user_id is None:
-            raise credentials_exception
+            raise credentials_exception()
+        
+        return int(user_id)
+
+    async def get_current_user(self, token: str) -> UserOut:
+        """Get current user from JWT token."""
+        user_id = self.get_token_user_id(token)
         
         # Get user from database
-        query = select(User).options(
-            selectinload(User.department),
-            selectinload(User.bookings)
-        ).where(User.id == int(user_id))
+        result = await self.db.execute(USER_OUT.select().where(User.id == user_id))
+        row = result.first()
+        
+        if row is None:
+            raise credentials_exception()
+        
+        return USER_OUT.load([row])[0]
+
+    async def get_user_access(self, user_id: int):
+        """Get only the columns permission checks need (id, role, department_id)."""
+        query = select(User.id, User.role, User.department_id).where(User.id == user_id)
         
         result = await self.db.execute(query)
-        user = result.scalars().first()
+        row = result.first()
         
-        if user is None:
-            raise credentials_exception
+        if row is None:
+            raise credentials_exception()
         
-        return UserOut.from_orm(user)
+        return row
 
     async def get_current_active_user(self, token: str) -> UserOut:
         """Get current active user from JWT token."""
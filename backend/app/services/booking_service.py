@@ -1,171 +1,411 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from sqlalchemy import func
-from typing import List, Optional
+from sqlalchemy import update, insert, delete, case, literal, func, tuple_, exists
+from sqlalchemy.exc import IntegrityError
+from typing import AsyncIterator, Dict, List, Optional
 from fastapi import HTTPException, status
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from pydantic import TypeAdapter
 
-from app.models.booking import Booking, BookingStatus
+from app.models.booking import Booking, BookingStatus, ACTIVE_BOOKING_STATUSES, holds_seat
 from app.models.slot import Slot
+from app.models.game import Game
 from app.models.user import User
-from app.schemas.booking import BookingCreate, BookingUpdate, BookingOut, BookingDeleteResponse
+from app.models.department import Department
+from app.schemas.booking import (
+    BookingCreate, BookingUpdate, BookingOut, BookingDeleteResponse, BookingPurge,
+    BookingBatchRequest, BookingBatchResponse, BookingBatchItemResult, BookingBatchOperation,
+    BookingTimelineItem, BookingTimelinePeriod, BookingExportRow
+)
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.pagination import paginate
+from app.core.etag import version_columns
+from app.db.usage_rollup import mark_usage_stale
+from app.core.slot_events import OCCUPANCY_COLUMNS, queue_slot_updates, slot_occupancy
+from app.services.projections import BOOKING_OUT
+from app.core.cache import commit_and_invalidate, mark_stale, game_tag, game_slots_tag, GAMES_TAG, SLOT_RANGES_TAG
+
+booking_outcomes = metrics_registry.counter(
+    "booking_create_total", "Booking creation attempts by outcome", ("outcome",)
+)
+
+TIMELINE_LIST = TypeAdapter(List[BookingTimelineItem])
+EXPORT_ROWS = TypeAdapter(List[BookingExportRow])
+
+BATCH_ERROR_OUTCOMES = {
+    "Slot is already full": "rejected_full",
+    "User already has a booking for this slot": "duplicate",
+}
+
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Slot times are stored as naive UTC, so offset-aware bounds are converted to match."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def day_bounds(day: date, zone: ZoneInfo) -> tuple:
+    """Naive UTC [start, end) of a calendar day in a zone; taking each midnight separately keeps DST days right."""
+    def midnight_utc(value: date) -> datetime:
+        return datetime.combine(value, time.min, tzinfo=zone).astimezone(timezone.utc).replace(tzinfo=None)
+    return midnight_utc(day), midnight_utc(day + timedelta(days=1))
 
 
 class BookingService:
+    KEYSET = (Booking.id,)
+    TIMELINE_KEYSET = (Slot.start_time, Booking.id)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_bookings(self, skip: int = 0, limit: int = 100) -> List[BookingOut]:
-        """Get all bookings with pagination."""
-        query = select(Booking).options(
-            selectinload(Booking.user),
-            selectinload(Booking.slot).selectinload(Slot.game)
-        ).offset(skip).limit(limit)
-        
+    async def adjust_slot_counts(self, deltas: Dict[int, int]) -> None:
+        """Shift slots.booked_count by per-slot deltas inside the caller's transaction."""
+        deltas = {slot_id: delta for slot_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        
+        result = await self.db.execute(
+            update(Slot)
+            .where(Slot.id.in_(deltas))
+            .values(booked_count=Slot.booked_count + case(deltas, value=Slot.id, else_=0))
+            .returning(*OCCUPANCY_COLUMNS)
+        )
+        self._mark_seats_changed([(row, deltas[row.id]) for row in result.all()])
+
+    def _mark_seats_changed(self, changes: List[tuple]) -> None:
+        """Mark catalog entries stale and queue occupancy updates for (OCCUPANCY_COLUMNS values, delta) seat changes."""
+        updates = []
+        for values, delta in changes:
+            occupancy = slot_occupancy(values)
+            tags = [game_slots_tag(occupancy.game_id), SLOT_RANGES_TAG]
+            # A game's counts only move when one of its slots fills up or frees its last seat
+            if occupancy.is_full != (occupancy.booked_count - delta >= occupancy.capacity):
+                tags += [GAMES_TAG, game_tag(occupancy.game_id)]
+            mark_stale(self.db, *tags)
+            updates.append(occupancy)
+        queue_slot_updates(self.db, updates)
+
+    def _seat_claim(self, slot_id: int):
+        """Conditional UPDATE taking one seat in a slot, returning it only if capacity remained."""
+        return (
+            update(Slot)
+            .where(Slot.id == slot_id, Slot.booked_count < Slot.capacity)
+            .values(booked_count=Slot.booked_count + 1)
+            .returning(*OCCUPANCY_COLUMNS)
+        )
+
+    async def _claim_seat(self, slot_id: int) -> bool:
+        """Atomically take a seat; the UPDATE row-locks only this slot, so concurrent claims serialize on it."""
+        result = await self.db.execute(self._seat_claim(slot_id))
+        row = result.first()
+        if row is None:
+            return False
+        self._mark_seats_changed([(row, 1)])
+        return True
+
+    async def _insert_booking(self, booking_data: BookingCreate) -> Optional[Booking]:
+        """INSERT ... SELECT a booking guarded on its user and slot existing, claiming its seat in the same
+        transaction. Returns None if the user or slot is missing or the slot is full."""
+        booking_status = BookingStatus(booking_data.status.value)
+        user_exists = exists().where(User.id == booking_data.user_id)
+        claimed = None
+        
+        if not holds_seat(booking_status):
+            slot_id = select(Slot.id).where(Slot.id == booking_data.slot_id).scalar_subquery()
+        elif self.db.get_bind().dialect.name == "postgresql":
+            # Claim the seat and insert the booking in one statement
+            claimed = self._seat_claim(booking_data.slot_id).cte("claimed_slot")
+            slot_id = claimed.c.id
+        elif await self._claim_seat(booking_data.slot_id):
+            slot_id = literal(booking_data.slot_id)
+        else:
+            return None
+        
+        query = insert(Booking).from_select(
+            ["user_id", "slot_id", "status"],
+            select(
+                literal(booking_data.user_id),
+                slot_id,
+                literal(booking_status, Booking.status.type)
+            ).where(user_exists, slot_id.is_not(None))
+        ).returning(Booking)
+        if claimed is None:
+            result = await self.db.execute(query)
+            return result.scalars().first()
+        
+        # Also return the claimed slot's counts, for cache invalidation and occupancy updates
+        query = query.returning(*(select(column).scalar_subquery() for column in claimed.c))
         result = await self.db.execute(query)
-        bookings = result.scalars().all()
-        
-        return [BookingOut.from_orm(booking) for booking in bookings]
+        row = result.first()
+        if row is None:
+            return None
+        booking, *values = row
+        self._mark_seats_changed([(values, 1)])
+        return booking
+
+    async def _already_booked(self) -> HTTPException:
+        """Roll back after uq_bookings_user_slot_active rejected a write; the 400 to raise for it."""
+        await self.db.rollback()
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User already has a booking for this slot"
+        )
+
+    async def _commit_status_change(self) -> None:
+        """Commit a status change, reporting a clash with another active booking as a 400."""
+        try:
+            await commit_and_invalidate(self.db)
+        except IntegrityError:
+            raise await self._already_booked()
+
+    async def get_bookings_version(
+        self,
+        user_id: Optional[int] = None,
+        slot_id: Optional[int] = None,
+        status: Optional[BookingStatus] = None
+    ) -> tuple:
+        """Aggregates over the bookings a list filters to, without its paging."""
+        query = select(*version_columns(Booking))
+        if user_id is not None:
+            query = query.where(Booking.user_id == user_id)
+        if slot_id is not None:
+            query = query.where(Booking.slot_id == slot_id)
+        if status is not None:
+            query = query.where(Booking.status == status)
+        result = await self.db.execute(query)
+        return tuple(result.one())
+
+    async def get_booking_version(self, booking_id: int):
+        """The booking's (user_id, updated_at), for the ownership check and its ETag; None when missing."""
+        result = await self.db.execute(select(Booking.user_id, Booking.updated_at).where(Booking.id == booking_id))
+        return result.first()
+
+    async def _get_bookings(self, conditions: list, skip: int, limit: int, cursor: Optional[str], fields: Optional[List[str]]) -> list:
+        query = paginate(BOOKING_OUT.select(fields).where(*conditions), self.KEYSET, skip, limit, cursor)
+        result = await self.db.execute(query)
+        return BOOKING_OUT.load(result.all(), fields)
+
+    async def get_bookings(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[BookingOut]:
+        """Get all bookings with pagination; only `fields` (as dicts) for a sparse fieldset."""
+        return await self._get_bookings([], skip, limit, cursor, fields)
 
     async def get_booking_by_id(self, booking_id: int) -> BookingOut:
         """Get a specific booking by ID."""
-        query = select(Booking).options(
-            selectinload(Booking.user),
-            selectinload(Booking.slot).selectinload(Slot.game)
-        ).where(Booking.id == booking_id)
+        result = await self.db.execute(BOOKING_OUT.select().where(Booking.id == booking_id))
+        row = result.first()
         
-        result = await self.db.execute(query)
-        booking = result.scalars().first()
-        
-        if not booking:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Booking not found"
             )
         
-        return BookingOut.from_orm(booking)
+        return BOOKING_OUT.load([row])[0]
 
-    async def get_bookings_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[BookingOut]:
+    async def get_bookings_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[BookingOut]:
         """Get all bookings for a specific user."""
-        query = select(Booking).options(
-            selectinload(Booking.user),
-            selectinload(Booking.slot).selectinload(Slot.game)
-        ).where(Booking.user_id == user_id).offset(skip).limit(limit)
-        
-        result = await self.db.execute(query)
-        bookings = result.scalars().all()
-        
-        return [BookingOut.from_orm(booking) for booking in bookings]
+        return await self._get_bookings([Booking.user_id == user_id], skip, limit, cursor, fields)
 
-    async def get_bookings_by_slot(self, slot_id: int, skip: int = 0, limit: int = 100) -> List[BookingOut]:
+    async def get_bookings_by_slot(
+        self,
+        slot_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[BookingOut]:
         """Get all bookings for a specific slot."""
-        query = select(Booking).options(
-            selectinload(Booking.user),
-            selectinload(Booking.slot).selectinload(Slot.game)
-        ).where(Booking.slot_id == slot_id).offset(skip).limit(limit)
-        
-        result = await self.db.execute(query)
-        bookings = result.scalars().all()
-        
-        return [BookingOut.from_orm(booking) for booking in bookings]
+        return await self._get_bookings([Booking.slot_id == slot_id], skip, limit, cursor, fields)
 
-    async def get_bookings_by_status(self, status: BookingStatus, skip: int = 0, limit: int = 100) -> List[BookingOut]:
+    async def get_bookings_by_status(
+        self,
+        status: BookingStatus,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[BookingOut]:
         """Get all bookings with a specific status."""
-        query = select(Booking).options(
-            selectinload(Booking.user),
-            selectinload(Booking.slot).selectinload(Slot.game)
-        ).where(Booking.status == status).offset(skip).limit(limit)
-        
-        result = await self.db.execute(query)
-        bookings = result.scalars().all()
-        
-        return [BookingOut.from_orm(booking) for booking in bookings]
+        return await self._get_bookings([Booking.status == status], skip, limit, cursor, fields)
 
-    async def get_user_active_bookings(self, user_id: int, skip: int = 0, limit: int = 100) -> List[BookingOut]:
+    async def get_user_active_bookings(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[BookingOut]:
         """Get active (confirmed) bookings for a specific user."""
-        query = select(Booking).options(
-            selectinload(Booking.user),
-            selectinload(Booking.slot).selectinload(Slot.game)
-        ).where(
-            Booking.user_id == user_id,
-            Booking.status == BookingStatus.CONFIRMED
-        ).offset(skip).limit(limit)
+        conditions = [Booking.user_id == user_id, Booking.status == BookingStatus.CONFIRMED]
+        return await self._get_bookings(conditions, skip, limit, cursor, fields)
+
+    async def get_user_timeline(
+        self,
+        user_id: int,
+        period: BookingTimelinePeriod = BookingTimelinePeriod.all,
+        booking_status: Optional[BookingStatus] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[BookingTimelineItem]:
+        """A user's bookings with their slot windows and game titles, ordered by slot start time.
+        
+        Upcoming bookings (slot not yet over) run soonest first, past ones most recent first.
+        One joined SELECT of plain columns, so no ORM objects are built.
+        """
+        query = (
+            select(
+                Booking.id,
+                Booking.status,
+                Booking.slot_id,
+                Slot.start_time,
+                Slot.end_time,
+                Slot.game_id,
+                Game.title.label("game_title"),
+                Booking.created_at,
+                Booking.updated_at
+            )
+            .join(Slot, Booking.slot_id == Slot.id)
+            .join(Game, Slot.game_id == Game.id)
+            .where(Booking.user_id == user_id)
+        )
+        # Slot times are stored as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if period == BookingTimelinePeriod.upcoming:
+            query = query.where(Slot.end_time > now)
+        elif period == BookingTimelinePeriod.past:
+            query = query.where(Slot.end_time <= now)
+        if booking_status is not None:
+            query = query.where(Booking.status == BookingStatus(booking_status.value))
+        query = paginate(
+            query, self.TIMELINE_KEYSET, skip, limit, cursor, descending=period == BookingTimelinePeriod.past
+        )
         
         result = await self.db.execute(query)
-        bookings = result.scalars().all()
-        
-        return [BookingOut.from_orm(booking) for booking in bookings]
+        return TIMELINE_LIST.validate_python([row._mapping for row in result.all()])
 
-    async def create_booking(self, booking_data: BookingCreate) -> BookingOut:
-        """Create a new booking."""
-        # Validate that the user exists
-        user_query = select(User).where(User.id == booking_data.user_id)
-        user_result = await self.db.execute(user_query)
-        user = user_result.scalars().first()
-        
-        if not user:
+    def export_bookings(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        game_ids: Optional[List[int]] = None,
+        booking_status: Optional[BookingStatus] = None
+    ) -> AsyncIterator[List[BookingExportRow]]:
+        """Bookings joined with their user, department, slot and game, in id order, a batch at a time.
+        
+        Filters are checked here, before anything streams; the rows are read as the iterator is consumed.
+        """
+        start_time, end_time = naive_utc(start_time), naive_utc(end_time)
+        if start_time and end_time and start_time >= end_time:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must be before end_date"
             )
-        
-        # Validate that the slot exists
-        slot_query = select(Slot).options(
-            selectinload(Slot.bookings)
-        ).where(Slot.id == booking_data.slot_id)
-        slot_result = await self.db.execute(slot_query)
-        slot = slot_result.scalars().first()
-        
-        if not slot:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Slot not found"
+        slot_conditions, booking_conditions = self._purge_conditions(
+            start_time=start_time, end_time=end_time, booking_status=booking_status
+        )
+        if game_ids:
+            slot_conditions.append(Slot.game_id.in_(game_ids))
+        
+        query = (
+            select(
+                Booking.id,
+                Booking.status,
+                Booking.created_at,
+                Booking.updated_at,
+                Booking.user_id,
+                User.username,
+                User.email,
+                User.department_id,
+                Department.title.label("department_title"),
+                Booking.slot_id,
+                Slot.start_time,
+                Slot.end_time,
+                Slot.game_id,
+                Game.title.label("game_title")
             )
-        
-        # Check if slot is full
-        if slot.is_full:
+            .join(User, Booking.user_id == User.id)
+            .join(Department, User.department_id == Department.id)
+            .join(Slot, Booking.slot_id == Slot.id)
+            .join(Game, Slot.game_id == Game.id)
+            .where(*slot_conditions, *booking_conditions)
+            .order_by(Booking.id)
+            .execution_options(yield_per=settings.BOOKING_EXPORT_BATCH_SIZE)
+        )
+        return self._stream_export(query)
+
+    async def _stream_export(self, query) -> AsyncIterator[List[BookingExportRow]]:
+        # A server-side cursor fetching BOOKING_EXPORT_BATCH_SIZE rows at a time keeps memory flat
+        # however many bookings match; closing the iterator early (client gone) closes the cursor
+        result = await self.db.stream(query)
+        try:
+            async for rows in result.partitions():
+                yield EXPORT_ROWS.validate_python([row._mapping for row in rows])
+        finally:
+            await result.close()
+
+    async def create_booking(self, booking_data: BookingCreate) -> BookingOut:
+        """Create a new booking."""
+        # Claim a seat and insert atomically; the partial unique index
+        # uq_bookings_user_slot_active rejects a second active booking
+        try:
+            booking = await self._insert_booking(booking_data)
+        except IntegrityError:
+            await self.db.rollback()
+            booking_outcomes.inc("duplicate")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Slot is already full"
+                detail="User already has a booking for this slot"
             )
         
-        # Check if user already has a booking for this slot
-        existing_booking_query = select(Booking).where(
-            Booking.user_id == booking_data.user_id,
-            Booking.slot_id == booking_data.slot_id,
-            Booking.status == BookingStatus.CONFIRMED
-        )
-        existing_booking_result = await self.db.execute(existing_booking_query)
-        existing_booking = existing_booking_result.scalars().first()
-        
-        if existing_booking:
+        if not booking:
+            # Nothing was inserted, so work out why
+            await self.db.rollback()
+            user_result = await self.db.execute(select(User.id).where(User.id == booking_data.user_id))
+            if user_result.first() is None:
+                booking_outcomes.inc("not_found")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="User not found"
+                )
+            slot_result = await self.db.execute(select(Slot.id).where(Slot.id == booking_data.slot_id))
+            if slot_result.first() is None:
+                booking_outcomes.inc("not_found")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Slot not found"
+                )
+            booking_outcomes.inc("rejected_full")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User already has a booking for this slot"
+                detail="Slot is already full"
             )
         
-        # Create booking object
-        booking = Booking(
-            user_id=booking_data.user_id,
-            slot_id=booking_data.slot_id,
-            status=booking_data.status
-        )
-        
-        self.db.add(booking)
-        await self.db.commit()
-        await self.db.refresh(booking)
-        
-        # Load relationships for response
-        await self.db.refresh(booking, ["user", "slot"])
-        await self.db.refresh(booking.slot, ["game"])
+        await commit_and_invalidate(self.db)
+        booking_outcomes.inc("created")
         
         return BookingOut.from_orm(booking)
 
-    async def update_booking(self, booking_id: int, booking_data: BookingUpdate) -> BookingOut:
-        """Update an existing booking."""
-        # Get the booking
-        query = select(Booking).where(Booking.id == booking_id)
-        result = await self.db.execute(query)
+    async def _get_owned_booking(self, booking_id: int, owner_id: Optional[int] = None) -> Booking:
+        """Load a booking, raising 404 if it is missing and 403 if `owner_id` is given and didn't book it."""
+        result = await self.db.execute(select(Booking).where(Booking.id == booking_id))
         booking = result.scalars().first()
         
         if not booking:
@@ -173,96 +413,271 @@ class BookingService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Booking not found"
             )
+        if owner_id is not None and booking.user_id != owner_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only access your own bookings"
+            )
+        return booking
+
+    async def _set_status(self, booking_id: int, new_status: BookingStatus, *conditions) -> Optional[Booking]:
+        """UPDATE ... RETURNING a booking's status, only while `conditions` hold; None if they didn't.
+
+        Re-activating a booking while the user holds another active one for the slot is a 400.
+        """
+        try:
+            result = await self.db.execute(
+                update(Booking)
+                .where(Booking.id == booking_id, *conditions)
+                .values(status=new_status)
+                .returning(Booking)
+                # Refresh a copy already in the session, e.g. from _get_owned_booking
+                .execution_options(populate_existing=True)
+            )
+        except IntegrityError:
+            # The partial unique index checks the UPDATE as it runs, not at commit
+            raise await self._already_booked()
+        return result.scalars().first()
+
+    async def update_booking(
+        self,
+        booking_id: int,
+        booking_data: BookingUpdate,
+        owner_id: Optional[int] = None
+    ) -> BookingOut:
+        """Update an existing booking; with `owner_id`, only if that user booked it."""
+        booking = await self._get_owned_booking(booking_id, owner_id)
         
         # Update status if provided
-        if booking_data.status is not None:
-            booking.status = booking_data.status
+        if booking_data.status is None or BookingStatus(booking_data.status.value) == booking.status:
+            return BookingOut.from_orm(booking)
+        
+        new_status = BookingStatus(booking_data.status.value)
+        seat_delta = int(holds_seat(new_status)) - int(holds_seat(booking.status))
+        if seat_delta > 0 and not await self._claim_seat(booking.slot_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Slot is already full"
+            )
         
-        await self.db.commit()
-        await self.db.refresh(booking)
+        # Guarded on the status we read, so a concurrent change isn't overwritten with the wrong seat count
+        updated = await self._set_status(booking_id, new_status, Booking.status == booking.status)
+        if not updated:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Booking was changed by another request, please retry"
+            )
+        if seat_delta < 0:
+            await self.adjust_slot_counts({booking.slot_id: seat_delta})
         
-        # Load relationships for response
-        await self.db.refresh(booking, ["user", "slot"])
-        await self.db.refresh(booking.slot, ["game"])
+        await self._commit_status_change()
         
-        return BookingOut.from_orm(booking)
+        return BookingOut.from_orm(updated)
 
-    async def cancel_booking(self, booking_id: int) -> BookingOut:
-        """Cancel a booking (set status to cancelled)."""
-        # Get the booking
-        query = select(Booking).where(Booking.id == booking_id)
-        result = await self.db.execute(query)
-        booking = result.scalars().first()
+    async def cancel_booking(self, booking_id: int, owner_id: Optional[int] = None) -> BookingOut:
+        """Cancel a booking (set status to cancelled); with `owner_id`, only if that user booked it."""
+        conditions = [Booking.status.in_(ACTIVE_BOOKING_STATUSES)]
+        if owner_id is not None:
+            conditions.append(Booking.user_id == owner_id)
+        booking = await self._set_status(booking_id, BookingStatus.CANCELLED, *conditions)
         
         if not booking:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Booking not found"
-            )
-        
-        # Check if booking is already cancelled
-        if booking.status == BookingStatus.CANCELLED:
+            # Raises for a missing or someone else's booking; otherwise it was already cancelled
+            await self._get_owned_booking(booking_id, owner_id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Booking is already cancelled"
             )
         
-        # Cancel the booking
-        booking.status = BookingStatus.CANCELLED
-        
-        await self.db.commit()
-        await self.db.refresh(booking)
-        
-        # Load relationships for response
-        await self.db.refresh(booking, ["user", "slot"])
-        await self.db.refresh(booking.slot, ["game"])
+        # Every active status holds a seat
+        await self.adjust_slot_counts({booking.slot_id: -1})
+        await commit_and_invalidate(self.db)
         
         return BookingOut.from_orm(booking)
 
     async def confirm_booking(self, booking_id: int) -> BookingOut:
         """Confirm a pending booking."""
-        # Get the booking
-        query = select(Booking).where(Booking.id == booking_id)
-        result = await self.db.execute(query)
-        booking = result.scalars().first()
+        # A pending booking already holds its seat, so confirming it is a single UPDATE
+        booking = await self._set_status(booking_id, BookingStatus.CONFIRMED, Booking.status == BookingStatus.PENDING)
         
         if not booking:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Booking not found"
-            )
+            current = await self._get_owned_booking(booking_id)
+            if current.status == BookingStatus.CONFIRMED:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Booking is already confirmed"
+                )
+            
+            # Re-activating a cancelled booking takes a seat again
+            if not await self._claim_seat(current.slot_id):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Slot is now full, cannot confirm booking"
+                )
+            booking = await self._set_status(booking_id, BookingStatus.CONFIRMED, Booking.status == current.status)
+            if not booking:
+                await self.db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Booking was changed by another request, please retry"
+                )
+        
+        await self._commit_status_change()
         
-        # Check if booking is already confirmed
-        if booking.status == BookingStatus.CONFIRMED:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Booking is already confirmed"
+        return BookingOut.from_orm(booking)
+
+    async def apply_batch(self, batch: BookingBatchRequest) -> BookingBatchResponse:
+        """Create, cancel and confirm many bookings with one read per table and set-based writes in one transaction."""
+        booking_ids = {item.booking_id for item in batch.items if item.booking_id is not None}
+        bookings = {}
+        if booking_ids:
+            result = await self.db.execute(
+                select(Booking.id, Booking.user_id, Booking.slot_id, Booking.status).where(Booking.id.in_(booking_ids))
             )
+            bookings = {row.id: row for row in result.all()}
+        statuses = {booking_id: row.status for booking_id, row in bookings.items()}
+        
+        creates = [item for item in batch.items if item.operation == BookingBatchOperation.create]
+        user_ids = set()
+        if creates:
+            user_result = await self.db.execute(select(User.id).where(User.id.in_({item.user_id for item in creates})))
+            user_ids = set(user_result.scalars().all())
+        
+        # Free seats for every slot the batch touches, read from the maintained booked_count;
+        # on PostgreSQL the rows stay locked (in id order) until commit so concurrent claims wait
+        slot_ids = {item.slot_id for item in creates} | {row.slot_id for row in bookings.values()}
+        free_seats = {}
+        if slot_ids:
+            seat_result = await self.db.execute(
+                select(Slot.id, Slot.capacity - Slot.booked_count)
+                .where(Slot.id.in_(slot_ids))
+                .order_by(Slot.id)
+                .with_for_update()
+            )
+            free_seats = dict(seat_result.all())
         
-        # Check if slot is still available
-        slot_query = select(Slot).options(
-            selectinload(Slot.bookings)
-        ).where(Slot.id == booking.slot_id)
-        slot_result = await self.db.execute(slot_query)
-        slot = slot_result.scalars().first()
-        
-        if slot.is_full:
+        # (user_id, slot_id) pairs that already have an active booking
+        pairs = {(item.user_id, item.slot_id) for item in creates} | {
+            (row.user_id, row.slot_id) for row in bookings.values()
+        }
+        active_pairs = set()
+        if pairs:
+            pair_result = await self.db.execute(
+                select(Booking.user_id, Booking.slot_id).where(
+                    tuple_(Booking.user_id, Booking.slot_id).in_(pairs),
+                    Booking.status.in_(ACTIVE_BOOKING_STATUSES)
+                )
+            )
+            active_pairs = set(map(tuple, pair_result.all()))
+        
+        results: List[BookingBatchItemResult] = []
+        new_bookings = []
+        seat_deltas: Dict[int, int] = {}
+        for index, item in enumerate(batch.items):
+            error = None
+            if item.operation == BookingBatchOperation.create:
+                new_status = BookingStatus(item.status.value)
+                pair = (item.user_id, item.slot_id)
+                if item.user_id not in user_ids:
+                    error = "User not found"
+                elif item.slot_id not in free_seats:
+                    error = "Slot not found"
+                elif holds_seat(new_status) and pair in active_pairs:
+                    error = "User already has a booking for this slot"
+                elif holds_seat(new_status) and free_seats[item.slot_id] < 1:
+                    error = "Slot is already full"
+                else:
+                    if holds_seat(new_status):
+                        free_seats[item.slot_id] -= 1
+                        seat_deltas[item.slot_id] = seat_deltas.get(item.slot_id, 0) + 1
+                        active_pairs.add(pair)
+                    new_bookings.append((index, {"user_id": item.user_id, "slot_id": item.slot_id, "status": new_status}))
+            else:
+                row = bookings.get(item.booking_id)
+                if row is None:
+                    error = "Booking not found"
+                else:
+                    current = statuses[row.id]
+                    pair = (row.user_id, row.slot_id)
+                    if item.operation == BookingBatchOperation.cancel:
+                        new_status = BookingStatus.CANCELLED
+                        if current == BookingStatus.CANCELLED:
+                            error = "Booking is already cancelled"
+                        elif holds_seat(current):
+                            free_seats[row.slot_id] += 1
+                            seat_deltas[row.slot_id] = seat_deltas.get(row.slot_id, 0) - 1
+                            active_pairs.discard(pair)
+                    else:
+                        new_status = BookingStatus.CONFIRMED
+                        if current == BookingStatus.CONFIRMED:
+                            error = "Booking is already confirmed"
+                        elif not holds_seat(current):
+                            # Re-activating a cancelled booking takes a seat again
+                            if pair in active_pairs:
+                                error = "User already has a booking for this slot"
+                            elif free_seats[row.slot_id] < 1:
+                                error = "Slot is now full, cannot confirm booking"
+                            else:
+                                free_seats[row.slot_id] -= 1
+                                seat_deltas[row.slot_id] = seat_deltas.get(row.slot_id, 0) + 1
+                                active_pairs.add(pair)
+                    if error is None:
+                        statuses[row.id] = new_status
+            
+            results.append(BookingBatchItemResult(
+                index=index,
+                operation=item.operation,
+                success=error is None,
+                booking_id=item.booking_id,
+                status=new_status.value if error is None else None,
+                error=error
+            ))
+        
+        failed = sum(1 for result in results if not result.success)
+        if failed and batch.all_or_nothing:
+            await self.db.rollback()
+            self._count_batch_outcomes(batch, results, committed=False)
+            return BookingBatchResponse(results=results, succeeded=len(results) - failed, failed=failed, committed=False)
+        
+        # One UPDATE per target status, one multi-row INSERT and one UPDATE of the slot counts
+        changed = {booking_id: new for booking_id, new in statuses.items() if new != bookings[booking_id].status}
+        for target in (BookingStatus.CANCELLED, BookingStatus.CONFIRMED):
+            ids = [booking_id for booking_id, new in changed.items() if new == target]
+            if ids:
+                await self.db.execute(update(Booking).where(Booking.id.in_(ids)).values(status=target))
+        if new_bookings:
+            insert_result = await self.db.execute(
+                insert(Booking).returning(Booking.id, sort_by_parameter_order=True),
+                [values for _, values in new_bookings]
+            )
+            for (index, _), booking_id in zip(new_bookings, insert_result.scalars().all()):
+                results[index].booking_id = booking_id
+        await self.adjust_slot_counts(seat_deltas)
+        
+        try:
+            await commit_and_invalidate(self.db)
+        except IntegrityError:
+            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Slot is now full, cannot confirm booking"
+                detail="Batch conflicts with another active booking, nothing was applied"
             )
         
-        # Confirm the booking
-        booking.status = BookingStatus.CONFIRMED
-        
-        await self.db.commit()
-        await self.db.refresh(booking)
-        
-        # Load relationships for response
-        await self.db.refresh(booking, ["user", "slot"])
-        await self.db.refresh(booking.slot, ["game"])
-        
-        return BookingOut.from_orm(booking)
+        self._count_batch_outcomes(batch, results, committed=True)
+        return BookingBatchResponse(results=results, succeeded=len(results) - failed, failed=failed, committed=True)
+
+    @staticmethod
+    def _count_batch_outcomes(batch: BookingBatchRequest, results: List[BookingBatchItemResult], committed: bool) -> None:
+        for item, result in zip(batch.items, results):
+            if item.operation != BookingBatchOperation.create:
+                continue
+            if result.success:
+                # Valid creates rolled back with an all-or-nothing batch were never made
+                if committed:
+                    booking_outcomes.inc("created")
+            else:
+                booking_outcomes.inc(BATCH_ERROR_OUTCOMES.get(result.error, "not_found"))
 
     async def delete_booking(self, booking_id: int) -> BookingDeleteResponse:
         """Delete a booking."""
@@ -278,42 +693,120 @@ class BookingService:
             )
         
         await self.db.delete(booking)
-        await self.db.commit()
+        await self.adjust_slot_counts({booking.slot_id: -int(holds_seat(booking.status))})
+        await mark_usage_stale(self.db, Slot.id == booking.slot_id)
+        await commit_and_invalidate(self.db)
         
         return BookingDeleteResponse(message="Booking deleted successfully")
 
-    async def reset_current_day_bookings(self) -> dict:
+    def _purge_conditions(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        game_id: Optional[int] = None,
+        booking_status: Optional[BookingStatus] = None
+    ) -> tuple:
+        """(slot conditions, booking conditions) selecting bookings to purge; slot bounds are sargable ranges."""
+        slot_conditions = []
+        if start_time is not None:
+            slot_conditions.append(Slot.start_time >= start_time)
+        if end_time is not None:
+            slot_conditions.append(Slot.start_time < end_time)
+        if game_id is not None:
+            slot_conditions.append(Slot.game_id == game_id)
+        
+        booking_conditions = []
+        if booking_status is not None:
+            booking_conditions.append(Booking.status == BookingStatus(booking_status.value))
+        return slot_conditions, booking_conditions
+
+    async def _delete_bookings(self, slot_conditions: list, booking_conditions: list, limit: Optional[int] = None) -> int:
+        """Delete matching bookings in one statement, releasing their seats; at most `limit` rows when given."""
+        query = delete(Booking)
+        if limit is not None:
+            batch = select(Booking.id).where(*booking_conditions).order_by(Booking.id).limit(limit)
+            if slot_conditions:
+                batch = batch.join(Slot).where(*slot_conditions)
+            query = query.where(Booking.id.in_(batch))
+        elif slot_conditions and self.db.get_bind().dialect.name == "postgresql":
+            # DELETE FROM bookings USING slots WHERE ...
+            query = query.where(Booking.slot_id == Slot.id, *slot_conditions, *booking_conditions)
+        else:
+            if slot_conditions:
+                query = query.where(Booking.slot_id.in_(select(Slot.id).where(*slot_conditions)))
+            query = query.where(*booking_conditions)
+        
+        result = await self.db.execute(
+            query.returning(Booking.slot_id, Booking.status),
+            execution_options={"synchronize_session": False}
+        )
+        deleted = result.all()
+        
+        released_seats: Dict[int, int] = {}
+        for slot_id, booking_status in deleted:
+            if holds_seat(booking_status):
+                released_seats[slot_id] = released_seats.get(slot_id, 0) - 1
+        await self.adjust_slot_counts(released_seats)
+        if deleted:
+            await mark_usage_stale(self.db, Slot.id.in_({slot_id for slot_id, _ in deleted}))
+        return len(deleted)
+
+    async def reset_current_day_bookings(self, timezone_name: Optional[str] = None) -> dict:
         """Reset all bookings for the current day (Admin only)."""
-        from datetime import datetime, timezone
-        
-        # Get current date in UTC
-        current_date = datetime.now(timezone.utc).date()
+        timezone_name = timezone_name or settings.BOOKING_TIMEZONE
+        try:
+            zone = ZoneInfo(timezone_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown timezone: {timezone_name}"
+            )
         
-        # Find all bookings for slots that are on the current day
-        query = select(Booking).options(
-            selectinload(Booking.slot)
-        ).join(Slot).where(
-            func.date(Slot.start_time) == current_date
-        )
+        current_date = datetime.now(zone).date()
+        day_start, day_end = day_bounds(current_date, zone)
         
-        result = await self.db.execute(query)
-        current_day_bookings = result.scalars().all()
+        # One DELETE over a range on start_time, so ix_slots_start_time applies
+        slot_conditions, booking_conditions = self._purge_conditions(start_time=day_start, end_time=day_end)
+        deleted_count = await self._delete_bookings(slot_conditions, booking_conditions)
+        await commit_and_invalidate(self.db)
         
-        if not current_day_bookings:
+        if not deleted_count:
             return {
                 "message": "No bookings found for today",
                 "deleted_count": 0,
-                "date": current_date.isoformat()
+                "date": current_date.isoformat(),
+                "timezone": timezone_name
             }
         
-        # Delete all current day bookings
-        for booking in current_day_bookings:
-            await self.db.delete(booking)
-        
-        await self.db.commit()
-        
         return {
-            "message": f"Successfully reset {len(current_day_bookings)} bookings for today",
-            "deleted_count": len(current_day_bookings),
-            "date": current_date.isoformat()
+            "message": f"Successfully reset {deleted_count} bookings for today",
+            "deleted_count": deleted_count,
+            "date": current_date.isoformat(),
+            "timezone": timezone_name
         }
+
+    async def purge_bookings(self, purge: BookingPurge) -> AsyncIterator[dict]:
+        """Delete matching bookings in batches, committing and yielding progress after each one (Admin only)."""
+        slot_conditions, booking_conditions = self._purge_conditions(
+            purge.start_time, purge.end_time, purge.game_id, purge.status
+        )
+        
+        count_query = select(func.count(Booking.id)).where(*booking_conditions)
+        if slot_conditions:
+            count_query = count_query.join(Slot).where(*slot_conditions)
+        matched = await self.db.scalar(count_query)
+        yield {"matched": matched}
+        
+        deleted_total = 0
+        batches = 0
+        while deleted_total < matched:
+            # Short transactions keep row locks and WAL growth bounded on very large ranges
+            deleted = await self._delete_bookings(slot_conditions, booking_conditions, limit=purge.batch_size)
+            await commit_and_invalidate(self.db)
+            if not deleted:
+                break
+            deleted_total += deleted
+            batches += 1
+            yield {"batch": batches, "deleted": deleted, "deleted_total": deleted_total, "matched": matched}
+        
+        yield {"done": True, "deleted_count": deleted_total, "batches": batches}
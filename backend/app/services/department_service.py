@@ -1,44 +1,119 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, exists, insert, update, literal
+from sqlalchemy.orm import aliased
 from typing import List, Optional
 from fastapi import HTTPException, status
+from datetime import datetime
+from pydantic import TypeAdapter
 
 from app.models.department import Department
+from app.models.user import User
+from app.models.booking import Booking, BookingStatus
+from app.models.slot import Slot
 from app.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentOut, DepartmentDeleteResponse
+from app.core.pagination import paginate
+from app.services.booking_service import naive_utc
+
+
+# What DepartmentOut needs from a written row
+RETURNED_COLUMNS = (Department.id, Department.title, Department.description, Department.created_at, Department.updated_at)
+
+DEPARTMENT_LIST = TypeAdapter(List[DepartmentOut])
 
 
 class DepartmentService:
+    KEYSET = (Department.id,)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_departments(self, skip: int = 0, limit: int = 100) -> List[DepartmentOut]:
+    def _booked_totals(
+        self,
+        department_id: Optional[int] = None,
+        booking_status: Optional[BookingStatus] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
+        """Bookings per department as one grouped COUNT over users and bookings."""
+        query = select(
+            User.department_id.label("department_id"),
+            func.count(Booking.id).label("slot_booked")
+        ).join(Booking, Booking.user_id == User.id)
+        
+        if department_id is not None:
+            query = query.where(User.department_id == department_id)
+        if booking_status is not None:
+            query = query.where(Booking.status == booking_status)
+        # The date window applies to when the booked slot starts, which is stored as naive UTC
+        start_date, end_date = naive_utc(start_date), naive_utc(end_date)
+        if start_date is not None or end_date is not None:
+            query = query.join(Slot, Slot.id == Booking.slot_id)
+            if start_date is not None:
+                query = query.where(Slot.start_time >= start_date)
+            if end_date is not None:
+                query = query.where(Slot.start_time < end_date)
+        
+        return query.group_by(User.department_id).subquery()
+
+    def _with_totals(self, query, totals):
+        return query.add_columns(
+            func.coalesce(totals.c.slot_booked, 0)
+        ).outerjoin(totals, totals.c.department_id == Department.id)
+
+    def _title_taken(self, title: str, exclude_department_id: Optional[int] = None):
+        """EXISTS another department with this title."""
+        # Aliased so it stays a standalone subquery inside UPDATE departments
+        other = aliased(Department)
+        condition = exists().where(other.title == title)
+        if exclude_department_id is not None:
+            condition = condition.where(other.id != exclude_department_id)
+        return condition
+
+    def _to_out(self, department: Department, slot_booked: int) -> DepartmentOut:
+        department_out = DepartmentOut.from_orm(department)
+        department_out.slot_booked = slot_booked
+        return department_out
+
+    async def get_departments(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        booking_status: Optional[BookingStatus] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[DepartmentOut]:
         """Get all departments with pagination."""
-        query = select(Department).options(
-            selectinload(Department.users)
-        ).offset(skip).limit(limit)
+        totals = self._booked_totals(booking_status=booking_status, start_date=start_date, end_date=end_date)
+        query = self._with_totals(select(Department), totals)
+        query = paginate(query, self.KEYSET, skip, limit, cursor)
         
         result = await self.db.execute(query)
-        departments = result.scalars().all()
         
-        return [DepartmentOut.from_orm(department) for department in departments]
+        return [self._to_out(department, slot_booked) for department, slot_booked in result.all()]
 
-    async def get_department_by_id(self, department_id: int) -> DepartmentOut:
+    async def get_department_by_id(
+        self,
+        department_id: int,
+        booking_status: Optional[BookingStatus] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> DepartmentOut:
         """Get a specific department by ID."""
-        query = select(Department).options(
-            selectinload(Department.users)
-        ).where(Department.id == department_id)
+        totals = self._booked_totals(department_id, booking_status, start_date, end_date)
+        query = self._with_totals(select(Department), totals).where(Department.id == department_id)
         
         result = await self.db.execute(query)
-        department = result.scalars().first()
+        row = result.first()
         
-        if not department:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Department not found"
             )
         
-        return DepartmentOut.from_orm(department)
+        return self._to_out(*row)
 
     async def get_department_by_title(self, title: str) -> Optional[Department]:
         """Get department by title (for internal use)."""
@@ -48,71 +123,58 @@ class DepartmentService:
 
     async def create_department(self, department_data: DepartmentCreate) -> DepartmentOut:
         """Create a new department."""
-        # Check if title already exists
-        existing_department = await self.get_department_by_title(department_data.title)
-        if existing_department:
+        # One INSERT ... SELECT guarded on the title being free
+        query = insert(Department).from_select(
+            ["title", "description"],
+            select(
+                literal(department_data.title, Department.title.type),
+                literal(department_data.description, Department.description.type)
+            ).where(~self._title_taken(department_data.title))
+        ).returning(*RETURNED_COLUMNS)
+        result = await self.db.execute(query)
+        department = result.first()
+        
+        if not department:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Department with this title already exists"
             )
         
-        # Create department object
-        department = Department(
-            title=department_data.title,
-            description=department_data.description
-        )
-        
-        self.db.add(department)
         await self.db.commit()
-        await self.db.refresh(department)
         
-        # Load relationships for response
-        await self.db.refresh(department, ["users"])
-        
-        return DepartmentOut.from_orm(department)
+        return self._to_out(department, 0)
 
     async def update_department(self, department_id: int, department_data: DepartmentUpdate) -> DepartmentOut:
         """Update an existing department."""
-        # Get the department
-        query = select(Department).where(Department.id == department_id)
-        result = await self.db.execute(query)
-        department = result.scalars().first()
+        values = {field: value for field, value in department_data.model_dump().items() if value is not None}
+        if not values:
+            return await self.get_department_by_id(department_id)
+        
+        # One UPDATE ... RETURNING guarded on a new title being free
+        query = update(Department).where(Department.id == department_id).values(**values)
+        if department_data.title:
+            query = query.where(~self._title_taken(department_data.title, exclude_department_id=department_id))
+        result = await self.db.execute(query.returning(*RETURNED_COLUMNS))
+        department = result.first()
         
         if not department:
+            # Raises 404 for a missing department; otherwise the title was taken
+            await self.get_department_by_id(department_id)
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Department not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Department with this title already exists"
             )
         
-        # Check if new title conflicts with existing department
-        if department_data.title and department_data.title != department.title:
-            existing_department = await self.get_department_by_title(department_data.title)
-            if existing_department:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Department with this title already exists"
-                )
-        
-        # Update fields
-        if department_data.title is not None:
-            department.title = department_data.title
-        if department_data.description is not None:
-            department.description = department_data.description
-        
         await self.db.commit()
-        await self.db.refresh(department)
-        
-        # Load relationships for response
-        await self.db.refresh(department, ["users"])
         
-        return DepartmentOut.from_orm(department)
+        totals = self._booked_totals(department_id)
+        slot_booked = await self.db.scalar(select(totals.c.slot_booked))
+        return self._to_out(department, slot_booked or 0)
 
     async def delete_department(self, department_id: int) -> DepartmentDeleteResponse:
         """Delete a department."""
         # Get the department
-        query = select(Department).options(
-            selectinload(Department.users)
-        ).where(Department.id == department_id)
+        query = select(Department).where(Department.id == department_id)
         result = await self.db.execute(query)
         department = result.scalars().first()
         
@@ -123,7 +185,8 @@ class DepartmentService:
             )
         
         # Check if department has users
-        if department.users:
+        has_users = await self.db.scalar(select(exists().where(User.department_id == department_id)))
+        if has_users:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete department with existing users. Please reassign or delete users first."
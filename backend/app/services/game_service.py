@@ -1,33 +1,79 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from sqlalchemy.orm import selectinload, aliased
+from sqlalchemy import insert, update, exists, literal, true
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
 from app.models.game import Game
+from app.models.slot import Slot
 from app.schemas.game import GameCreate, GameUpdate, GameOut, GameDeleteResponse
+from app.core.pagination import paginate
+from app.core.etag import version_columns
+from app.core.cache import catalog_cache, commit_and_invalidate, mark_stale, game_tag, GAMES_TAG
+
+
+# What GameOut needs from a written row, besides the slot counts
+RETURNED_COLUMNS = (Game.id, Game.title, Game.description, Game.background, Game.created_at, Game.updated_at)
+
+GAME_LIST = TypeAdapter(List[GameOut])
+GAME = TypeAdapter(GameOut)
 
 
 class GameService:
+    KEYSET = (Game.id,)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_games(self, skip: int = 0, limit: int = 100) -> List[GameOut]:
+    async def get_games(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[GameOut]:
         """Get all games with pagination."""
-        query = select(Game).options(
-            selectinload(Game.slots)
-        ).offset(skip).limit(limit)
+        games, _ = await self.get_games_versioned(skip, limit, cursor)
+        return games
+
+    async def get_games_versioned(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[GameOut], str]:
+        """A page of games with the ETag version of the cached copy it came from."""
+        return await catalog_cache.get_or_load_versioned(
+            "games", {"skip": skip, "limit": limit, "cursor": cursor}, [GAMES_TAG],
+            lambda: self._load_games(skip, limit, cursor), GAME_LIST
+        )
+
+    async def _load_games(self, skip: int, limit: int, cursor: Optional[str]) -> List[GameOut]:
+        query = select(Game)
+        query = paginate(query, self.KEYSET, skip, limit, cursor)
         
         result = await self.db.execute(query)
         games = result.scalars().all()
         
         return [GameOut.from_orm(game) for game in games]
 
+    async def get_games_version(self) -> tuple:
+        """Aggregates over all games and slots, which game lists (and their slot counts) derive from."""
+        games = select(*version_columns(Game)).subquery()
+        slots = select(*version_columns(Slot)).subquery()
+        result = await self.db.execute(select(games, slots).select_from(games.join(slots, true())))
+        return tuple(result.one())
+
     async def get_game_by_id(self, game_id: int) -> GameOut:
         """Get a specific game by ID."""
-        query = select(Game).options(
-            selectinload(Game.slots)
-        ).where(Game.id == game_id)
+        game, _ = await self.get_game_versioned(game_id)
+        return game
+
+    async def get_game_versioned(self, game_id: int) -> Tuple[GameOut, str]:
+        """A game with the ETag version of the cached copy it came from."""
+        # A missing game raises inside the loader, so misses are never cached
+        return await catalog_cache.get_or_load_versioned(
+            "game", {"id": game_id}, [game_tag(game_id)], lambda: self._load_game(game_id), GAME
+        )
+
+    async def _load_game(self, game_id: int) -> GameOut:
+        query = select(Game).where(Game.id == game_id)
         
         result = await self.db.execute(query)
         game = result.scalars().first()
@@ -46,69 +92,69 @@ class GameService:
         result = await self.db.execute(query)
         return result.scalars().first()
 
+    def _title_taken(self, title: str, exclude_game_id: Optional[int] = None):
+        """EXISTS another game with this title."""
+        # Aliased so it stays a standalone subquery inside UPDATE games
+        other = aliased(Game)
+        condition = exists().where(other.title == title)
+        if exclude_game_id is not None:
+            condition = condition.where(other.id != exclude_game_id)
+        return condition
+
     async def create_game(self, game_data: GameCreate) -> GameOut:
         """Create a new game."""
-        # Check if title already exists
-        existing_game = await self.get_game_by_title(game_data.title)
-        if existing_game:
+        # One INSERT ... SELECT guarded on the title being free
+        query = insert(Game).from_select(
+            ["title", "description", "background"],
+            select(
+                literal(game_data.title, Game.title.type),
+                literal(game_data.description, Game.description.type),
+                literal(game_data.background, Game.background.type)
+            ).where(~self._title_taken(game_data.title))
+        ).returning(*RETURNED_COLUMNS)
+        result = await self.db.execute(query)
+        row = result.first()
+        
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Game with this title already exists"
             )
         
-        # Create game object
-        game = Game(
-            title=game_data.title,
-            description=game_data.description,
-            background=game_data.background
-        )
-        
-        self.db.add(game)
-        await self.db.commit()
-        await self.db.refresh(game)
-        
-        # Load relationships for response
-        await self.db.refresh(game, ["slots"])
+        mark_stale(self.db, GAMES_TAG)
+        await commit_and_invalidate(self.db)
         
-        return GameOut.from_orm(game)
+        # A new game has no slots yet
+        return GameOut(**row._mapping, total_slots=0, available_slots=0)
 
     async def update_game(self, game_id: int, game_data: GameUpdate) -> GameOut:
         """Update an existing game."""
-        # Get the game
-        query = select(Game).where(Game.id == game_id)
-        result = await self.db.execute(query)
-        game = result.scalars().first()
-        
-        if not game:
+        values = {field: value for field, value in game_data.model_dump().items() if value is not None}
+        if not values:
+            return await self.get_game_by_id(game_id)
+        
+        # One UPDATE guarded on a new title being free, then one read for the slot counts
+        query = update(Game).where(Game.id == game_id).values(**values)
+        if game_data.title:
+            query = query.where(~self._title_taken(game_data.title, exclude_game_id=game_id))
+        result = await self.db.execute(query.returning(Game.id))
+        
+        if result.first() is None:
+            # Raises 404 for a missing game; otherwise the title was taken
+            await self.get_game_by_id(game_id)
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Game not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Game with this title already exists"
             )
         
-        # Check if new title conflicts with existing game
-        if game_data.title and game_data.title != game.title:
-            existing_game = await self.get_game_by_title(game_data.title)
-            if existing_game:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Game with this title already exists"
-                )
-        
-        # Update fields
-        if game_data.title is not None:
-            game.title = game_data.title
-        if game_data.description is not None:
-            game.description = game_data.description
-        if game_data.background is not None:
-            game.background = game_data.background
-        
-        await self.db.commit()
-        await self.db.refresh(game)
-        
-        # Load relationships for response
-        await self.db.refresh(game, ["slots"])
+        mark_stale(self.db, GAMES_TAG, game_tag(game_id))
+        await commit_and_invalidate(self.db)
         
-        return GameOut.from_orm(game)
+        # Re-read for the slot counts, replacing any stale copy of the game in the session
+        result = await self.db.execute(
+            select(Game).where(Game.id == game_id).execution_options(populate_existing=True)
+        )
+        return GameOut.from_orm(result.scalars().first())
 
     async def delete_game(self, game_id: int) -> GameDeleteResponse:
         """Delete a game."""
@@ -133,23 +179,18 @@ class GameService:
             )
         
         await self.db.delete(game)
-        await self.db.commit()
+        mark_stale(self.db, GAMES_TAG, game_tag(game_id))
+        await commit_and_invalidate(self.db)
         
         return GameDeleteResponse(message="Game deleted successfully")
 
-    async def get_games_with_available_slots(self, skip: int = 0, limit: int = 100) -> List[GameOut]:
+    async def get_games_with_available_slots(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[GameOut]:
         """Get games that have available slots."""
-        query = select(Game).options(
-            selectinload(Game.slots)
-        ).offset(skip).limit(limit)
+        # EXISTS stops at the first open slot per game
+        query = select(Game).where(Game.slots.any(~Slot.is_full))
+        query = paginate(query, self.KEYSET, skip, limit, cursor)
         
         result = await self.db.execute(query)
         games = result.scalars().all()
         
-        # Filter games with available slots
-        games_with_available_slots = [
-            game for game in games 
-            if any(not slot.is_full for slot in game.slots)
-        ]
-        
-        return [GameOut.from_orm(game) for game in games_with_available_slots]
+        return [GameOut.from_orm(game) for game in games]
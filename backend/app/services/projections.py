@@ -0,0 +1,33 @@
+"""Column projections of the response schemas the services return."""
+from sqlalchemy import func, select
+
+from app.core.projection import Projection
+from app.models.booking import Booking
+from app.models.slot import Slot
+from app.models.user import User
+from app.schemas.booking import BookingOut
+from app.schemas.slot import SlotOut
+from app.schemas.user import UserOut
+
+
+def _columns(model, schema, **expressions) -> dict:
+    """Schema fields mapped to the model's same-named columns, apart from the given expressions."""
+    return {
+        name: expressions[name] if name in expressions else getattr(model, name)
+        for name in schema.model_fields
+    }
+
+
+BOOKING_OUT = Projection(BookingOut, _columns(Booking, BookingOut))
+
+SLOT_OUT = Projection(SlotOut, _columns(
+    Slot, SlotOut,
+    slots_booked_count=Slot.booked_count,
+    is_full=Slot.booked_count >= Slot.capacity
+))
+
+USER_OUT = Projection(UserOut, _columns(
+    User, UserOut,
+    # Counted in the database instead of loading every booking to take len()
+    slot_booked=select(func.count(Booking.id)).where(Booking.user_id == User.id).correlate(User).scalar_subquery()
+))
@@ -1,104 +1,228 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from sqlalchemy.orm import selectinload, aliased
+from sqlalchemy import insert, update, exists, literal
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
-from datetime import datetime
+from pydantic import TypeAdapter
+from datetime import datetime, timedelta
 
 from app.models.slot import Slot
 from app.models.game import Game
-from app.schemas.slot import SlotCreate, SlotUpdate, SlotOut, SlotDeleteResponse
+from app.schemas.slot import (
+    SlotCreate, SlotUpdate, SlotOut, SlotDeleteResponse, SlotBulkCreate, SlotBulkCreateResponse, Weekday
+)
+from app.core.pagination import paginate
+from app.db.usage_rollup import mark_usage_stale
+from app.services.projections import SLOT_OUT
+from app.core.etag import version_columns
+from app.core.slot_events import OCCUPANCY_COLUMNS, occupancy_of, queue_slot_updates, slot_occupancy
+from app.core.cache import (
+    catalog_cache, commit_and_invalidate, mark_stale, game_tag, game_slots_tag, GAMES_TAG, SLOT_RANGES_TAG
+)
+
+
+WEEKDAY_NUMBERS = {weekday: number for number, weekday in enumerate(Weekday)}
+
+# Upper bound on slots generated by one bulk request
+MAX_BULK_SLOTS = 10000
+
+# Rows per multi-row INSERT, well under the bind parameter limits of SQLite and asyncpg
+BULK_INSERT_BATCH_SIZE = 1000
+
+SLOT_LIST = TypeAdapter(List[SlotOut])
+
+
+def slot_change_tags(game_id: int) -> Tuple[str, ...]:
+    """Catalog tags made stale by adding, changing or removing a slot of a game."""
+    return GAMES_TAG, game_tag(game_id), game_slots_tag(game_id), SLOT_RANGES_TAG
+
+
+def expand_schedule(schedule: SlotBulkCreate) -> List[Tuple[datetime, datetime]]:
+    """Expand a recurring schedule into (start, end) intervals in chronological order."""
+    weekdays = {WEEKDAY_NUMBERS[weekday] for weekday in schedule.weekdays}
+    duration = timedelta(minutes=schedule.slot_minutes)
+    intervals = []
+    
+    day = schedule.start_date
+    while day <= schedule.end_date:
+        if day.weekday() in weekdays:
+            start = datetime.combine(day, schedule.day_start)
+            day_end = datetime.combine(day, schedule.day_end)
+            while start + duration <= day_end:
+                intervals.append((start, start + duration))
+                start += duration
+                if len(intervals) > MAX_BULK_SLOTS:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Schedule generates more than {MAX_BULK_SLOTS} slots"
+                    )
+        day += timedelta(days=1)
+    
+    return intervals
+
+
+def split_overlapping(
+    candidates: List[Tuple[datetime, datetime]],
+    existing: List[Tuple[datetime, datetime]]
+) -> Tuple[List[Tuple[datetime, datetime]], int]:
+    """Sweep two start-ordered interval lists, keeping the candidates that overlap nothing existing."""
+    # A game's existing slots never overlap each other, so ordering by start also orders by end
+    kept = []
+    overlapping = 0
+    position = 0
+    for start, end in candidates:
+        while position < len(existing) and existing[position][1] <= start:
+            position += 1
+        if position < len(existing) and existing[position][0] < end:
+            overlapping += 1
+        else:
+            kept.append((start, end))
+    return kept, overlapping
 
 
 class SlotService:
+    # Slots list in start_time order; id breaks ties so the keyset is unique for cursors
+    KEYSET = (Slot.start_time, Slot.id)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_slots(self, skip: int = 0, limit: int = 100) -> List[SlotOut]:
+    async def get_slots(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[SlotOut]:
         """Get all slots with pagination."""
-        query = select(Slot).options(
-            selectinload(Slot.game),
-            selectinload(Slot.bookings)
-        ).offset(skip).limit(limit)
+        query = SLOT_OUT.select()
+        query = paginate(query, self.KEYSET, skip, limit, cursor)
         
         result = await self.db.execute(query)
-        slots = result.scalars().all()
-        
-        return [SlotOut.from_orm(slot) for slot in slots]
+        return SLOT_OUT.load(result.all())
+
+    async def get_slots_version(self, available: bool = False) -> tuple:
+        """Aggregates over the slots an uncached list filters to, without its paging."""
+        query = select(*version_columns(Slot))
+        if available:
+            query = query.where(~Slot.is_full)
+        result = await self.db.execute(query)
+        return tuple(result.one())
+
+    async def get_slot_version(self, slot_id: int) -> Optional[datetime]:
+        """The slot's updated_at; None for a missing slot."""
+        return await self.db.scalar(select(Slot.updated_at).where(Slot.id == slot_id))
 
     async def get_slot_by_id(self, slot_id: int) -> SlotOut:
         """Get a specific slot by ID."""
-        query = select(Slot).options(
-            selectinload(Slot.game),
-            selectinload(Slot.bookings)
-        ).where(Slot.id == slot_id)
+        query = SLOT_OUT.select().where(Slot.id == slot_id)
         
         result = await self.db.execute(query)
-        slot = result.scalars().first()
+        row = result.first()
         
-        if not slot:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Slot not found"
             )
         
-        return SlotOut.from_orm(slot)
+        return SLOT_OUT.load([row])[0]
 
-    async def get_slots_by_game(self, game_id: int, skip: int = 0, limit: int = 100) -> List[SlotOut]:
+    async def get_slots_by_game(self, game_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[SlotOut]:
         """Get all slots for a specific game."""
-        query = select(Slot).options(
-            selectinload(Slot.game),
-            selectinload(Slot.bookings)
-        ).where(Slot.game_id == game_id).offset(skip).limit(limit)
+        slots, _ = await self.get_slots_by_game_versioned(game_id, skip, limit, cursor)
+        return slots
+
+    async def get_slots_by_game_versioned(
+        self,
+        game_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[SlotOut], str]:
+        """A page of a game's slots with the ETag version of the cached copy it came from."""
+        return await catalog_cache.get_or_load_versioned(
+            "slots_by_game", {"game_id": game_id, "skip": skip, "limit": limit, "cursor": cursor},
+            [game_slots_tag(game_id)], lambda: self._load_slots_by_game(game_id, skip, limit, cursor), SLOT_LIST
+        )
+
+    async def _load_slots_by_game(self, game_id: int, skip: int, limit: int, cursor: Optional[str]) -> List[SlotOut]:
+        query = SLOT_OUT.select().where(Slot.game_id == game_id)
+        query = paginate(query, self.KEYSET, skip, limit, cursor)
         
         result = await self.db.execute(query)
-        slots = result.scalars().all()
-        
-        return [SlotOut.from_orm(slot) for slot in slots]
+        return SLOT_OUT.load(result.all())
 
-    async def get_available_slots(self, skip: int = 0, limit: int = 100) -> List[SlotOut]:
+    async def get_available_slots(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[SlotOut]:
         """Get all slots that are not full."""
-        query = select(Slot).options(
-            selectinload(Slot.game),
-            selectinload(Slot.bookings)
-        ).offset(skip).limit(limit)
+        # Filter before LIMIT so every page is full
+        query = SLOT_OUT.select().where(~Slot.is_full)
+        query = paginate(query, self.KEYSET, skip, limit, cursor)
         
         result = await self.db.execute(query)
-        slots = result.scalars().all()
-        
-        # Filter slots that are not full
-        available_slots = [slot for slot in slots if not slot.is_full]
-        
-        return [SlotOut.from_orm(slot) for slot in available_slots]
+        return SLOT_OUT.load(result.all())
 
-    async def get_slots_by_date_range(self, start_date: datetime, end_date: datetime, skip: int = 0, limit: int = 100) -> List[SlotOut]:
+    async def get_slots_by_date_range(self, start_date: datetime, end_date: datetime, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[SlotOut]:
         """Get slots within a specific date range."""
-        query = select(Slot).options(
-            selectinload(Slot.game),
-            selectinload(Slot.bookings)
-        ).where(
+        slots, _ = await self.get_slots_by_date_range_versioned(start_date, end_date, skip, limit, cursor)
+        return slots
+
+    async def get_slots_by_date_range_versioned(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[SlotOut], str]:
+        """A page of slots in a date range with the ETag version of the cached copy it came from."""
+        return await catalog_cache.get_or_load_versioned(
+            "slots_by_date_range",
+            {"start": start_date, "end": end_date, "skip": skip, "limit": limit, "cursor": cursor},
+            [SLOT_RANGES_TAG], lambda: self._load_slots_by_date_range(start_date, end_date, skip, limit, cursor), SLOT_LIST
+        )
+
+    async def _load_slots_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        skip: int,
+        limit: int,
+        cursor: Optional[str]
+    ) -> List[SlotOut]:
+        query = SLOT_OUT.select().where(
             Slot.start_time >= start_date,
             Slot.end_time <= end_date
-        ).offset(skip).limit(limit)
+        )
+        query = paginate(query, self.KEYSET, skip, limit, cursor)
         
         result = await self.db.execute(query)
-        slots = result.scalars().all()
-        
-        return [SlotOut.from_orm(slot) for slot in slots]
+        return SLOT_OUT.load(result.all())
+
+    def _overlaps_existing(self, game_id: int, start_time: datetime, end_time: datetime, exclude_slot_id: Optional[int] = None):
+        """EXISTS another slot of the game overlapping [start_time, end_time)."""
+        # Aliased so it stays a standalone subquery inside UPDATE slots
+        other = aliased(Slot)
+        condition = exists().where(
+            other.game_id == game_id,
+            other.start_time < end_time,
+            other.end_time > start_time
+        )
+        if exclude_slot_id is not None:
+            condition = condition.where(other.id != exclude_slot_id)
+        return condition
+
+    async def _raise_write_conflict(self, game_id: Optional[int]) -> None:
+        """Explain why a guarded slot write matched nothing: a missing game, otherwise an overlap."""
+        if game_id is not None:
+            game_result = await self.db.execute(select(Game.id).where(Game.id == game_id))
+            if game_result.first() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Game not found"
+                )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Slot time overlaps with existing slots for this game"
+        )
 
     async def create_slot(self, slot_data: SlotCreate) -> SlotOut:
         """Create a new slot."""
-        # Validate that the game exists
-        game_query = select(Game).where(Game.id == slot_data.game_id)
-        game_result = await self.db.execute(game_query)
-        game = game_result.scalars().first()
-        
-        if not game:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Game not found"
-            )
-        
         # Validate time logic
         if slot_data.start_time >= slot_data.end_time:
             raise HTTPException(
@@ -106,130 +230,140 @@ class SlotService:
                 detail="Start time must be before end time"
             )
         
-        # Check for overlapping slots for the same game
-        overlapping_query = select(Slot).where(
-            Slot.game_id == slot_data.game_id,
-            Slot.start_time < slot_data.end_time,
-            Slot.end_time > slot_data.start_time
-        )
-        overlapping_result = await self.db.execute(overlapping_query)
-        overlapping_slots = overlapping_result.scalars().all()
+        # One INSERT ... SELECT guarded on the game existing and no slot of it overlapping
+        query = insert(Slot).from_select(
+            ["start_time", "end_time", "capacity", "game_id"],
+            select(
+                literal(slot_data.start_time, Slot.start_time.type),
+                literal(slot_data.end_time, Slot.end_time.type),
+                literal(slot_data.capacity, Slot.capacity.type),
+                literal(slot_data.game_id, Slot.game_id.type)
+            ).where(
+                exists().where(Game.id == slot_data.game_id),
+                ~self._overlaps_existing(slot_data.game_id, slot_data.start_time, slot_data.end_time)
+            )
+        ).returning(Slot)
+        result = await self.db.execute(query)
+        slot = result.scalars().first()
+        
+        if not slot:
+            await self._raise_write_conflict(slot_data.game_id)
+        
+        mark_stale(self.db, *slot_change_tags(slot_data.game_id))
+        queue_slot_updates(self.db, [occupancy_of(slot)])
+        await commit_and_invalidate(self.db)
         
-        if overlapping_slots:
+        return SlotOut.from_orm(slot)
+
+    async def create_slots_bulk(self, schedule: SlotBulkCreate) -> SlotBulkCreateResponse:
+        """Create every slot of a recurring schedule in one transaction."""
+        game = await self.db.scalar(select(Game.id).where(Game.id == schedule.game_id))
+        if not game:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Slot time overlaps with existing slots for this game"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
             )
         
-        # Create slot object
-        slot = Slot(
-            start_time=slot_data.start_time,
-            end_time=slot_data.end_time,
-            capacity=slot_data.capacity,
-            game_id=slot_data.game_id
-        )
+        candidates = expand_schedule(schedule)
+        if not candidates:
+            return SlotBulkCreateResponse(created=0, skipped_overlapping=0)
         
-        self.db.add(slot)
-        await self.db.commit()
-        await self.db.refresh(slot)
+        # One range query for the game's slots in the window, then an in-memory sweep
+        existing_query = select(Slot.start_time, Slot.end_time).where(
+            Slot.game_id == schedule.game_id,
+            Slot.start_time < candidates[-1][1],
+            Slot.end_time > candidates[0][0]
+        ).order_by(Slot.start_time)
+        existing_result = await self.db.execute(existing_query)
+        slots, overlapping = split_overlapping(candidates, [tuple(row) for row in existing_result.all()])
         
-        # Load relationships for response
-        await self.db.refresh(slot, ["game", "bookings"])
+        if overlapping and not schedule.skip_overlapping:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{overlapping} generated slots overlap existing slots for this game"
+            )
         
-        return SlotOut.from_orm(slot)
+        rows = [
+            {"start_time": start, "end_time": end, "capacity": schedule.capacity, "game_id": schedule.game_id}
+            for start, end in slots
+        ]
+        for offset in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            result = await self.db.execute(
+                insert(Slot).values(rows[offset:offset + BULK_INSERT_BATCH_SIZE]).returning(*OCCUPANCY_COLUMNS)
+            )
+            queue_slot_updates(self.db, [slot_occupancy(row) for row in result.all()])
+        if rows:
+            mark_stale(self.db, *slot_change_tags(schedule.game_id))
+        await commit_and_invalidate(self.db)
+        
+        return SlotBulkCreateResponse(
+            created=len(slots),
+            skipped_overlapping=overlapping,
+            first_start_time=slots[0][0] if slots else None,
+            last_end_time=slots[-1][1] if slots else None
+        )
 
     async def update_slot(self, slot_id: int, slot_data: SlotUpdate) -> SlotOut:
         """Update an existing slot."""
-        # Get the slot with relationships
-        query = select(Slot).options(
-            selectinload(Slot.bookings)
-        ).where(Slot.id == slot_id)
+        # Get the slot and whether it has bookings in one query
+        query = select(Slot, Slot.bookings.any()).where(Slot.id == slot_id)
         result = await self.db.execute(query)
-        slot = result.scalars().first()
+        row = result.first()
         
-        if not slot:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Slot not found"
             )
+        slot, has_bookings = row
         
         # Check if slot has bookings and prevent certain updates
-        if slot.bookings and (slot_data.start_time is not None or slot_data.end_time is not None):
+        if has_bookings and (slot_data.start_time is not None or slot_data.end_time is not None):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot modify time of slot with existing bookings"
             )
         
-        # Validate game exists if changing game_id
-        if slot_data.game_id is not None and slot_data.game_id != slot.game_id:
-            game_query = select(Game).where(Game.id == slot_data.game_id)
-            game_result = await self.db.execute(game_query)
-            game = game_result.scalars().first()
-            
-            if not game:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Game not found"
-                )
+        start_time = slot_data.start_time if slot_data.start_time is not None else slot.start_time
+        end_time = slot_data.end_time if slot_data.end_time is not None else slot.end_time
+        game_id = slot_data.game_id if slot_data.game_id is not None else slot.game_id
         
         # Validate time logic if updating times
-        if slot_data.start_time is not None and slot_data.end_time is not None:
-            if slot_data.start_time >= slot_data.end_time:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Start time must be before end time"
-                )
-        elif slot_data.start_time is not None:
-            if slot_data.start_time >= slot.end_time:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Start time must be before end time"
-                )
-        elif slot_data.end_time is not None:
-            if slot.start_time >= slot_data.end_time:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Start time must be before end time"
-                )
-        
-        # Check for overlapping slots if updating times or game
-        if (slot_data.start_time is not None or slot_data.end_time is not None or slot_data.game_id is not None):
-            start_time = slot_data.start_time if slot_data.start_time is not None else slot.start_time
-            end_time = slot_data.end_time if slot_data.end_time is not None else slot.end_time
-            game_id = slot_data.game_id if slot_data.game_id is not None else slot.game_id
-            
-            overlapping_query = select(Slot).where(
-                Slot.id != slot_id,
-                Slot.game_id == game_id,
-                Slot.start_time < end_time,
-                Slot.end_time > start_time
+        if (slot_data.start_time is not None or slot_data.end_time is not None) and start_time >= end_time:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Start time must be before end time"
             )
-            overlapping_result = await self.db.execute(overlapping_query)
-            overlapping_slots = overlapping_result.scalars().all()
-            
-            if overlapping_slots:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Slot time overlaps with existing slots for this game"
-                )
-        
-        # Update fields
-        if slot_data.start_time is not None:
-            slot.start_time = slot_data.start_time
-        if slot_data.end_time is not None:
-            slot.end_time = slot_data.end_time
-        if slot_data.capacity is not None:
-            slot.capacity = slot_data.capacity
-        if slot_data.game_id is not None:
-            slot.game_id = slot_data.game_id
         
-        await self.db.commit()
-        await self.db.refresh(slot)
+        values = {field: value for field, value in slot_data.model_dump().items() if value is not None}
+        if not values:
+            return SlotOut.from_orm(slot)
         
-        # Load relationships for response
-        await self.db.refresh(slot, ["game", "bookings"])
-        
-        return SlotOut.from_orm(slot)
+        if slot_data.start_time is not None:
+            # The rollup row of the hour the slot leaves
+            await mark_usage_stale(self.db, Slot.id == slot_id)
+        
+        # One UPDATE ... RETURNING, guarded on a new game existing and the new times not overlapping
+        query = update(Slot).where(Slot.id == slot_id).values(**values)
+        # Read before populate_existing refreshes `slot` with the new values
+        previous_game_id = slot.game_id
+        game_changed = game_id != previous_game_id
+        if game_changed:
+            query = query.where(exists().where(Game.id == game_id))
+        if slot_data.start_time is not None or slot_data.end_time is not None or game_changed:
+            query = query.where(~self._overlaps_existing(game_id, start_time, end_time, exclude_slot_id=slot_id))
+        
+        result = await self.db.execute(query.returning(Slot).execution_options(populate_existing=True))
+        updated = result.scalars().first()
+        
+        if not updated:
+            await self._raise_write_conflict(game_id if game_changed else None)
+        
+        mark_stale(self.db, *slot_change_tags(previous_game_id), *slot_change_tags(game_id))
+        queue_slot_updates(self.db, [occupancy_of(updated)])
+        await commit_and_invalidate(self.db)
+        
+        return SlotOut.from_orm(updated)
 
     async def delete_slot(self, slot_id: int) -> SlotDeleteResponse:
         """Delete a slot."""
@@ -253,7 +387,10 @@ class SlotService:
                 detail="Cannot delete slot with existing bookings. Please cancel bookings first."
             )
         
+        await mark_usage_stale(self.db, Slot.id == slot_id)
         await self.db.delete(slot)
-        await self.db.commit()
+        mark_stale(self.db, *slot_change_tags(slot.game_id))
+        queue_slot_updates(self.db, [occupancy_of(slot, removed=True)])
+        await commit_and_invalidate(self.db)
         
         return SlotDeleteResponse(message="Slot deleted successfully")
@@ -1,48 +1,64 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased
+from sqlalchemy import func, insert, update, exists, or_, literal
 from typing import List, Optional
 from fastapi import HTTPException, status
 
-from app.models.user import User
+from app.models.user import User, UserRole as ModelUserRole
+from app.models.booking import Booking, ACTIVE_BOOKING_STATUSES
 from app.schemas.user import UserRole
 from app.schemas.user import UserCreate, UserUpdate, UserOut, UserDeleteResponse
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async
+from app.services.booking_service import BookingService
+from app.core.pagination import paginate
+from app.core.cache import commit_and_invalidate
+from app.db.usage_rollup import mark_usage_stale
+from app.models.slot import Slot
+from app.services.projections import USER_OUT
+from app.core.dependencies import invalidate_principal
+
+
+# What UserOut needs from a written row, besides slot_booked
+RETURNED_COLUMNS = (
+    User.id, User.email, User.username, User.description, User.profile_picture,
+    User.role, User.department_id, User.created_at, User.updated_at
+)
 
 
 class UserService:
+    KEYSET = (User.id,)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_users(self, skip: int = 0, limit: int = 100) -> List[UserOut]:
-        """Get all users with pagination."""
-        query = select(User).options(
-            selectinload(User.department),
-            selectinload(User.bookings)
-        ).offset(skip).limit(limit)
-        
+    async def _get_users(self, conditions: list, skip: int, limit: int, cursor: Optional[str], fields: Optional[List[str]]) -> list:
+        query = paginate(USER_OUT.select(fields).where(*conditions), self.KEYSET, skip, limit, cursor)
         result = await self.db.execute(query)
-        users = result.scalars().all()
-        
-        return [UserOut.from_orm(user) for user in users]
+        return USER_OUT.load(result.all(), fields)
+
+    async def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[UserOut]:
+        """Get all users with pagination; only `fields` (as dicts) for a sparse fieldset."""
+        return await self._get_users([], skip, limit, cursor, fields)
 
     async def get_user_by_id(self, user_id: int) -> UserOut:
         """Get a specific user by ID."""
-        query = select(User).options(
-            selectinload(User.department),
-            selectinload(User.bookings)
-        ).where(User.id == user_id)
+        result = await self.db.execute(USER_OUT.select().where(User.id == user_id))
+        row = result.first()
         
-        result = await self.db.execute(query)
-        user = result.scalars().first()
-        
-        if not user:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        return UserOut.from_orm(user)
+        return USER_OUT.load([row])[0]
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email (for internal use)."""
@@ -56,32 +72,46 @@ class UserService:
         result = await self.db.execute(query)
         return result.scalars().first()
 
+    def _to_out(self, user, slot_booked: int) -> UserOut:
+        return UserOut(**{column.key: getattr(user, column.key) for column in RETURNED_COLUMNS}, slot_booked=slot_booked)
+
+    def _require_identifier(self, email: Optional[str], username: Optional[str]) -> None:
+        """Writes bypass the model's validator, so check the same rule here."""
+        if not email and not username:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Either email or username must be provided"
+            )
+
     async def create_user(self, user_data: UserCreate) -> UserOut:
         """Create a new user."""
-        # Check if email already exists
+        self._require_identifier(user_data.email, user_data.username)
+        
+        # Check email and username in one query, before paying for the password hash
+        taken = []
         if user_data.email:
-            existing_user = await self.get_user_by_email(user_data.email)
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
-        
-        # Check if username already exists
+            taken.append(User.email == user_data.email)
         if user_data.username:
-            existing_user = await self.get_user_by_username(user_data.username)
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already taken"
-                )
+            taken.append(User.username == user_data.username)
+        existing_result = await self.db.execute(select(User.email, User.username).where(or_(*taken)))
+        existing = existing_result.all()
+        
+        if user_data.email and any(row.email == user_data.email for row in existing):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+        if existing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username already taken"
+            )
         
         # Hash the password
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         
-        # Create user object - convert schema enum to model enum
-        from app.models.user import UserRole as ModelUserRole
-        user = User(
+        # Insert the user - convert schema enum to model enum
+        query = insert(User).values(
             email=user_data.email,
             username=user_data.username,
             password=hashed_password,
@@ -89,68 +119,79 @@ class UserService:
             profile_picture=user_data.profile_picture,
             role=ModelUserRole(user_data.role.value),
             department_id=user_data.department_id
-        )
-        
-        self.db.add(user)
+        ).returning(*RETURNED_COLUMNS)
+        result = await self.db.execute(query)
+        user = result.first()
         await self.db.commit()
-        await self.db.refresh(user)
         
-        # Load relationships for response
-        await self.db.refresh(user, ["department", "bookings"])
-        
-        return UserOut.from_orm(user)
+        # A new user has no bookings yet
+        return self._to_out(user, 0)
 
     async def update_user(self, user_id: int, user_data: UserUpdate) -> UserOut:
         """Update an existing user."""
-        # Get the user
-        query = select(User).where(User.id == user_id)
+        # Get the user, their booking count and any email/username clash in one query
+        other = aliased(User)
+        email_taken = (
+            exists().where(other.email == user_data.email, other.id != user_id)
+            if user_data.email else literal(False)
+        )
+        username_taken = (
+            exists().where(other.username == user_data.username, other.id != user_id)
+            if user_data.username else literal(False)
+        )
+        booking_count = select(func.count(Booking.id)).where(Booking.user_id == User.id).scalar_subquery()
+        query = select(User, booking_count, email_taken, username_taken).where(User.id == user_id)
         result = await self.db.execute(query)
-        user = result.scalars().first()
+        row = result.first()
         
-        if not user:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
+        user, slot_booked, email_is_taken, username_is_taken = row
         
         # Check if email already exists (if being updated)
-        if user_data.email and user_data.email != user.email:
-            existing_user = await self.get_user_by_email(user_data.email)
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
+        if email_is_taken:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
         
         # Check if username already exists (if being updated)
-        if user_data.username and user_data.username != user.username:
-            existing_user = await self.get_user_by_username(user_data.username)
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already taken"
-                )
+        if username_is_taken:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username already taken"
+            )
         
         # Update fields
-        update_data = user_data.dict(exclude_unset=True)
+        update_data = user_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return self._to_out(user, slot_booked)
+        self._require_identifier(
+            update_data["email"] if "email" in update_data else user.email,
+            update_data["username"] if "username" in update_data else user.username
+        )
         
         if "password" in update_data:
-            update_data["password"] = get_password_hash(update_data["password"])
+            update_data["password"] = await get_password_hash_async(update_data["password"])
         
         if "role" in update_data:
-            from app.models.user import UserRole as ModelUserRole
             update_data["role"] = ModelUserRole(update_data["role"].value)
         
-        for field, value in update_data.items():
-            setattr(user, field, value)
+        if update_data.get("department_id", user.department_id) != user.department_id:
+            # Usage is rolled up by the booker's current department
+            await mark_usage_stale(self.db, Slot.id.in_(select(Booking.slot_id).where(Booking.user_id == user_id)))
         
+        result = await self.db.execute(
+            update(User).where(User.id == user_id).values(**update_data).returning(*RETURNED_COLUMNS)
+        )
+        updated = result.first()
         await self.db.commit()
-        await self.db.refresh(user)
-        
-        # Load relationships for response
-        await self.db.refresh(user, ["department", "bookings"])
+        invalidate_principal(user_id)
         
-        return UserOut.from_orm(user)
+        return self._to_out(updated, slot_booked)
 
     async def delete_user(self, user_id: int) -> UserDeleteResponse:
         """Delete a user."""
@@ -165,32 +206,42 @@ class UserService:
                 detail="User not found"
             )
         
+        # Release the seats held by the user's active bookings
+        seats_query = select(Booking.slot_id, func.count(Booking.id)).where(
+            Booking.user_id == user_id,
+            Booking.status.in_(ACTIVE_BOOKING_STATUSES)
+        ).group_by(Booking.slot_id)
+        seats_result = await self.db.execute(seats_query)
+        released_seats = {slot_id: -count for slot_id, count in seats_result.all()}
+        await BookingService(self.db).adjust_slot_counts(released_seats)
+        
+        await mark_usage_stale(self.db, Slot.id.in_(select(Booking.slot_id).where(Booking.user_id == user_id)))
+        
         # Delete the user
         await self.db.delete(user)
-        await self.db.commit()
+        await commit_and_invalidate(self.db)
+        invalidate_principal(user_id)
         
         return UserDeleteResponse(message="User deleted successfully")
 
-    async def get_users_by_department(self, department_id: int, skip: int = 0, limit: int = 100) -> List[UserOut]:
+    async def get_users_by_department(
+        self,
+        department_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[UserOut]:
         """Get all users in a specific department."""
-        query = select(User).options(
-            selectinload(User.department),
-            selectinload(User.bookings)
-        ).where(User.department_id == department_id).offset(skip).limit(limit)
-        
-        result = await self.db.execute(query)
-        users = result.scalars().all()
-        
-        return [UserOut.from_orm(user) for user in users]
+        return await self._get_users([User.department_id == department_id], skip, limit, cursor, fields)
 
-    async def get_users_by_role(self, role: UserRole, skip: int = 0, limit: int = 100) -> List[UserOut]:
+    async def get_users_by_role(
+        self,
+        role: UserRole,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[UserOut]:
         """Get all users with a specific role."""
-        query = select(User).options(
-            selectinload(User.department),
-            selectinload(User.bookings)
-        ).where(User.role == role).offset(skip).limit(limit)
-        
-        result = await self.db.execute(query)
-        users = result.scalars().all()
-        
-        return [UserOut.from_orm(user) for user in users]
+        return await self._get_users([User.role == role], skip, limit, cursor, fields)
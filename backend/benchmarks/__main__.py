@@ -0,0 +1,141 @@
+"""Benchmark harness for the booking hot path.
+
+Usage (from backend/):
+    python -m benchmarks seed --database-url sqlite+aiosqlite:///bench.db --bookings 10000
+    python -m benchmarks run --database-url sqlite+aiosqlite:///bench.db --bookings 10000 \\
+        --requests 200 --concurrency 10 --baseline benchmarks/baselines/sqlite-10k.json
+    python -m benchmarks serialize --rows 1000
+
+`run` serves the app in-process through httpx's ASGI transport, which also lets it count
+queries per request. Pass --base-url to load a running server instead (no query counts).
+`serialize` times list responses of every *Out schema through FastAPI's default path and
+the TypeAdapter fast path, without a database.
+"""
+import argparse
+import asyncio
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+
+
+def _configure_app(database_url: str) -> None:
+    # Settings are read at import time, so point the app at the benchmark database first
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("DB_ECHO", "false")
+
+
+async def seed_command(args) -> int:
+    _configure_app(args.database_url)
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from benchmarks.seed import Scale, seed, describe
+
+    scale = Scale.for_bookings(args.bookings)
+    engine = create_async_engine(args.database_url)
+    try:
+        await seed(engine, scale)
+    finally:
+        await engine.dispose()
+    print(f"Seeded {describe(scale)}")
+    return 0
+
+
+async def run_command(args) -> int:
+    _configure_app(args.database_url)
+    import httpx
+    from benchmarks.load import SCENARIOS, QueryCounter, build_context, run_scenario
+    from benchmarks.report import Report
+    from benchmarks.seed import Scale, describe
+
+    names = args.scenarios.split(",") if args.scenarios else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}; choose from {', '.join(SCENARIOS)}")
+        return 2
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+        query_counter = None
+    else:
+        from app.main import app
+        from app.db.session import engine
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark", timeout=60)
+        query_counter = QueryCounter(engine)
+
+    scale = Scale.for_bookings(args.bookings)
+    report = Report(meta={
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database": args.database_url.split(":", 1)[0],
+        "target": args.base_url or "in-process",
+        "scale": describe(scale),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "python": platform.python_version(),
+    })
+
+    async with client:
+        ctx = await build_context(client, scale, args.user_pool)
+        for name in names:
+            # A few untimed requests first, so connection setup isn't measured
+            await run_scenario(client, SCENARIOS[name], ctx, args.concurrency, args.concurrency, seed=-1)
+            report.scenarios[name] = await run_scenario(
+                client, SCENARIOS[name], ctx, args.requests, args.concurrency, query_counter=query_counter
+            )
+
+    print(report.format_table())
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report.to_json() + "\n")
+        print(f"Wrote {args.output}")
+
+    if args.baseline:
+        regressions = report.compare(Report.load(args.baseline), tolerance=args.tolerance)
+        if regressions:
+            print(f"Regressions against {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+def serialize_command(args) -> int:
+    from benchmarks.serialization import format_table, run
+
+    print(format_table(run(rows=args.rows, repeat=args.repeat)))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = subparsers.add_parser("seed", help="recreate the schema and fill it with benchmark data")
+    run_parser = subparsers.add_parser("run", help="load the API and report latency, throughput and queries")
+    serialize_parser = subparsers.add_parser("serialize", help="time list serialization per response schema")
+    for subparser in (seed_parser, run_parser):
+        subparser.add_argument("--database-url", default="sqlite+aiosqlite:///bench.db")
+        subparser.add_argument("--bookings", type=int, default=10_000, help="scale; other tables are sized from it")
+
+    run_parser.add_argument("--base-url", help="load a running server instead of the in-process app")
+    run_parser.add_argument("--scenarios", help="comma-separated subset of scenarios to run")
+    run_parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    run_parser.add_argument("--concurrency", type=int, default=20)
+    run_parser.add_argument("--user-pool", type=int, default=50, help="normal users logged in up front")
+    run_parser.add_argument("--output", help="write the results as JSON")
+    run_parser.add_argument("--baseline", help="JSON results to compare against; exits 1 on regression")
+    run_parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown")
+
+    serialize_parser.add_argument("--rows", type=int, default=1000, help="items per list")
+    serialize_parser.add_argument("--repeat", type=int, default=5, help="runs per path; the fastest is reported")
+
+    args = parser.parse_args()
+    if args.command == "serialize":
+        return serialize_command(args)
+    command = seed_command if args.command == "seed" else run_command
+    return asyncio.run(command(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Drive the API with concurrent httpx clients and time each scenario."""
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.report import ScenarioResult
+from benchmarks.seed import BENCH_PASSWORD, Scale
+
+API = "/api/v1"
+
+
+@dataclass
+class Context:
+    scale: Scale
+    admin_headers: dict
+    # (user_id, headers) for a pool of logged-in normal users
+    users: List[Tuple[int, dict]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    # Builds (path, request kwargs) for one request
+    build: Callable[[random.Random, Context], Tuple[str, dict]]
+    # Statuses that count as a correct answer, e.g. 400 when a random slot is already full
+    accepted: frozenset = frozenset({200})
+
+
+def _user(rng: random.Random, ctx: Context) -> Tuple[int, dict]:
+    return rng.choice(ctx.users)
+
+
+def _create_booking(rng: random.Random, ctx: Context) -> Tuple[str, dict]:
+    user_id, headers = _user(rng, ctx)
+    slot_id = rng.randint(1, ctx.scale.slots)
+    return f"{API}/bookings/", {"headers": headers, "json": {"user_id": user_id, "slot_id": slot_id}}
+
+
+def _login(rng: random.Random, ctx: Context) -> Tuple[str, dict]:
+    username = f"bench{rng.randint(2, ctx.scale.users)}"
+    return f"{API}/auth/login", {"json": {"username": username, "password": BENCH_PASSWORD}}
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario for scenario in [
+        Scenario("bookings_create", "POST", _create_booking, frozenset({201, 400})),
+        Scenario("bookings_list", "GET", lambda rng, ctx: (f"{API}/bookings/?limit=50", {"headers": ctx.admin_headers})),
+        Scenario("slots_available", "GET", lambda rng, ctx: (f"{API}/slots/available/?limit=50", {"headers": _user(rng, ctx)[1]})),
+        Scenario("games", "GET", lambda rng, ctx: (f"{API}/games/?limit=50", {"headers": _user(rng, ctx)[1]})),
+        Scenario("auth_me", "GET", lambda rng, ctx: (f"{API}/auth/me", {"headers": _user(rng, ctx)[1]})),
+        Scenario("auth_login", "POST", _login),
+    ]
+}
+
+
+class QueryCounter:
+    """Counts statements sent by an engine while active; only available when the app runs in-process."""
+
+    def __init__(self, engine):
+        self.sync_engine = engine.sync_engine
+        self.count = 0
+
+    def _before_cursor_execute(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+async def _login_headers(client: httpx.AsyncClient, username: str) -> dict:
+    response = await client.post(f"{API}/auth/login", json={"username": username, "password": BENCH_PASSWORD})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def build_context(client: httpx.AsyncClient, scale: Scale, user_pool: int) -> Context:
+    """Log in the admin and a pool of normal users up front, so login cost only shows in its own scenario."""
+    admin_headers = await _login_headers(client, "bench1")
+    user_ids = range(2, min(scale.users, user_pool + 1) + 1)
+    headers = await asyncio.gather(*(_login_headers(client, f"bench{user_id}") for user_id in user_ids))
+    return Context(scale=scale, admin_headers=admin_headers, users=list(zip(user_ids, headers)))
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: Context,
+    requests: int,
+    concurrency: int,
+    seed: int = 0,
+    query_counter: Optional[QueryCounter] = None
+) -> ScenarioResult:
+    """Send `requests` requests from `concurrency` workers and summarize their latencies."""
+    rng = random.Random(seed)
+    plan = [scenario.build(rng, ctx) for _ in range(requests)]
+    latencies: List[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        while next_index < len(plan):
+            path, kwargs = plan[next_index]
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, path, **kwargs)
+                ok = response.status_code in scenario.accepted
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    if query_counter is not None:
+        with query_counter:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        queries = query_counter.count
+    else:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        queries = None
+    elapsed = time.perf_counter() - started
+
+    return ScenarioResult.from_samples(scenario.name, latencies, errors, elapsed, queries)
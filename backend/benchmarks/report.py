@@ -0,0 +1,116 @@
+"""Summarize scenario timings and compare them with a stored baseline."""
+import json
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, round(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    errors: int
+    elapsed_seconds: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    throughput_rps: float
+    queries_per_request: Optional[float] = None
+
+    @classmethod
+    def from_samples(
+        cls,
+        name: str,
+        latencies: List[float],
+        errors: int,
+        elapsed_seconds: float,
+        queries: Optional[int] = None
+    ) -> "ScenarioResult":
+        requests = len(latencies)
+        return cls(
+            name=name,
+            requests=requests,
+            errors=errors,
+            elapsed_seconds=round(elapsed_seconds, 3),
+            p50_ms=round(percentile(latencies, 0.50) * 1000, 2),
+            p95_ms=round(percentile(latencies, 0.95) * 1000, 2),
+            p99_ms=round(percentile(latencies, 0.99) * 1000, 2),
+            throughput_rps=round(requests / elapsed_seconds, 1) if elapsed_seconds else 0.0,
+            queries_per_request=round(queries / requests, 2) if queries is not None and requests else None,
+        )
+
+
+@dataclass
+class Regression:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return f"{self.scenario}: {self.metric} {self.baseline} -> {self.current}"
+
+
+@dataclass
+class Report:
+    meta: dict
+    scenarios: Dict[str, ScenarioResult] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"meta": self.meta, "scenarios": {name: asdict(result) for name, result in self.scenarios.items()}},
+            indent=2
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "Report":
+        with open(path) as file:
+            data = json.load(file)
+        return cls(
+            meta=data.get("meta", {}),
+            scenarios={name: ScenarioResult(**result) for name, result in data["scenarios"].items()}
+        )
+
+    def compare(self, baseline: "Report", tolerance: float = 0.2) -> List[Regression]:
+        """Scenarios that got slower, lost throughput or issue more queries than the baseline."""
+        regressions = []
+        for name, current in self.scenarios.items():
+            previous = baseline.scenarios.get(name)
+            if previous is None:
+                continue
+            for metric in ("p50_ms", "p95_ms", "p99_ms"):
+                if getattr(current, metric) > getattr(previous, metric) * (1 + tolerance):
+                    regressions.append(Regression(name, metric, getattr(previous, metric), getattr(current, metric)))
+            if current.throughput_rps < previous.throughput_rps * (1 - tolerance):
+                regressions.append(Regression(name, "throughput_rps", previous.throughput_rps, current.throughput_rps))
+            # Query counts are deterministic, so any increase is a regression
+            if (
+                current.queries_per_request is not None
+                and previous.queries_per_request is not None
+                and current.queries_per_request > previous.queries_per_request
+            ):
+                regressions.append(
+                    Regression(name, "queries_per_request", previous.queries_per_request, current.queries_per_request)
+                )
+            if current.errors > previous.errors:
+                regressions.append(Regression(name, "errors", previous.errors, current.errors))
+        return regressions
+
+    def format_table(self) -> str:
+        header = f"{'scenario':<18}{'reqs':>7}{'errs':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'q/req':>8}"
+        lines = [header, "-" * len(header)]
+        for result in self.scenarios.values():
+            queries = "-" if result.queries_per_request is None else f"{result.queries_per_request:g}"
+            lines.append(
+                f"{result.name:<18}{result.requests:>7}{result.errors:>6}{result.p50_ms:>10}"
+                f"{result.p95_ms:>10}{result.p99_ms:>10}{result.throughput_rps:>10}{queries:>8}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,112 @@
+"""Seed a benchmark database at a configurable scale with set-based INSERT ... SELECT statements."""
+from dataclasses import dataclass, asdict
+
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+BENCH_PASSWORD = "benchpass"
+SLOT_CAPACITY = 10
+# bench1 is the admin; everyone else is a normal user
+USER_ROLE = "CASE WHEN i = 1 THEN 'ADMIN' ELSE 'NORMAL' END"
+# 70% confirmed, 20% pending, 10% cancelled
+BOOKING_STATUS = "CASE i % 10 WHEN 0 THEN 'CANCELLED' WHEN 1 THEN 'PENDING' WHEN 2 THEN 'PENDING' ELSE 'CONFIRMED' END"
+
+
+@dataclass
+class Scale:
+    departments: int
+    users: int
+    games: int
+    slots: int
+    bookings: int
+
+    @classmethod
+    def for_bookings(cls, bookings: int) -> "Scale":
+        """Derive the other table sizes from the booking count, about half a slot's capacity per slot."""
+        return cls(
+            departments=20,
+            users=max(100, bookings // 50),
+            games=50,
+            slots=max(10, bookings // (SLOT_CAPACITY // 2)),
+            bookings=bookings,
+        )
+
+
+def _series(dialect: str, alias: str = "s") -> str:
+    """FROM clause yielding integers i = 1..:n."""
+    if dialect == "postgresql":
+        return f"generate_series(1, :n) AS {alias}(i)"
+    return f"(WITH RECURSIVE seq(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < :n) SELECT i FROM seq) AS {alias}"
+
+
+def _cast_enum(dialect: str, expression: str, enum_type: str) -> str:
+    # PostgreSQL won't implicitly cast a text expression to an enum column
+    if dialect == "postgresql":
+        return f"({expression})::{enum_type}"
+    return expression
+
+
+def _interval_minutes(dialect: str, minutes: str) -> str:
+    if dialect == "postgresql":
+        return f"now()::timestamp - interval '30 days' + ({minutes}) * interval '1 minute'"
+    return f"datetime('now', '-30 days', '+' || ({minutes}) || ' minutes')"
+
+
+async def seed(engine: AsyncEngine, scale: Scale) -> None:
+    """Drop and recreate the schema, then fill it to the requested scale."""
+    from app.db.base import Base
+    from app.core.security import get_password_hash
+    from app.models.slot import Slot, active_booking_count
+
+    dialect = engine.dialect.name
+    series = _series(dialect)
+    password = get_password_hash(BENCH_PASSWORD)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+        await conn.execute(
+            text(f"INSERT INTO departments (title) SELECT 'Department ' || i FROM {series}"),
+            {"n": scale.departments}
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO users (username, email, password, role, department_id) "
+                "SELECT 'bench' || i, 'bench' || i || '@example.com', :password, "
+                f"{_cast_enum(dialect, USER_ROLE, 'userrole')}, 1 + i % :departments "
+                f"FROM {series}"
+            ),
+            {"n": scale.users, "password": password, "departments": scale.departments}
+        )
+        await conn.execute(
+            text(f"INSERT INTO games (title) SELECT 'Game ' || i FROM {series}"),
+            {"n": scale.games}
+        )
+        # One slot every 15 minutes from 30 days ago, rotating through games so a game's slots never overlap
+        await conn.execute(
+            text(
+                "INSERT INTO slots (start_time, end_time, capacity, game_id) "
+                f"SELECT {_interval_minutes(dialect, 'i * 15')}, {_interval_minutes(dialect, 'i * 15 + 60')}, "
+                f":capacity, 1 + i % :games FROM {series}"
+            ),
+            {"n": scale.slots, "capacity": SLOT_CAPACITY, "games": scale.games}
+        )
+        # Booking i goes to slot i % slots; the k-th booking of a slot gets a distinct user
+        await conn.execute(
+            text(
+                "INSERT INTO bookings (user_id, slot_id, status) "
+                "SELECT 1 + ((i % :slots) * 7 + i / :slots) % :users, 1 + i % :slots, "
+                f"{_cast_enum(dialect, BOOKING_STATUS, 'bookingstatus')} "
+                f"FROM {series}"
+            ),
+            {"n": scale.bookings, "slots": scale.slots, "users": scale.users}
+        )
+        await conn.execute(update(Slot).values(booked_count=active_booking_count()))
+
+        if dialect == "postgresql":
+            await conn.execute(text("ANALYZE"))
+
+
+def describe(scale: Scale) -> str:
+    return ", ".join(f"{name}={count}" for name, count in asdict(scale).items())
@@ -0,0 +1,135 @@
+"""Compare FastAPI's default list serialization with the TypeAdapter fast path, per *Out schema.
+
+Both paths start from the same rows as a service reads them (one mapping per row):
+
+- default: one model_validate per row, then what FastAPI does with a returned list and a
+  response_model (dump, re-validate, serialize, jsonable_encoder, json.dumps)
+- fast: one TypeAdapter(List[schema]).validate_python call, then dump_json straight to bytes
+"""
+import importlib
+import inspect
+import pkgutil
+import time
+import typing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, List, Type
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel, TypeAdapter
+
+import app.schemas
+
+
+def out_schemas() -> Dict[str, Type[BaseModel]]:
+    """Every response schema (*Out) defined in app.schemas, by name."""
+    schemas = {}
+    for module_info in pkgutil.iter_modules(app.schemas.__path__):
+        module = importlib.import_module(f"app.schemas.{module_info.name}")
+        for name, value in vars(module).items():
+            if (
+                name.endswith("Out") and inspect.isclass(value) and issubclass(value, BaseModel)
+                and value.__module__ == module.__name__
+            ):
+                schemas[name] = value
+    return dict(sorted(schemas.items()))
+
+
+def _sample(annotation: Any, name: str, index: int) -> Any:
+    if typing.get_origin(annotation) is typing.Union:
+        annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    if inspect.isclass(annotation) and issubclass(annotation, Enum):
+        members = list(annotation)
+        return members[index % len(members)]
+    if annotation is bool:
+        return index % 2 == 0
+    if annotation is int:
+        return index + 1
+    if annotation is datetime:
+        return datetime(2030, 1, 1) + timedelta(minutes=index, microseconds=index)
+    if "email" in name:
+        return f"user{index}@example.com"
+    return f"{name} {index}"
+
+
+def sample_rows(schema: Type[BaseModel], count: int) -> List[Dict[str, Any]]:
+    """`count` rows with a plausible value for every field of the schema."""
+    return [
+        {name: _sample(field.annotation, name, index) for name, field in schema.model_fields.items()}
+        for index in range(count)
+    ]
+
+
+def _finish(coroutine) -> Any:
+    """Result of a coroutine that never suspends, without an event loop's overhead in the timings."""
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    coroutine.close()
+    raise RuntimeError("coroutine suspended")
+
+
+def default_path(schema: Type[BaseModel]) -> Callable[[list], bytes]:
+    field = create_response_field(name=f"Response_{schema.__name__}", type_=List[schema], mode="serialization")
+
+    def render(rows: list) -> bytes:
+        items = [schema.model_validate(row) for row in rows]
+        content = _finish(serialize_response(field=field, response_content=items, is_coroutine=True))
+        return JSONResponse(content).body
+    return render
+
+
+def fast_path(schema: Type[BaseModel]) -> Callable[[list], bytes]:
+    adapter = TypeAdapter(List[schema])
+
+    def render(rows: list) -> bytes:
+        return adapter.dump_json(adapter.validate_python(rows))
+    return render
+
+
+def best_of(render: Callable[[list], bytes], rows: list, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render(rows)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@dataclass
+class SerializationResult:
+    schema: str
+    rows: int
+    default_ms: float
+    fast_ms: float
+
+    @property
+    def speedup(self) -> float:
+        return self.default_ms / self.fast_ms if self.fast_ms else 0.0
+
+
+def run(rows: int = 1000, repeat: int = 5) -> List[SerializationResult]:
+    results = []
+    for name, schema in out_schemas().items():
+        data = sample_rows(schema, rows)
+        results.append(SerializationResult(
+            schema=name,
+            rows=rows,
+            default_ms=round(best_of(default_path(schema), data, repeat) * 1000, 2),
+            fast_ms=round(best_of(fast_path(schema), data, repeat) * 1000, 2),
+        ))
+    return results
+
+
+def format_table(results: List[SerializationResult]) -> str:
+    header = f"{'schema':<16}{'rows':>7}{'default ms':>12}{'fast ms':>10}{'speedup':>9}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.schema:<16}{result.rows:>7}{result.default_ms:>12}{result.fast_ms:>10}{result.speedup:>8.1f}x"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,45 @@
+from benchmarks.report import Report, ScenarioResult, percentile
+
+
+class TestBenchmarkReport:
+    """Test cases for benchmark summaries and baseline comparison."""
+
+    def test_percentile_uses_nearest_rank(self):
+        """Test percentiles pick an observed sample."""
+        samples = [float(value) for value in range(1, 101)]
+
+        assert percentile(samples, 0.50) == 50.0
+        assert percentile(samples, 0.95) == 95.0
+        assert percentile(samples, 0.99) == 99.0
+        assert percentile([], 0.99) == 0.0
+
+    def test_compare_flags_slowdowns_and_extra_queries(self):
+        """Test regressions beyond the tolerance are reported, small noise is not."""
+        baseline = Report(meta={}, scenarios={
+            "games": ScenarioResult.from_samples("games", [0.010] * 100, 0, 1.0, queries=100),
+            "auth_me": ScenarioResult.from_samples("auth_me", [0.010] * 100, 0, 1.0, queries=300),
+        })
+        current = Report(meta={}, scenarios={
+            "games": ScenarioResult.from_samples("games", [0.011] * 100, 0, 1.1, queries=100),
+            "auth_me": ScenarioResult.from_samples("auth_me", [0.020] * 100, 0, 2.0, queries=400),
+        })
+
+        regressions = current.compare(baseline, tolerance=0.2)
+
+        assert {regression.scenario for regression in regressions} == {"auth_me"}
+        assert {regression.metric for regression in regressions} == {
+            "p50_ms", "p95_ms", "p99_ms", "throughput_rps", "queries_per_request"
+        }
+
+    def test_report_round_trips_through_json(self, tmp_path):
+        """Test a saved report loads back as the same results."""
+        report = Report(meta={"scale": "bookings=10"}, scenarios={
+            "games": ScenarioResult.from_samples("games", [0.010, 0.020], 0, 0.5, queries=2),
+        })
+        path = tmp_path / "baseline.json"
+        path.write_text(report.to_json())
+
+        loaded = Report.load(str(path))
+
+        assert loaded.meta == report.meta
+        assert loaded.scenarios == report.scenarios
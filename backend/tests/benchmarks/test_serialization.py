@@ -0,0 +1,24 @@
+from benchmarks.serialization import default_path, fast_path, format_table, out_schemas, run, sample_rows
+
+
+class TestSerializationBenchmark:
+    """Test cases for the list serialization micro-benchmark."""
+
+    def test_covers_every_out_schema(self):
+        """Test each *Out response schema in app.schemas is benchmarked."""
+        assert set(out_schemas()) == {"BookingOut", "DepartmentOut", "GameOut", "SlotOut", "UserOut"}
+
+    def test_both_paths_send_the_same_bytes(self):
+        """Test the fast path renders exactly what the default path does, for every schema."""
+        for schema in out_schemas().values():
+            rows = sample_rows(schema, 20)
+
+            assert fast_path(schema)(rows) == default_path(schema)(rows), schema.__name__
+
+    def test_report_lists_each_schema(self):
+        """Test a run reports timings per schema."""
+        results = run(rows=5, repeat=1)
+
+        assert [result.schema for result in results] == list(out_schemas())
+        assert all(result.default_ms >= 0 and result.fast_ms >= 0 for result in results)
+        assert "BookingOut" in format_table(results)
@@ -0,0 +1,142 @@
+import time
+import pytest
+from typing import Dict, List, Optional, Tuple
+from pydantic import TypeAdapter
+from sqlalchemy import text
+
+from app.core.cache import CatalogCache, LocalCacheBackend, commit_and_invalidate, mark_stale
+
+
+class FakeRedis:
+    """Local stand-in for redis.asyncio.Redis, covering the commands the catalog cache sends."""
+
+    def __init__(self):
+        self.data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def _get(self, key: str) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._get(key)
+
+    async def set(self, key: str, value, ex: Optional[int] = None) -> bool:
+        value = value if isinstance(value, bytes) else str(value).encode()
+        self.data[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self._get(key) for key in keys]
+
+    async def incr(self, key: str) -> int:
+        value = int(self._get(key) or 0) + 1
+        self.data[key] = (str(value).encode(), None)
+        return value
+
+    async def flushdb(self) -> bool:
+        self.data.clear()
+        return True
+
+
+NUMBERS = TypeAdapter(List[int])
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request) -> CatalogCache:
+    """Catalog cache over the in-process backend and over the Redis stand-in."""
+    if request.param == "memory":
+        backend = LocalCacheBackend(maxsize=100, ttl=60)
+    else:
+        backend = FakeRedis()
+    return CatalogCache(backend, ttl=60)
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self) -> List[int]:
+        self.calls += 1
+        return [self.calls]
+
+
+class TestCatalogCache:
+    """Test cases for the read-through catalog cache."""
+
+    async def test_second_read_is_a_hit(self, cache):
+        """Test a value is loaded once and then served from the cache."""
+        loader = Loader()
+
+        first = await cache.get_or_load("numbers", {"page": 1}, ["tag"], loader, NUMBERS)
+        second = await cache.get_or_load("numbers", {"page": 1}, ["tag"], loader, NUMBERS)
+
+        assert first == second == [1]
+        assert loader.calls == 1
+
+    async def test_params_are_part_of_the_key(self, cache):
+        """Test different query params are cached separately."""
+        loader = Loader()
+
+        await cache.get_or_load("numbers", {"page": 1}, ["tag"], loader, NUMBERS)
+        assert await cache.get_or_load("numbers", {"page": 2}, ["tag"], loader, NUMBERS) == [2]
+
+    async def test_invalidating_a_tag_reloads_only_its_entries(self, cache):
+        """Test bumping a tag misses every entry under it and leaves other tags cached."""
+        loader = Loader()
+        await cache.get_or_load("numbers", {}, ["a", "b"], loader, NUMBERS)
+        await cache.get_or_load("other", {}, ["c"], loader, NUMBERS)
+
+        await cache.invalidate(["b"])
+
+        assert await cache.get_or_load("numbers", {}, ["a", "b"], loader, NUMBERS) == [3]
+        assert await cache.get_or_load("other", {}, ["c"], loader, NUMBERS) == [2]
+
+    async def test_loader_errors_are_not_cached(self, cache):
+        """Test a failing load leaves nothing behind."""
+        async def failing():
+            raise LookupError("missing")
+
+        with pytest.raises(LookupError):
+            await cache.get_or_load("numbers", {}, ["tag"], failing, NUMBERS)
+        assert await cache.get_or_load("numbers", {}, ["tag"], Loader(), NUMBERS) == [1]
+
+    async def test_disabled_cache_always_loads(self):
+        """Test a cache without a backend passes every read through."""
+        cache = CatalogCache(None, ttl=60)
+        loader = Loader()
+
+        await cache.get_or_load("numbers", {}, ["tag"], loader, NUMBERS)
+        await cache.get_or_load("numbers", {}, ["tag"], loader, NUMBERS)
+
+        assert loader.calls == 2
+
+    async def test_local_entries_expire(self):
+        """Test in-process entries expire after the TTL."""
+        now = [0.0]
+        cache = CatalogCache(LocalCacheBackend(maxsize=100, ttl=30, timer=lambda: now[0]), ttl=30)
+        loader = Loader()
+
+        await cache.get_or_load("numbers", {}, ["tag"], loader, NUMBERS)
+        now[0] = 31
+
+        assert await cache.get_or_load("numbers", {}, ["tag"], loader, NUMBERS) == [2]
+
+    async def test_rollback_discards_stale_tags(self, db_session, monkeypatch):
+        """Test a rolled-back write bumps no generations, even when the session commits later."""
+        cache = CatalogCache(LocalCacheBackend(maxsize=100, ttl=30), ttl=30)
+        monkeypatch.setattr("app.core.cache.catalog_cache", cache)
+
+        await db_session.execute(text("SELECT 1"))
+        mark_stale(db_session, "failed")
+        await db_session.rollback()
+        await db_session.execute(text("SELECT 1"))
+        mark_stale(db_session, "written")
+        await commit_and_invalidate(db_session)
+
+        assert await cache._generations(["failed", "written"]) == [0, 1]
@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+import warnings
+from sqlalchemy import update
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.future import select
+
+from app.core.etag import etag_matches, version_columns
+from app.models.game import Game
+from app.services.game_service import GameService
+
+
+class TestEtagMatches:
+    """Test cases for If-None-Match comparison."""
+
+    def test_exact_and_listed_tags_match(self):
+        """Test the ETag matches alone or in a list of candidates."""
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('"old", "abc"', '"abc"')
+
+    def test_weak_prefix_and_wildcard_match(self):
+        """Test If-None-Match uses weak comparison and honours *."""
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+
+    def test_other_tags_do_not_match(self):
+        """Test a missing header or different tag never matches."""
+        assert not etag_matches(None, '"abc"')
+        assert not etag_matches('"abd"', '"abc"')
+
+
+class TestVersionColumns:
+    """Test cases for the updated_at aggregates behind ETags."""
+
+    async def _version(self, session) -> tuple:
+        return tuple((await session.execute(select(*version_columns(Game)))).one())
+
+    async def _check_changes_are_detected(self, session):
+        session.add_all([Game(title="First"), Game(title="Second")])
+        await session.commit()
+        before = await self._version(session)
+        # updated_at has millisecond resolution on SQLite
+        await asyncio.sleep(0.01)
+
+        await session.execute(update(Game).where(Game.title == "First").values(description="Changed"))
+        await session.commit()
+
+        after = await self._version(session)
+        assert after[0] == before[0] == 2
+        assert after != before
+
+    async def test_update_changes_version_on_sqlite(self, db_session):
+        """Test updating a row changes the version even when the row count stays the same."""
+        await self._check_changes_are_detected(db_session)
+
+    async def test_update_changes_version_on_postgresql(self, pg_engine):
+        """Test the epoch aggregate compiles and detects updates on PostgreSQL."""
+        from sqlalchemy.ext.asyncio import AsyncSession
+        async with AsyncSession(pg_engine) as session:
+            await self._check_changes_are_detected(session)
+
+    async def test_games_version_joins_its_slot_aggregates(self, db_session):
+        """Test the game list version query compiles without a cartesian product warning."""
+        db_session.add(Game(title="Versioned"))
+        await db_session.commit()
+        # Skip the statement cache, so the query is compiled (and linted) in this test
+        await db_session.connection(execution_options={"compiled_cache": None})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", SAWarning)
+            version = await GameService(db_session).get_games_version()
+
+        assert version[0] == 1 and version[3] == 0
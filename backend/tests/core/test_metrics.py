@@ -0,0 +1,89 @@
+import threading
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Test cases for the Prometheus metrics registry."""
+
+    def test_counter_and_gauge_exposition(self):
+        """Test counters and gauges render with HELP, TYPE and escaped labels."""
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests seen", ("route",))
+        in_flight = registry.gauge("in_flight", "Requests being served")
+        requests.inc('/a"b')
+        requests.inc('/a"b', amount=2)
+        in_flight.inc()
+        in_flight.inc()
+        in_flight.dec()
+
+        assert registry.render() == (
+            "# HELP requests_total Requests seen\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{route="/a\\"b"} 3\n'
+            "# HELP in_flight Requests being served\n"
+            "# TYPE in_flight gauge\n"
+            "in_flight 1\n"
+        )
+
+    def test_histogram_exposition(self):
+        """Test histograms render cumulative buckets, sum and count."""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            latency.observe(value, "/x")
+
+        lines = registry.render().splitlines()
+
+        assert lines[2:] == [
+            'latency_seconds_bucket{route="/x",le="0.1"} 2',
+            'latency_seconds_bucket{route="/x",le="1"} 3',
+            'latency_seconds_bucket{route="/x",le="+Inf"} 4',
+            'latency_seconds_sum{route="/x"} 3.65',
+            'latency_seconds_count{route="/x"} 4',
+        ]
+
+    def test_callback_gauge_skips_missing_values(self):
+        """Test callback gauges are read at render time and omitted when they return None."""
+        registry = MetricsRegistry()
+        values = {"size": 5}
+        registry.callback_gauge("pool_size", "Pool size", lambda: values["size"])
+
+        assert "pool_size 5" in registry.render()
+        values["size"] = None
+        assert "\npool_size " not in registry.render()
+
+    def test_threads_record_into_separate_shards(self):
+        """Test increments from many threads are all counted without a lock."""
+        registry = MetricsRegistry()
+        counter = registry.counter("work_total", "Work done")
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value() == 8000
+        assert len(counter._shards.copies()) == 8
+
+    def test_wrong_labels_rejected(self):
+        """Test recording with the wrong number of labels fails loudly."""
+        registry = MetricsRegistry()
+        counter = registry.counter("labelled_total", "Labelled", ("outcome",))
+
+        with pytest.raises(ValueError):
+            counter.inc()
+
+    def test_duplicate_name_rejected(self):
+        """Test a metric name can only be registered once."""
+        registry = MetricsRegistry()
+        registry.counter("dup_total", "First")
+
+        with pytest.raises(ValueError):
+            registry.gauge("dup_total", "Second")
@@ -0,0 +1,110 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+from sqlalchemy import event
+
+from app.core.cache import TTLCache
+from tests.conftest import test_engine
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test cases for the in-process TTL+LRU cache."""
+
+    def test_entries_expire_after_ttl(self):
+        """Test an entry is gone once its time-to-live has passed."""
+        timer = FakeTimer()
+        cache = TTLCache(maxsize=10, ttl=30, timer=timer)
+        cache.set("key", "value")
+
+        timer.now = 29
+        assert cache.get("key") == "value"
+        timer.now = 30
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test a full cache evicts the entry read least recently."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_discard_where_drops_matching_keys(self):
+        """Test entries can be invalidated by key prefix."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set((1, "token-a"), "first")
+        cache.set((1, "token-b"), "second")
+        cache.set((2, "token-a"), "other")
+
+        cache.discard_where(lambda key: key[0] == 1)
+
+        assert cache.get((1, "token-a")) is None
+        assert cache.get((1, "token-b")) is None
+        assert cache.get((2, "token-a")) == "other"
+
+
+class TestPrincipalCache:
+    """Test cases for caching the authenticated principal between requests."""
+
+    def test_repeated_requests_skip_user_lookup(self, client: TestClient, user_headers):
+        """Test only the first authenticated request reads the users table."""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # Slot listings aren't in the catalog cache, so the second request still queries
+        client.get("/api/v1/slots/", headers=user_headers)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = client.get("/api/v1/slots/", headers=user_headers)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert statements
+        assert not [statement for statement in statements if "FROM users" in statement]
+
+    def test_role_change_takes_effect_immediately(self, client: TestClient, admin_headers, admin_user):
+        """Test updating a user's role invalidates their cached principal."""
+        response = client.get("/api/v1/games/", headers=admin_headers)
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.put(
+            f"/api/v1/users/{admin_user.id}",
+            headers=admin_headers,
+            json={"role": "normal"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.post(
+            "/api/v1/games/",
+            headers=admin_headers,
+            json={"title": "Game After Demotion"}
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_deleted_user_token_is_rejected(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test deleting a user invalidates their cached principal."""
+        response = client.get("/api/v1/games/", headers=user_headers)
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.delete(f"/api/v1/users/{normal_user.id}", headers=admin_headers)
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.get("/api/v1/games/", headers=user_headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,78 @@
+import logging
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.request_metrics import Histogram, RequestQueryStats, fingerprint, server_timing
+
+
+class TestFingerprint:
+    """Test cases for statement fingerprints."""
+
+    def test_replaces_literals_and_parameters(self):
+        """Test literals and bind parameters of every paramstyle become ?."""
+        statement = "SELECT * FROM users WHERE id = $1 AND name = 'bob' AND age > 30 AND role = %(role)s AND x = :x"
+
+        assert fingerprint(statement) == "SELECT * FROM users WHERE id = ? AND name = ? AND age > ? AND role = ? AND x = ?"
+
+    def test_collapses_in_lists_and_whitespace(self):
+        """Test IN lists of any length and whitespace runs group together."""
+        short = fingerprint("SELECT slots_1.id FROM slots AS slots_1\n  WHERE slots_1.id IN (?, ?)")
+        long = fingerprint("SELECT slots_1.id FROM slots AS slots_1 WHERE slots_1.id IN (?, ?, ?, ?)")
+
+        assert short == long == "SELECT slots_1.id FROM slots AS slots_1 WHERE slots_1.id IN (?...)"
+
+    def test_keeps_casts(self):
+        """Test PostgreSQL casts are not mistaken for named parameters."""
+        assert fingerprint("SELECT 'CONFIRMED'::bookingstatus") == "SELECT ?::bookingstatus"
+
+
+class TestHistogram:
+    """Test cases for the metrics histogram."""
+
+    def test_cumulative_buckets(self):
+        """Test buckets count observations at or below their bound."""
+        histogram = Histogram((1, 5, 10))
+        for value in (0, 1, 3, 7, 50):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert [bucket["count"] for bucket in snapshot["buckets"]] == [2, 3, 4, 5]
+        assert snapshot["buckets"][-1]["le"] == "+Inf"
+        assert (snapshot["count"], snapshot["sum"], snapshot["max"]) == (5, 61, 50)
+
+
+class TestServerTiming:
+    """Test cases for the Server-Timing header value."""
+
+    def test_statement_only_when_requested(self):
+        """Test the slowest statement's text is included only on request."""
+        stats = RequestQueryStats()
+        stats.record("SELECT 1", 0.002)
+        stats.record('SELECT "quoted"', 0.005)
+
+        assert server_timing(stats, 0.01) == 'db;dur=7.00;desc="2 queries", db-slowest;dur=5.00, total;dur=10.00'
+        assert 'db-slowest;dur=5.00;desc="SELECT \\"quoted\\""' in server_timing(stats, 0.01, include_statement=True)
+
+
+class TestSlowQueryLog:
+    """Test cases for the slow query log."""
+
+    async def test_logs_statements_over_threshold(self, db_session, monkeypatch, caplog):
+        """Test statements slower than the threshold are logged by fingerprint."""
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.000001)
+
+        with caplog.at_level(logging.WARNING, logger="app.core.request_metrics"):
+            await db_session.execute(text("SELECT 42"))
+
+        assert any("Slow query" in record.message and "SELECT ?" in record.message for record in caplog.records)
+
+    async def test_threshold_zero_disables(self, db_session, monkeypatch, caplog):
+        """Test a zero threshold logs nothing."""
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+        with caplog.at_level(logging.WARNING, logger="app.core.request_metrics"):
+            await db_session.execute(text("SELECT 42"))
+
+        assert not caplog.records
@@ -0,0 +1,62 @@
+import json
+from datetime import datetime
+from typing import List
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import json_list_response
+from app.models.booking import BookingStatus
+from app.schemas.booking import BookingOut
+
+BOOKINGS = TypeAdapter(List[BookingOut])
+
+
+def bookings(count: int) -> List[BookingOut]:
+    return [
+        BookingOut(
+            id=index, user_id=1, slot_id=2, status=list(BookingStatus)[0],
+            created_at=datetime(2030, 1, 1, 10, 0, 0, 1500), updated_at=datetime(2030, 1, 1, 10)
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+class TestJsonListResponse:
+    """Test cases for the TypeAdapter list response fast path."""
+
+    def test_body_matches_default_encoding(self):
+        """Test the bytes are what FastAPI's JSONResponse would have sent for the same list."""
+        items = bookings(3)
+
+        response = json_list_response(Response(), items, BOOKINGS)
+
+        assert response.media_type == "application/json"
+        assert response.body == json.dumps(
+            jsonable_encoder(items), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode()
+
+    def test_injected_headers_are_kept(self):
+        """Test headers a route set on the injected response (cursor, ETag) are copied over."""
+        injected = Response()
+        # As FastAPI hands it to the route
+        del injected.headers["content-length"]
+        injected.headers["X-Next-Cursor"] = "abc"
+        injected.headers["ETag"] = '"v1"'
+
+        response = json_list_response(injected, bookings(1), BOOKINGS)
+
+        assert response.headers["x-next-cursor"] == "abc"
+        assert response.headers["etag"] == '"v1"'
+        assert int(response.headers["content-length"]) == len(response.body)
+
+    def test_sparse_rows_skip_the_schema(self):
+        """Test a sparse fieldset is dumped as plain rows, with enums and datetimes encoded."""
+        rows = [{"id": 1, "status": list(BookingStatus)[0], "created_at": datetime(2030, 1, 1)}]
+
+        response = json_list_response(Response(), rows, BOOKINGS, fields=["status", "created_at"])
+
+        assert json.loads(response.body) == [
+            {"id": 1, "status": list(BookingStatus)[0].value, "created_at": "2030-01-01T00:00:00"}
+        ]
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+import threading
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.security import (
+    get_password_hash_async,
+    verify_password_async,
+    password_hash_metrics,
+)
+
+
+class TestPasswordHashPool:
+    """Test cases for bcrypt offloaded to the hashing pool."""
+
+    async def test_async_hash_round_trip(self):
+        """Test a hash made on the pool verifies on the pool."""
+        hashed = await get_password_hash_async("secret123")
+
+        assert await verify_password_async("secret123", hashed)
+        assert not await verify_password_async("wrong", hashed)
+
+    async def test_event_loop_keeps_running_while_hashing(self):
+        """Test other coroutines make progress while bcrypt runs."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        await get_password_hash_async("secret123")
+        task.cancel()
+
+        assert ticks > 1
+
+    async def test_metrics_record_calls(self):
+        """Test calls through the pool are counted with their timings."""
+        before = password_hash_metrics.snapshot()
+
+        await get_password_hash_async("secret123")
+
+        after = password_hash_metrics.snapshot()
+        assert after["calls"] == before["calls"] + 1
+        assert after["duration_seconds_max"] > 0
+        assert after["pending"] == 0
+
+    async def test_rejects_when_queue_is_full(self, monkeypatch):
+        """Test calls beyond the pending limit are rejected with 503."""
+        monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 1)
+        rejected_before = password_hash_metrics.rejected
+
+        results = await asyncio.gather(
+            get_password_hash_async("secret123"),
+            get_password_hash_async("secret123"),
+            return_exceptions=True
+        )
+
+        errors = [result for result in results if isinstance(result, HTTPException)]
+        assert len(errors) == 1
+        assert errors[0].status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert password_hash_metrics.rejected == rejected_before + 1
+
+    async def test_cancelled_call_holds_its_slot_until_done(self, monkeypatch):
+        """Test a call whose caller went away still counts as pending while bcrypt runs."""
+        monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 1)
+        started, finish = threading.Event(), threading.Event()
+
+        def slow_hash(password):
+            started.set()
+            finish.wait(5)
+            return "hashed"
+
+        monkeypatch.setattr("app.core.security.get_password_hash", slow_hash)
+        task = asyncio.create_task(get_password_hash_async("secret123"))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert password_hash_metrics.pending == 1
+        with pytest.raises(HTTPException):
+            await get_password_hash_async("secret123")
+
+        finish.set()
+        while password_hash_metrics.pending:
+            await asyncio.sleep(0.01)
+        assert await get_password_hash_async("secret123") == "hashed"
@@ -0,0 +1,197 @@
+import asyncio
+import pytest
+from datetime import datetime
+from typing import List
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.slot_events import (
+    LocalBroker, RedisBroker, Subscription, publish_queued_slot_updates, queue_slot_updates,
+    slot_event_stream, slot_occupancy, slot_updates_published
+)
+from app.schemas.slot import SlotOccupancy
+
+
+def occupancy(slot_id: int, booked_count: int = 1, game_id: int = 1, day: int = 1) -> SlotOccupancy:
+    return slot_occupancy(
+        (slot_id, game_id, datetime(2030, 1, day, 10), datetime(2030, 1, day, 11), booked_count, 2)
+    )
+
+
+class FakePubSub:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.redis.pubsubs.remove(self)
+
+    async def subscribe(self, channel: str) -> None:
+        self.redis.pubsubs.append(self)
+        await self.messages.put({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+
+class FakeRedis:
+    """Local stand-in for redis.asyncio.Redis pub/sub, with every worker on one channel."""
+
+    def __init__(self):
+        self.pubsubs: List[FakePubSub] = []
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    async def publish(self, channel: str, message: bytes) -> int:
+        for pubsub in self.pubsubs:
+            await pubsub.messages.put({"type": "message", "channel": channel, "data": message})
+        return len(self.pubsubs)
+
+
+class TestSubscription:
+    """Test cases for per-client buffering and filters."""
+
+    async def test_filters_by_game_and_date_range(self):
+        """Test only updates inside the subscription's games and dates are kept."""
+        subscription = Subscription(
+            maxsize=10, game_ids=[1], start_date=datetime(2030, 1, 2), end_date=datetime(2030, 1, 3)
+        )
+
+        subscription.put(occupancy(1, day=2))
+        subscription.put(occupancy(2, day=1))
+        subscription.put(occupancy(3, game_id=2, day=2))
+
+        assert await subscription.next_batch(timeout=1) == (False, [occupancy(1, day=2)])
+
+    async def test_updates_to_one_slot_collapse(self):
+        """Test a burst on one slot leaves only its latest counts, after other slots' updates."""
+        subscription = Subscription(maxsize=10)
+
+        subscription.put(occupancy(1, booked_count=1))
+        subscription.put(occupancy(2, booked_count=1))
+        subscription.put(occupancy(1, booked_count=2))
+
+        resync, updates = await subscription.next_batch(timeout=1)
+        assert resync is False
+        assert [(update.slot_id, update.booked_count) for update in updates] == [(2, 1), (1, 2)]
+
+    async def test_overflow_asks_for_resync(self):
+        """Test a client with too many distinct slots pending is told to resync instead."""
+        subscription = Subscription(maxsize=2)
+
+        for slot_id in range(1, 5):
+            subscription.put(occupancy(slot_id))
+
+        assert await subscription.next_batch(timeout=1) == (True, [])
+        subscription.put(occupancy(5))
+        assert await subscription.next_batch(timeout=1) == (False, [occupancy(5)])
+
+    async def test_quiet_returns_empty_batch(self):
+        """Test nothing pending returns an empty batch after the timeout."""
+        subscription = Subscription(maxsize=2)
+
+        assert await subscription.next_batch(timeout=0.01) == (False, [])
+
+
+class TestBrokers:
+    """Test cases for fanning updates out to subscriptions."""
+
+    async def test_local_broker_fans_out(self):
+        """Test every subscription gets an update until it unsubscribes."""
+        broker = LocalBroker()
+        first = broker.subscribe()
+        second = broker.subscribe(game_ids=[1])
+
+        await broker.publish([occupancy(1)])
+        broker.unsubscribe(first)
+        await broker.publish([occupancy(2)])
+
+        assert broker.subscribers == 1
+        assert await first.next_batch(timeout=1) == (False, [occupancy(1)])
+        assert await second.next_batch(timeout=1) == (False, [occupancy(1), occupancy(2)])
+
+    async def test_failing_subscription_is_isolated(self, monkeypatch):
+        """Test a subscription that raises is told to resync and the others still get the update."""
+        broker = LocalBroker()
+        broken, healthy = broker.subscribe(), broker.subscribe()
+
+        def fail(update):
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+
+        monkeypatch.setattr(broken, "put", fail)
+        await broker.publish([occupancy(1)])
+
+        assert await broken.next_batch(timeout=1) == (True, [])
+        assert await healthy.next_batch(timeout=1) == (False, [occupancy(1)])
+
+    async def test_redis_broker_delivers_across_workers(self):
+        """Test an update published by one worker reaches another worker's subscribers."""
+        redis = FakeRedis()
+        publisher, receiver = RedisBroker(redis), RedisBroker(redis)
+        subscription = receiver.subscribe()
+        # Let the listener subscribe to the channel
+        while not redis.pubsubs:
+            await asyncio.sleep(0)
+
+        await publisher.publish([occupancy(1)])
+
+        assert await subscription.next_batch(timeout=1) == (False, [occupancy(1)])
+        receiver._listener.cancel()
+
+
+class TestPublishing:
+    """Test cases for publishing queued updates after commit."""
+
+    async def test_commit_publishes_final_counts(self, db_session, monkeypatch):
+        """Test updates queued in a transaction are published once, with each slot's last counts."""
+        broker = LocalBroker()
+        monkeypatch.setattr("app.core.slot_events.slot_broker", broker)
+        subscription = broker.subscribe()
+        published = slot_updates_published.value()
+
+        queue_slot_updates(db_session, [occupancy(1, booked_count=1)])
+        queue_slot_updates(db_session, [occupancy(1, booked_count=2)])
+        await db_session.commit()
+        await publish_queued_slot_updates(db_session)
+
+        assert await subscription.next_batch(timeout=1) == (False, [occupancy(1, booked_count=2)])
+        assert slot_updates_published.value() == published + 1
+
+    async def test_rollback_discards_updates(self, db_session, monkeypatch):
+        """Test counts from a rolled-back transaction are never published."""
+        broker = LocalBroker()
+        monkeypatch.setattr("app.core.slot_events.slot_broker", broker)
+        subscription = broker.subscribe()
+
+        await db_session.execute(text("SELECT 1"))
+        queue_slot_updates(db_session, [occupancy(1)])
+        await db_session.rollback()
+        await publish_queued_slot_updates(db_session)
+
+        assert await subscription.next_batch(timeout=0.01) == (False, [])
+
+
+class TestEventStream:
+    """Test cases for the Server-Sent Events a client reads."""
+
+    async def test_stream_frames(self, monkeypatch):
+        """Test the stream opens with a retry hint, then sends events, resyncs and keepalives."""
+        monkeypatch.setattr(settings, "SLOT_EVENTS_KEEPALIVE_SECONDS", 0.01)
+        monkeypatch.setattr(settings, "SLOT_EVENTS_BUFFER_SIZE", 1)
+        broker = LocalBroker()
+        stream = slot_event_stream(broker)
+
+        assert await stream.__anext__() == f"retry: {settings.SLOT_EVENTS_RETRY_MS}\n\n"
+        await broker.publish([occupancy(1)])
+        assert await stream.__anext__() == f"event: occupancy\ndata: {occupancy(1).model_dump_json()}\n\n"
+        await broker.publish([occupancy(1), occupancy(2)])
+        assert await stream.__anext__() == "event: resync\ndata: {}\n\n"
+        assert await stream.__anext__() == ": keepalive\n\n"
+
+        await stream.aclose()
+        assert broker.subscribers == 0
@@ -0,0 +1,147 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.db.reconcile import reconcile_slot_booked_counts
+from app.models.booking import BookingStatus
+from app.schemas.slot import SlotCreate
+from app.services.booking_service import BookingService
+from app.services.department_service import DepartmentService
+from app.services.game_service import GameService
+from app.services.slot_service import SlotService
+from app.services.user_service import UserService
+
+
+async def capture_statements(engine, call) -> list:
+    """Run a service call and return the statements it issued with their parameters."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with SessionLocal() as session:
+            try:
+                await call(session)
+            except Exception:
+                # Not-found and validation errors still issue the query we want to inspect
+                pass
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+async def explain(engine, statement: str, parameters) -> str:
+    async with engine.connect() as conn:
+        # Tables are nearly empty, so rule out sequential scans to see which index the planner can use
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        return "\n".join(row[0] for row in result.all())
+
+
+async def seed(engine) -> None:
+    """Enough rows, spread like production data, for the planner's statistics to be meaningful."""
+    async with engine.begin() as conn:
+        await conn.execute(text("INSERT INTO departments (title) SELECT 'Department ' || i FROM generate_series(1, 20) AS i"))
+        await conn.execute(text(
+            "INSERT INTO users (username, password, role, department_id) "
+            "SELECT 'user' || i, 'x', 'NORMAL', 1 + i % 20 FROM generate_series(1, 2000) AS i"
+        ))
+        await conn.execute(text("INSERT INTO games (title) SELECT 'Game ' || i FROM generate_series(1, 20) AS i"))
+        await conn.execute(text(
+            "INSERT INTO slots (start_time, end_time, capacity, game_id) "
+            "SELECT now()::timestamp + i * interval '15 minutes', now()::timestamp + (i + 1) * interval '15 minutes', 10, 1 + i % 20 "
+            "FROM generate_series(1, 5000) AS i"
+        ))
+        await conn.execute(text(
+            "INSERT INTO bookings (user_id, slot_id, status) "
+            "SELECT 1 + (i + i / 5000) % 2000, 1 + i % 5000, "
+            "(CASE i % 10 WHEN 0 THEN 'CANCELLED' WHEN 1 THEN 'PENDING' ELSE 'CONFIRMED' END)::bookingstatus "
+            "FROM generate_series(1, 20000) AS i"
+        ))
+        await conn.execute(text("ANALYZE"))
+
+
+now = datetime.now()
+
+# (service call, fragment identifying the statement, index it must use)
+SERVICE_QUERIES = [
+    pytest.param(
+        lambda db: BookingService(db).get_user_active_bookings(1), "FROM bookings", "ix_bookings_user_id_status",
+        id="get_user_active_bookings",
+    ),
+    pytest.param(
+        lambda db: BookingService(db).get_bookings_by_user(1), "FROM bookings", "ix_bookings_user_id_status",
+        id="get_bookings_by_user",
+    ),
+    pytest.param(
+        lambda db: BookingService(db).get_bookings_by_slot(1), "FROM bookings", "ix_bookings_slot_id_status",
+        id="get_bookings_by_slot",
+    ),
+    pytest.param(
+        lambda db: BookingService(db).get_bookings_by_status(BookingStatus.PENDING), "FROM bookings", "ix_bookings_status_id",
+        id="get_bookings_by_status",
+    ),
+    pytest.param(
+        lambda db: BookingService(db).reset_current_day_bookings(), "DELETE FROM bookings USING slots", "ix_slots_start_time",
+        id="reset_current_day_bookings",
+    ),
+    pytest.param(
+        lambda db: SlotService(db).get_slots_by_game(1), "FROM slots", "ix_slots_game_id_start_time_end_time",
+        id="get_slots_by_game",
+    ),
+    pytest.param(
+        lambda db: SlotService(db).get_available_slots(), "FROM slots", "ix_slots_start_time",
+        id="get_available_slots",
+    ),
+    pytest.param(
+        lambda db: GameService(db).get_games_with_available_slots(), "FROM games", "ix_slots_game_id_start_time_end_time",
+        id="get_games_with_available_slots",
+    ),
+    pytest.param(
+        lambda db: SlotService(db).get_slots_by_date_range(now, now + timedelta(days=1)), "FROM slots", "ix_slots_start_time",
+        id="get_slots_by_date_range",
+    ),
+    pytest.param(
+        lambda db: SlotService(db).create_slot(SlotCreate(start_time=now, end_time=now + timedelta(hours=1), game_id=1)),
+        "slots_1.start_time <",
+        "ix_slots_game_id_start_time_end_time",
+        id="create_slot_overlap_check",
+    ),
+    pytest.param(
+        lambda db: UserService(db).get_users_by_department(1), "FROM users", "ix_users_department_id",
+        id="get_users_by_department",
+    ),
+    pytest.param(
+        lambda db: DepartmentService(db).get_department_by_id(1), "FROM departments", "ix_bookings_user_id_status",
+        id="get_department_booking_total",
+    ),
+    pytest.param(
+        lambda db: reconcile_slot_booked_counts(db), "FROM slots", "ix_bookings_slot_id_status",
+        id="reconcile_slot_booked_counts",
+    ),
+]
+
+
+class TestServiceQueryPlans:
+    """EXPLAIN-based checks that hot service queries are index-backed on PostgreSQL."""
+
+    @pytest.mark.parametrize("call,fragment,index_name", SERVICE_QUERIES)
+    async def test_service_query_uses_index(self, pg_engine, call, fragment, index_name):
+        """Test the service query is planned as a scan of the expected index."""
+        await seed(pg_engine)
+
+        statements = [
+            (statement, parameters)
+            for statement, parameters in await capture_statements(pg_engine, call)
+            if fragment in statement
+        ]
+        assert statements, f"no statement containing {fragment!r} was issued"
+
+        plan = await explain(pg_engine, *statements[0])
+        assert "Seq Scan" not in plan, plan
+        assert index_name in plan, plan
@@ -0,0 +1,60 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.reconcile import reconcile_slot_booked_counts
+from app.models.booking import Booking, BookingStatus
+from app.models.game import Game
+from app.models.slot import Slot
+from app.schemas.booking import BookingCreate
+from app.services.booking_service import BookingService
+
+
+class TestReconcileSlotBookedCounts:
+    """Test cases for the booked_count reconciliation command."""
+
+    async def _create_slot(self, db_session: AsyncSession) -> Slot:
+        game = Game(title="Reconcile Game", description="Game for reconcile tests")
+        db_session.add(game)
+        await db_session.commit()
+
+        start_time = datetime.now() + timedelta(hours=1)
+        slot = Slot(start_time=start_time, end_time=start_time + timedelta(hours=1), capacity=4, game_id=game.id)
+        db_session.add(slot)
+        await db_session.commit()
+        return slot
+
+    async def test_counters_stay_exact_through_booking_service(self, db_session: AsyncSession, admin_user, normal_user):
+        """Test booking mutations keep booked_count in step with bookings."""
+        slot = await self._create_slot(db_session)
+        booking_service = BookingService(db_session)
+
+        first = await booking_service.create_booking(BookingCreate(user_id=admin_user.id, slot_id=slot.id))
+        second = await booking_service.create_booking(
+            BookingCreate(user_id=normal_user.id, slot_id=slot.id, status="PENDING")
+        )
+        await booking_service.confirm_booking(second.id)
+        await booking_service.cancel_booking(first.id)
+        await booking_service.confirm_booking(first.id)
+        await booking_service.delete_booking(second.id)
+
+        assert await reconcile_slot_booked_counts(db_session) == []
+        await db_session.refresh(slot)
+        assert slot.booked_count == 1
+
+    async def test_reports_and_fixes_drift(self, db_session: AsyncSession, admin_user):
+        """Test drift is reported and repaired with --fix."""
+        slot = await self._create_slot(db_session)
+        db_session.add(Booking(user_id=admin_user.id, slot_id=slot.id, status=BookingStatus.CONFIRMED))
+        db_session.add(Booking(user_id=admin_user.id, slot_id=slot.id, status=BookingStatus.CANCELLED))
+        await db_session.commit()
+
+        await db_session.execute(update(Slot).where(Slot.id == slot.id).values(booked_count=3))
+        await db_session.commit()
+
+        drift = await reconcile_slot_booked_counts(db_session)
+        assert [(item.slot_id, item.stored, item.actual) for item in drift] == [(slot.id, 3, 1)]
+
+        await reconcile_slot_booked_counts(db_session, fix=True)
+        assert await reconcile_slot_booked_counts(db_session) == []
@@ -0,0 +1,162 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.future import select
+
+from app.core.config import settings
+from app.db.usage_rollup import (
+    BOOKING_USAGE_COLUMNS, SLOT_USAGE_COLUMNS, hourly_booking_usage, hourly_slot_usage, refresh_usage_rollup
+)
+from app.models.department import Department
+from app.models.game import Game
+from app.models.slot import Slot
+from app.models.usage_rollup import BookingUsageHourly, SlotUsageHourly, UsageRollupDirty
+from app.models.user import User
+from app.schemas.booking import BookingCreate
+from app.schemas.slot import SlotUpdate
+from app.schemas.user import UserUpdate
+from app.services.booking_service import BookingService
+from app.services.slot_service import SlotService
+from app.services.user_service import UserService
+
+
+async def rows(db: AsyncSession, query) -> set:
+    return {tuple(row) for row in (await db.execute(query)).all()}
+
+
+async def assert_rollup_is_live(db: AsyncSession):
+    """The rollup tables hold exactly the hourly rows computed from slots and bookings now."""
+    for model, columns, live in (
+        (SlotUsageHourly, SLOT_USAGE_COLUMNS, hourly_slot_usage()),
+        (BookingUsageHourly, BOOKING_USAGE_COLUMNS, hourly_booking_usage())
+    ):
+        assert await rows(db, select(*(getattr(model, name) for name in columns))) == await rows(db, live)
+
+
+@pytest.fixture
+def rollup(monkeypatch):
+    monkeypatch.setattr(settings, "ANALYTICS_ROLLUP", True)
+    # No overlap, so an incremental refresh only sees what changed since the previous one
+    monkeypatch.setattr(settings, "ANALYTICS_ROLLUP_OVERLAP_SECONDS", 0)
+
+
+class TestUsageRollup:
+    """Test cases for the hourly usage rollup refresh."""
+
+    async def _create_slots(self, db_session: AsyncSession) -> list:
+        game = Game(title="Rollup Game", description="Game for rollup tests")
+        db_session.add(game)
+        await db_session.commit()
+
+        start_time = (datetime.now() + timedelta(days=1)).replace(minute=0, second=0, microsecond=0)
+        slots = [
+            Slot(start_time=start_time + timedelta(hours=hours), end_time=start_time + timedelta(hours=hours, minutes=30),
+                 capacity=4, game_id=game.id)
+            for hours in (0, 1)
+        ]
+        db_session.add_all(slots)
+        await db_session.commit()
+        return slots
+
+    async def test_first_refresh_rebuilds(self, db_session: AsyncSession, rollup, admin_user):
+        """Test the first refresh is a full rebuild matching the live usage."""
+        first, _ = await self._create_slots(db_session)
+        await BookingService(db_session).create_booking(BookingCreate(user_id=admin_user.id, slot_id=first.id))
+
+        refresh = await refresh_usage_rollup(db_session)
+
+        assert (refresh.full, refresh.hours) == (True, 2)
+        await assert_rollup_is_live(db_session)
+
+    async def test_incremental_refresh_recomputes_changed_hours(self, db_session: AsyncSession, rollup, admin_user, normal_user):
+        """Test new and updated bookings are picked up through updated_at, and untouched hours are skipped."""
+        first, _ = await self._create_slots(db_session)
+        booking_service = BookingService(db_session)
+        booking = await booking_service.create_booking(BookingCreate(user_id=admin_user.id, slot_id=first.id))
+        await refresh_usage_rollup(db_session)
+
+        assert (await refresh_usage_rollup(db_session)).hours == 0
+
+        await booking_service.create_booking(BookingCreate(user_id=normal_user.id, slot_id=first.id))
+        await booking_service.cancel_booking(booking.id)
+        refresh = await refresh_usage_rollup(db_session)
+
+        assert (refresh.full, refresh.hours) == (False, 1)
+        await assert_rollup_is_live(db_session)
+
+    async def test_deletes_and_moves_are_queued(self, db_session: AsyncSession, rollup, admin_user, normal_user):
+        """Test changes that leave no updated row behind are recomputed through the dirty-hour queue."""
+        first, second = await self._create_slots(db_session)
+        booking_service = BookingService(db_session)
+        booking = await booking_service.create_booking(BookingCreate(user_id=admin_user.id, slot_id=first.id))
+        await booking_service.create_booking(BookingCreate(user_id=normal_user.id, slot_id=first.id))
+        await refresh_usage_rollup(db_session)
+
+        await booking_service.delete_booking(booking.id)
+        await SlotService(db_session).delete_slot(second.id)
+        await refresh_usage_rollup(db_session)
+        await assert_rollup_is_live(db_session)
+
+        department = Department(title="Rollup Department")
+        db_session.add(department)
+        await db_session.commit()
+        await UserService(db_session).update_user(normal_user.id, UserUpdate(department_id=department.id))
+        await refresh_usage_rollup(db_session)
+        await assert_rollup_is_live(db_session)
+
+    async def test_moved_slot_leaves_its_old_hour(self, db_session: AsyncSession, rollup):
+        """Test moving a slot to another hour recomputes both hours."""
+        first, _ = await self._create_slots(db_session)
+        await refresh_usage_rollup(db_session)
+
+        moved = first.start_time + timedelta(hours=5)
+        await SlotService(db_session).update_slot(
+            first.id, SlotUpdate(start_time=moved, end_time=moved + timedelta(minutes=30))
+        )
+        refresh = await refresh_usage_rollup(db_session)
+
+        assert refresh.hours == 2
+        await assert_rollup_is_live(db_session)
+        assert await db_session.get(UsageRollupDirty, 1) is None
+
+    async def test_deleted_user_leaves_the_rollup(self, db_session: AsyncSession, rollup, admin_user, normal_user):
+        """Test deleting a user removes their bookings from the rollup."""
+        first, _ = await self._create_slots(db_session)
+        await BookingService(db_session).create_booking(BookingCreate(user_id=normal_user.id, slot_id=first.id))
+        await refresh_usage_rollup(db_session)
+
+        await UserService(db_session).delete_user(normal_user.id)
+        await refresh_usage_rollup(db_session)
+
+        await assert_rollup_is_live(db_session)
+
+    async def test_nothing_is_queued_while_disabled(self, db_session: AsyncSession, admin_user):
+        """Test services leave the dirty-hour queue alone when the rollup is off."""
+        first, _ = await self._create_slots(db_session)
+        booking = await BookingService(db_session).create_booking(BookingCreate(user_id=admin_user.id, slot_id=first.id))
+
+        await BookingService(db_session).delete_booking(booking.id)
+
+        assert await db_session.get(UsageRollupDirty, 1) is None
+
+    async def test_incremental_refresh_on_postgresql(self, pg_engine, rollup):
+        """Test an incremental refresh on PostgreSQL matches the live usage."""
+        Session = async_sessionmaker(pg_engine, expire_on_commit=False)
+        async with Session() as db:
+            department = Department(title="PG Rollup Department")
+            db.add(department)
+            await db.commit()
+            user = User(username="pg_rollup", password="x", department_id=department.id)
+            db.add(user)
+            await db.commit()
+            first, second = await self._create_slots(db)
+            booking_service = BookingService(db)
+            booking = await booking_service.create_booking(BookingCreate(user_id=user.id, slot_id=first.id))
+            await refresh_usage_rollup(db)
+
+            await booking_service.cancel_booking(booking.id)
+            await SlotService(db).delete_slot(second.id)
+            refresh = await refresh_usage_rollup(db)
+
+            assert (refresh.full, refresh.hours) == (False, 2)
+            await assert_rollup_is_live(db)
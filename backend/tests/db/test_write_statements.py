@@ -0,0 +1,180 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+from datetime import datetime, timedelta
+
+# Statements a write endpoint may send on its success path: the write itself,
+# plus at most one read or seat-count update
+MAX_WRITE_STATEMENTS = 2
+
+
+def assert_within_budget(counter, response, expected_status):
+    assert response.status_code == expected_status, response.text
+    assert counter.count <= MAX_WRITE_STATEMENTS, "\n\n".join(counter.statements)
+
+
+@pytest.fixture
+def warm_admin_headers(client: TestClient, admin_headers):
+    """Admin headers whose principal is already cached, so its lookup isn't counted."""
+    client.get("/api/v1/games/", headers=admin_headers)
+    return admin_headers
+
+
+@pytest.fixture
+def game_id(client: TestClient, admin_headers):
+    return client.post(
+        "/api/v1/games/",
+        headers=admin_headers,
+        json={"title": "Statement Budget Game", "description": "Test game for statement counts"}
+    ).json()["id"]
+
+
+@pytest.fixture
+def slot_id(client: TestClient, admin_headers, game_id):
+    start_time = datetime.now() + timedelta(days=1)
+    return client.post(
+        "/api/v1/slots/",
+        headers=admin_headers,
+        json={
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=1)).isoformat(),
+            "capacity": 4,
+            "game_id": game_id
+        }
+    ).json()["id"]
+
+
+@pytest.fixture
+def booking_id(client: TestClient, user_headers, normal_user, slot_id):
+    return client.post(
+        "/api/v1/bookings/",
+        headers=user_headers,
+        json={"user_id": normal_user.id, "slot_id": slot_id, "status": "PENDING"}
+    ).json()["id"]
+
+
+class TestWriteStatementCounts:
+    """Test write endpoints build their response from the write instead of re-reading it."""
+    
+    def test_create_booking(self, client: TestClient, user_headers, normal_user, slot_id, statement_counter):
+        """Test creating a booking."""
+        # Authenticate once first, so the principal lookup isn't counted
+        client.get("/api/v1/games/", headers=user_headers)
+        
+        with statement_counter:
+            response = client.post(
+                "/api/v1/bookings/",
+                headers=user_headers,
+                json={"user_id": normal_user.id, "slot_id": slot_id}
+            )
+        
+        assert_within_budget(statement_counter, response, status.HTTP_201_CREATED)
+    
+    def test_update_booking(self, client: TestClient, user_headers, booking_id, statement_counter):
+        """Test updating a booking's status."""
+        with statement_counter:
+            response = client.put(f"/api/v1/bookings/{booking_id}", headers=user_headers, json={"status": "CONFIRMED"})
+        
+        assert_within_budget(statement_counter, response, status.HTTP_200_OK)
+        assert response.json()["status"] == "CONFIRMED"
+    
+    def test_cancel_booking(self, client: TestClient, user_headers, booking_id, statement_counter):
+        """Test cancelling a booking."""
+        with statement_counter:
+            response = client.post(f"/api/v1/bookings/{booking_id}/cancel", headers=user_headers)
+        
+        assert_within_budget(statement_counter, response, status.HTTP_200_OK)
+    
+    def test_confirm_booking(self, client: TestClient, admin_headers, booking_id, statement_counter):
+        """Test confirming a pending booking."""
+        with statement_counter:
+            response = client.post(f"/api/v1/bookings/{booking_id}/confirm", headers=admin_headers)
+        
+        assert_within_budget(statement_counter, response, status.HTTP_200_OK)
+    
+    def test_create_slot(self, client: TestClient, admin_headers, game_id, statement_counter):
+        """Test creating a slot."""
+        start_time = datetime.now() + timedelta(days=2)
+        
+        with statement_counter:
+            response = client.post(
+                "/api/v1/slots/",
+                headers=admin_headers,
+                json={
+                    "start_time": start_time.isoformat(),
+                    "end_time": (start_time + timedelta(hours=1)).isoformat(),
+                    "game_id": game_id
+                }
+            )
+        
+        assert_within_budget(statement_counter, response, status.HTTP_201_CREATED)
+    
+    def test_update_slot(self, client: TestClient, admin_headers, slot_id, statement_counter):
+        """Test updating a slot."""
+        with statement_counter:
+            response = client.put(f"/api/v1/slots/{slot_id}", headers=admin_headers, json={"capacity": 6})
+        
+        assert_within_budget(statement_counter, response, status.HTTP_200_OK)
+        assert response.json()["capacity"] == 6
+    
+    def test_create_game(self, client: TestClient, warm_admin_headers, statement_counter):
+        """Test creating a game."""
+        with statement_counter:
+            response = client.post("/api/v1/games/", headers=warm_admin_headers, json={"title": "Another Game"})
+        
+        assert_within_budget(statement_counter, response, status.HTTP_201_CREATED)
+    
+    def test_update_game(self, client: TestClient, admin_headers, game_id, statement_counter):
+        """Test updating a game."""
+        with statement_counter:
+            response = client.put(f"/api/v1/games/{game_id}", headers=admin_headers, json={"title": "Renamed Game"})
+        
+        assert_within_budget(statement_counter, response, status.HTTP_200_OK)
+        assert response.json()["title"] == "Renamed Game"
+    
+    def test_create_department(self, client: TestClient, warm_admin_headers, statement_counter):
+        """Test creating a department."""
+        with statement_counter:
+            response = client.post("/api/v1/departments/", headers=warm_admin_headers, json={"title": "Budget Department"})
+        
+        assert_within_budget(statement_counter, response, status.HTTP_201_CREATED)
+    
+    def test_update_department(self, client: TestClient, warm_admin_headers, admin_user, statement_counter):
+        """Test updating a department."""
+        with statement_counter:
+            response = client.put(
+                f"/api/v1/departments/{admin_user.department_id}",
+                headers=warm_admin_headers,
+                json={"description": "Updated"}
+            )
+        
+        assert_within_budget(statement_counter, response, status.HTTP_200_OK)
+        assert response.json()["description"] == "Updated"
+    
+    def test_create_user(self, client: TestClient, warm_admin_headers, admin_user, statement_counter):
+        """Test creating a user."""
+        with statement_counter:
+            response = client.post(
+                "/api/v1/users/",
+                headers=warm_admin_headers,
+                json={
+                    "email": "budget@test.com",
+                    "username": "budget",
+                    "password": "budget123",
+                    "department_id": admin_user.department_id
+                }
+            )
+        
+        assert_within_budget(statement_counter, response, status.HTTP_201_CREATED)
+    
+    def test_update_user(self, client: TestClient, warm_admin_headers, normal_user, statement_counter):
+        """Test updating a user."""
+        with statement_counter:
+            response = client.put(
+                f"/api/v1/users/{normal_user.id}",
+                headers=warm_admin_headers,
+                json={"description": "Updated"}
+            )
+        
+        assert_within_budget(statement_counter, response, status.HTTP_200_OK)
+        assert response.json()["description"] == "Updated"
@@ -0,0 +1,71 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from fastapi import status
+
+from app.core.config import settings
+
+START = datetime(2030, 1, 6, 10)
+RANGE = {"start_date": "2030-01-01T00:00:00Z", "end_date": "2030-02-01T00:00:00Z"}
+
+
+class TestUsageAnalytics:
+    """Test cases for the admin usage analytics endpoints."""
+
+    def _book_slot(self, client: TestClient, admin_headers, normal_user) -> int:
+        game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Analytics Game"}).json()["id"]
+        slot_id = client.post("/api/v1/slots/", headers=admin_headers, json={
+            "start_time": START.isoformat(),
+            "end_time": (START + timedelta(minutes=30)).isoformat(),
+            "capacity": 4,
+            "game_id": game_id
+        }).json()["id"]
+        response = client.post("/api/v1/bookings/", headers=admin_headers, json={
+            "user_id": normal_user.id, "slot_id": slot_id
+        })
+        assert response.status_code == status.HTTP_201_CREATED
+        return game_id
+
+    @pytest.mark.parametrize("rollup", [False, True], ids=["live", "rollup"])
+    def test_usage_reports(self, client: TestClient, admin_headers, normal_user, monkeypatch, rollup):
+        """Test the game, department and hour reports over a booked slot."""
+        game_id = self._book_slot(client, admin_headers, normal_user)
+        if rollup:
+            monkeypatch.setattr(settings, "ANALYTICS_ROLLUP", True)
+            response = client.post("/api/v1/admin/analytics/rollup/refresh", headers=admin_headers)
+            assert response.json() == {"full": True, "hours": 1}
+
+        [game] = client.get("/api/v1/admin/analytics/games", headers=admin_headers, params=RANGE).json()
+        departments = client.get("/api/v1/admin/analytics/departments", headers=admin_headers, params=RANGE).json()
+        [hour] = client.get(
+            "/api/v1/admin/analytics/hours", headers=admin_headers, params={**RANGE, "game_id": game_id}
+        ).json()
+
+        assert game == {
+            "game_id": game_id, "game_title": "Analytics Game", "slots": 1, "capacity": 4,
+            "bookings": 1, "active_bookings": 1, "cancelled_bookings": 0,
+            "utilization": 0.25, "cancellation_rate": 0.0, "peak_hour_of_week": 10
+        }
+        booked = {department["department_title"]: department["bookings"] for department in departments}
+        assert booked == {"Admin Test Department": 0, "Normal Test Department": 1}
+        assert (hour["hour_of_week"], hour["day_of_week"], hour["hour"]) == (10, 0, 10)
+
+    def test_invalid_range(self, client: TestClient, admin_headers):
+        """Test a start date after the end date is rejected."""
+        params = {"start_date": RANGE["end_date"], "end_date": RANGE["start_date"]}
+        response = client.get("/api/v1/admin/analytics/games", headers=admin_headers, params=params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_refresh_while_disabled(self, client: TestClient, admin_headers):
+        """Test refreshing the rollup is a conflict while it is off."""
+        response = client.post("/api/v1/admin/analytics/rollup/refresh", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    @pytest.mark.parametrize("path", ["games", "departments", "hours"])
+    def test_analytics_user_forbidden(self, client: TestClient, user_headers, path):
+        """Test normal user cannot read analytics."""
+        response = client.get(f"/api/v1/admin/analytics/{path}", headers=user_headers, params=RANGE)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,46 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+from app.core.request_metrics import request_metrics
+
+
+class TestRequestMetrics:
+    """Test cases for request query metrics and the admin metrics endpoint."""
+    
+    def test_server_timing_header(self, client: TestClient, admin_headers):
+        """Test responses report the statements they ran in Server-Timing."""
+        response = client.get("/api/v1/games/", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        timing = response.headers["server-timing"]
+        assert timing.startswith("db;dur=")
+        # The current user lookup, then the page of games; its ETag comes from the cached copy
+        assert 'desc="2 queries"' in timing
+        assert "total;dur=" in timing
+    
+    def test_metrics_aggregate_by_route_template(self, client: TestClient, admin_headers):
+        """Test requests to one route with different ids share an entry."""
+        request_metrics.clear()
+        game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Metrics Game"}).json()["id"]
+        client.get(f"/api/v1/games/{game_id}", headers=admin_headers)
+        client.get("/api/v1/games/99999", headers=admin_headers)
+        
+        response = client.get("/api/v1/admin/metrics", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        routes = response.json()["routes"]
+        game_route = routes["GET /api/v1/games/{game_id}"]
+        assert game_route["requests"] == 2
+        assert game_route["queries"]["count"] == 2
+        # Each runs only the load; the ETag comes from the copy it caches
+        assert game_route["queries"]["sum"] == 2
+        assert game_route["slowest_query"].startswith("SELECT")
+        assert routes["POST /api/v1/games/"]["requests"] == 1
+        assert "password_hashing" in response.json()
+    
+    def test_metrics_user_forbidden(self, client: TestClient, user_headers):
+        """Test normal user cannot read metrics."""
+        response = client.get("/api/v1/admin/metrics", headers=user_headers)
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
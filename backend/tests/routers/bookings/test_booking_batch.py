@@ -0,0 +1,152 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+from datetime import datetime, timedelta
+
+
+@pytest.fixture
+def slot_id(client: TestClient, admin_headers):
+    """A slot with room for two bookings."""
+    game_id = client.post(
+        "/api/v1/games/",
+        headers=admin_headers,
+        json={"title": "Batch Game", "description": "Test game for batch bookings"}
+    ).json()["id"]
+    start_time = datetime.now() + timedelta(days=1)
+    return client.post(
+        "/api/v1/slots/",
+        headers=admin_headers,
+        json={
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=1)).isoformat(),
+            "capacity": 2,
+            "game_id": game_id
+        }
+    ).json()["id"]
+
+
+def book(client: TestClient, admin_headers, slot_id: int, user_id: int, booking_status: str) -> int:
+    response = client.post(
+        "/api/v1/bookings/",
+        headers=admin_headers,
+        json={"user_id": user_id, "slot_id": slot_id, "status": booking_status}
+    )
+    return response.json()["id"]
+
+
+def booked_count(client: TestClient, admin_headers, slot_id: int) -> int:
+    return client.get(f"/api/v1/slots/{slot_id}", headers=admin_headers).json()["slots_booked_count"]
+
+
+class TestBookingBatch:
+    """Test cases for batch booking endpoint."""
+    
+    def test_batch_confirm_cancel_create(self, client: TestClient, admin_headers, normal_user, slot_id):
+        """Test mixed operations are applied together and seat counts follow."""
+        pending_id = book(client, admin_headers, slot_id, 1, "PENDING")
+        confirmed_id = book(client, admin_headers, slot_id, normal_user.id, "CONFIRMED")
+        
+        response = client.post(
+            "/api/v1/bookings/batch",
+            headers=admin_headers,
+            json={"items": [
+                {"operation": "confirm", "booking_id": pending_id},
+                {"operation": "cancel", "booking_id": confirmed_id},
+                {"operation": "create", "user_id": normal_user.id, "slot_id": slot_id}
+            ]}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["committed"] is True
+        assert (data["succeeded"], data["failed"]) == (3, 0)
+        assert [result["status"] for result in data["results"]] == ["CONFIRMED", "CANCELLED", "CONFIRMED"]
+        
+        created_id = data["results"][2]["booking_id"]
+        assert client.get(f"/api/v1/bookings/{created_id}", headers=admin_headers).json()["user_id"] == normal_user.id
+        assert client.get(f"/api/v1/bookings/{confirmed_id}", headers=admin_headers).json()["status"] == "CANCELLED"
+        assert booked_count(client, admin_headers, slot_id) == 2
+    
+    def test_batch_reports_partial_failures(self, client: TestClient, admin_headers, normal_user, slot_id):
+        """Test failing items are reported while the others are applied."""
+        first_id = book(client, admin_headers, slot_id, 1, "CONFIRMED")
+        
+        response = client.post(
+            "/api/v1/bookings/batch",
+            headers=admin_headers,
+            json={"items": [
+                {"operation": "confirm", "booking_id": first_id},
+                {"operation": "cancel", "booking_id": 99999},
+                {"operation": "create", "user_id": 1, "slot_id": slot_id},
+                {"operation": "create", "user_id": normal_user.id, "slot_id": slot_id, "status": "PENDING"}
+            ]}
+        )
+        
+        data = response.json()
+        assert data["committed"] is True
+        assert (data["succeeded"], data["failed"]) == (1, 3)
+        assert [result["error"] for result in data["results"]] == [
+            "Booking is already confirmed",
+            "Booking not found",
+            "User already has a booking for this slot",
+            None
+        ]
+        assert booked_count(client, admin_headers, slot_id) == 2
+    
+    def test_batch_capacity_checked_across_items(self, client: TestClient, admin_headers, normal_user, slot_id):
+        """Test seats taken earlier in the batch count against later items."""
+        cancelled_id = book(client, admin_headers, slot_id, 1, "CANCELLED")
+        book(client, admin_headers, slot_id, normal_user.id, "CONFIRMED")
+        
+        response = client.post(
+            "/api/v1/bookings/batch",
+            headers=admin_headers,
+            json={"items": [
+                {"operation": "create", "user_id": 1, "slot_id": slot_id},
+                {"operation": "confirm", "booking_id": cancelled_id}
+            ]}
+        )
+        
+        data = response.json()
+        assert data["results"][0]["success"] is True
+        assert data["results"][1]["error"] == "User already has a booking for this slot"
+        assert booked_count(client, admin_headers, slot_id) == 2
+    
+    def test_batch_all_or_nothing(self, client: TestClient, admin_headers, slot_id):
+        """Test nothing is applied when any item fails and all_or_nothing is set."""
+        pending_id = book(client, admin_headers, slot_id, 1, "PENDING")
+        
+        response = client.post(
+            "/api/v1/bookings/batch",
+            headers=admin_headers,
+            json={"all_or_nothing": True, "items": [
+                {"operation": "cancel", "booking_id": pending_id},
+                {"operation": "confirm", "booking_id": 99999}
+            ]}
+        )
+        
+        data = response.json()
+        assert data["committed"] is False
+        assert data["failed"] == 1
+        assert client.get(f"/api/v1/bookings/{pending_id}", headers=admin_headers).json()["status"] == "PENDING"
+        assert booked_count(client, admin_headers, slot_id) == 1
+    
+    def test_batch_invalid_item(self, client: TestClient, admin_headers):
+        """Test an item missing the fields its operation needs is rejected."""
+        response = client.post(
+            "/api/v1/bookings/batch",
+            headers=admin_headers,
+            json={"items": [{"operation": "cancel"}]}
+        )
+        
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    
+    def test_batch_user_forbidden(self, client: TestClient, user_headers):
+        """Test user cannot apply batches."""
+        response = client.post(
+            "/api/v1/bookings/batch",
+            headers=user_headers,
+            json={"items": [{"operation": "cancel", "booking_id": 1}]}
+        )
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
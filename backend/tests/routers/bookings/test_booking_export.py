@@ -0,0 +1,133 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from tests.routers.slots.test_slot_stream import EventStream
+
+
+def book_slots(client: TestClient, admin_headers, user_id: int, game_title: str, days) -> tuple:
+    """Book one 2030 slot per day offset for a user in a new game; returns (game id, booking ids)."""
+    game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": game_title}).json()["id"]
+    booking_ids = []
+    for day in days:
+        start_time = datetime(2030, 1, 1, 10) + timedelta(days=day)
+        slot_id = client.post("/api/v1/slots/", headers=admin_headers, json={
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=1)).isoformat(),
+            "capacity": 2,
+            "game_id": game_id
+        }).json()["id"]
+        booking = client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": user_id, "slot_id": slot_id})
+        booking_ids.append(booking.json()["id"])
+    return game_id, booking_ids
+
+
+def ndjson(response) -> list:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class StalledDownload(EventStream):
+    """A client that reads the first chunk of a download, then stops reading and hangs up."""
+
+    async def send(self, message):
+        await super().send(message)
+        if message["type"] == "http.response.body" and message.get("body"):
+            await asyncio.Event().wait()
+
+
+class TestBookingExport:
+    """Test cases for the streaming bookings export."""
+
+    def test_ndjson_rows_are_joined(self, client: TestClient, admin_headers, normal_user):
+        """Test each NDJSON line carries the booking's user, department, slot and game."""
+        _, [booking_id] = book_slots(client, admin_headers, normal_user.id, "Export Game", [0])
+
+        response = client.get("/api/v1/bookings/export", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert 'filename="bookings.ndjson"' in response.headers["content-disposition"]
+        [row] = ndjson(response)
+        assert row["id"] == booking_id
+        assert row["username"] == "user"
+        assert row["department_title"] == "Normal Test Department"
+        assert row["game_title"] == "Export Game"
+        assert row["status"] == "CONFIRMED"
+        assert row["start_time"] == "2030-01-01T10:00:00"
+
+    def test_csv_has_header_and_rows(self, client: TestClient, admin_headers, normal_user):
+        """Test the CSV export starts with a header row and has one row per booking."""
+        _, booking_ids = book_slots(client, admin_headers, normal_user.id, "Export Game", [0, 1])
+
+        response = client.get("/api/v1/bookings/export", params={"format": "csv"}, headers=admin_headers)
+
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [int(row["id"]) for row in rows] == booking_ids
+        assert rows[0]["game_title"] == "Export Game"
+        assert rows[0]["email"] == "user@test.com"
+
+    def test_filters(self, client: TestClient, admin_headers, normal_user):
+        """Test the date range, game and status filters combine."""
+        game_id, first_game = book_slots(client, admin_headers, normal_user.id, "First Game", [0, 5, 10])
+        _, second_game = book_slots(client, admin_headers, normal_user.id, "Second Game", [5])
+        client.post(f"/api/v1/bookings/{first_game[2]}/cancel", headers=admin_headers)
+
+        in_range = client.get("/api/v1/bookings/export", headers=admin_headers, params={
+            "start_date": "2030-01-04T00:00:00", "end_date": "2030-01-20T00:00:00"
+        })
+        one_game = client.get("/api/v1/bookings/export", headers=admin_headers, params={"game_id": game_id})
+        cancelled = client.get("/api/v1/bookings/export", headers=admin_headers, params={"status": "CANCELLED"})
+
+        assert [row["id"] for row in ndjson(in_range)] == [first_game[1], first_game[2], second_game[0]]
+        assert [row["id"] for row in ndjson(one_game)] == first_game
+        assert [row["id"] for row in ndjson(cancelled)] == [first_game[2]]
+
+    def test_streams_every_batch(self, client: TestClient, admin_headers, normal_user, monkeypatch):
+        """Test rows fetched over several cursor batches all arrive, in booking id order."""
+        monkeypatch.setattr(settings, "BOOKING_EXPORT_BATCH_SIZE", 2)
+        _, booking_ids = book_slots(client, admin_headers, normal_user.id, "Export Game", range(5))
+
+        response = client.get("/api/v1/bookings/export", headers=admin_headers)
+
+        assert [row["id"] for row in ndjson(response)] == booking_ids
+
+    def test_invalid_range_rejected(self, client: TestClient, admin_headers):
+        """Test a start date after the end date is a 400 before anything streams."""
+        response = client.get("/api/v1/bookings/export", headers=admin_headers, params={
+            "start_date": "2030-02-01T00:00:00", "end_date": "2030-01-01T00:00:00"
+        })
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_forbidden_for_normal_user(self, client: TestClient, user_headers):
+        """Test only admins can export bookings."""
+        response = client.get("/api/v1/bookings/export", headers=user_headers)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    async def test_disconnect_stops_the_export(self, client: TestClient, db_session, admin_headers, normal_user, monkeypatch):
+        """Test a client hanging up mid-download ends the response and releases the session."""
+        monkeypatch.setattr(settings, "BOOKING_EXPORT_BATCH_SIZE", 2)
+        book_slots(client, admin_headers, normal_user.id, "Export Game", range(6))
+        closed = []
+        close = db_session.close
+
+        async def spy_close():
+            closed.append(True)
+            await close()
+
+        monkeypatch.setattr(db_session, "close", spy_close)
+
+        async with StalledDownload("/api/v1/bookings/export", admin_headers) as download:
+            first = await asyncio.wait_for(download.chunks.get(), timeout=5)
+
+        assert download.task.done()
+        assert len(first.splitlines()) == 2
+        assert download.chunks.empty()
+        assert closed
@@ -513,3 +513,43 @@ class TestBookingOperations:
             headers=admin_headers
         )
         assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    def _rebooked_after_cancel(self, client: TestClient, admin_headers, normal_user) -> int:
+        """A cancelled booking whose user has since booked the same slot again; returns the cancelled one's id."""
+        game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Rebooked Game"}).json()["id"]
+        start_time = datetime.now() + timedelta(hours=1)
+        slot_id = client.post(
+            "/api/v1/slots/",
+            headers=admin_headers,
+            json={
+                "start_time": start_time.isoformat(),
+                "end_time": (start_time + timedelta(hours=1)).isoformat(),
+                "capacity": 4,
+                "game_id": game_id
+            }
+        ).json()["id"]
+        booking = {"user_id": normal_user.id, "slot_id": slot_id}
+        first_id = client.post("/api/v1/bookings/", headers=admin_headers, json=booking).json()["id"]
+        client.post(f"/api/v1/bookings/{first_id}/cancel", headers=admin_headers)
+        assert client.post("/api/v1/bookings/", headers=admin_headers, json=booking).status_code == status.HTTP_201_CREATED
+        return first_id
+    
+    def test_confirm_cancelled_booking_already_rebooked(self, client: TestClient, admin_headers, normal_user):
+        """Test confirming a cancelled booking is a 400 when the user has booked the slot again."""
+        booking_id = self._rebooked_after_cancel(client, admin_headers, normal_user)
+        
+        response = client.post(f"/api/v1/bookings/{booking_id}/confirm", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "User already has a booking for this slot"
+        assert client.get(f"/api/v1/bookings/{booking_id}", headers=admin_headers).json()["status"] == "CANCELLED"
+    
+    @pytest.mark.parametrize("new_status", ["PENDING", "CONFIRMED"])
+    def test_update_cancelled_booking_already_rebooked(self, client: TestClient, admin_headers, normal_user, new_status):
+        """Test re-activating a cancelled booking is a 400 when the user has booked the slot again."""
+        booking_id = self._rebooked_after_cancel(client, admin_headers, normal_user)
+        
+        response = client.put(f"/api/v1/bookings/{booking_id}", headers=admin_headers, json={"status": new_status})
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "User already has a booking for this slot"
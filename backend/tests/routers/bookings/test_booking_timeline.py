@@ -0,0 +1,106 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+from datetime import datetime, timedelta, timezone
+
+
+def book_slots(client: TestClient, admin_headers, user_id: int, hour_offsets) -> dict:
+    """Book one slot per offset (in hours from now) for a user; returns booking ids by offset."""
+    game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Timeline Game"}).json()["id"]
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    bookings = {}
+    for offset in hour_offsets:
+        start_time = now + timedelta(hours=offset)
+        slot_id = client.post("/api/v1/slots/", headers=admin_headers, json={
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(minutes=30)).isoformat(),
+            "capacity": 2,
+            "game_id": game_id
+        }).json()["id"]
+        booking = client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": user_id, "slot_id": slot_id})
+        bookings[offset] = booking.json()["id"]
+    return bookings
+
+
+class TestBookingTimeline:
+    """Test cases for the user booking timeline endpoint."""
+
+    def test_timeline_embeds_slot_and_game(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test each entry carries its slot window and game title."""
+        bookings = book_slots(client, admin_headers, normal_user.id, [5])
+
+        response = client.get(f"/api/v1/bookings/user/{normal_user.id}/timeline", headers=user_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        [entry] = response.json()
+        assert entry["id"] == bookings[5]
+        assert entry["game_title"] == "Timeline Game"
+        assert entry["status"] == "CONFIRMED"
+        assert datetime.fromisoformat(entry["end_time"]) - datetime.fromisoformat(entry["start_time"]) == timedelta(minutes=30)
+
+    def test_timeline_sorted_by_start_time(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test entries come in slot start order, not booking order."""
+        bookings = book_slots(client, admin_headers, normal_user.id, [30, -10, 20])
+
+        response = client.get(f"/api/v1/bookings/user/{normal_user.id}/timeline", headers=user_headers)
+
+        assert [entry["id"] for entry in response.json()] == [bookings[-10], bookings[20], bookings[30]]
+
+    def test_upcoming_and_past(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test upcoming runs soonest first and past runs most recent first."""
+        bookings = book_slots(client, admin_headers, normal_user.id, [-20, 10, -5, 30])
+        path = f"/api/v1/bookings/user/{normal_user.id}/timeline"
+
+        upcoming = client.get(path, params={"period": "upcoming"}, headers=user_headers).json()
+        past = client.get(path, params={"period": "past"}, headers=user_headers).json()
+
+        assert [entry["id"] for entry in upcoming] == [bookings[10], bookings[30]]
+        assert [entry["id"] for entry in past] == [bookings[-5], bookings[-20]]
+
+    @pytest.mark.parametrize("period", ["upcoming", "past"])
+    def test_cursor_pagination(self, client: TestClient, admin_headers, user_headers, normal_user, period):
+        """Test following X-Next-Cursor walks the whole timeline without repeats."""
+        book_slots(client, admin_headers, normal_user.id, [-30, -20, -10, 10, 20, 30])
+        path = f"/api/v1/bookings/user/{normal_user.id}/timeline"
+        expected = [entry["id"] for entry in client.get(path, params={"period": period}, headers=user_headers).json()]
+
+        seen = []
+        params = {"period": period, "limit": 2}
+        while True:
+            response = client.get(path, params=params, headers=user_headers)
+            seen += [entry["id"] for entry in response.json()]
+            if "x-next-cursor" not in response.headers:
+                break
+            params["cursor"] = response.headers["x-next-cursor"]
+
+        assert len(expected) == 3
+        assert seen == expected
+
+    def test_status_filter(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test the status filter keeps only bookings in that status."""
+        bookings = book_slots(client, admin_headers, normal_user.id, [10, 20])
+        client.post(f"/api/v1/bookings/{bookings[10]}/cancel", headers=user_headers)
+
+        response = client.get(
+            f"/api/v1/bookings/user/{normal_user.id}/timeline", params={"status": "CANCELLED"}, headers=user_headers
+        )
+
+        assert [entry["id"] for entry in response.json()] == [bookings[10]]
+
+    def test_other_users_timeline_forbidden(self, client: TestClient, user_headers, admin_user):
+        """Test a normal user cannot read another user's timeline."""
+        response = client.get(f"/api/v1/bookings/user/{admin_user.id}/timeline", headers=user_headers)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_timeline_is_one_statement(self, client: TestClient, admin_headers, user_headers, normal_user, statement_counter):
+        """Test the timeline loads in a single joined SELECT, however many bookings there are."""
+        book_slots(client, admin_headers, normal_user.id, [10, 20, 30])
+        # Warm the principal cache so only the timeline query is counted
+        client.get(f"/api/v1/bookings/user/{normal_user.id}/timeline", headers=user_headers)
+
+        with statement_counter:
+            client.get(f"/api/v1/bookings/user/{normal_user.id}/timeline", headers=user_headers)
+
+        assert statement_counter.count == 1
+        assert "JOIN games" in statement_counter.statements[0]
@@ -0,0 +1,62 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+
+def create_booking(client: TestClient, admin_headers, user_id: int) -> dict:
+    game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Etag Game"}).json()["id"]
+    slot_id = client.post("/api/v1/slots/", headers=admin_headers, json={
+        "start_time": "2030-01-01T10:00:00",
+        "end_time": "2030-01-01T11:00:00",
+        "capacity": 2,
+        "game_id": game_id
+    }).json()["id"]
+    return client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": user_id, "slot_id": slot_id}).json()
+
+
+class TestBookingsConditionalGet:
+    """Test cases for ETags on booking reads."""
+    
+    def test_user_bookings_not_modified(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test an unchanged booking list answers If-None-Match with 304."""
+        create_booking(client, admin_headers, normal_user.id)
+        path = f"/api/v1/bookings/user/{normal_user.id}"
+        etag = client.get(path, headers=user_headers).headers["etag"]
+        
+        response = client.get(path, headers={**user_headers, "If-None-Match": etag})
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    def test_cancel_changes_etags(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test cancelling a booking changes its detail and list ETags."""
+        booking = create_booking(client, admin_headers, normal_user.id)
+        detail_path = f"/api/v1/bookings/{booking['id']}"
+        active_path = f"/api/v1/bookings/user/{normal_user.id}/active"
+        detail_etag = client.get(detail_path, headers=user_headers).headers["etag"]
+        active_etag = client.get(active_path, headers=user_headers).headers["etag"]
+        
+        client.post(f"/api/v1/bookings/{booking['id']}/cancel", headers=user_headers)
+        
+        detail = client.get(detail_path, headers={**user_headers, "If-None-Match": detail_etag})
+        active = client.get(active_path, headers={**user_headers, "If-None-Match": active_etag})
+        assert detail.status_code == active.status_code == status.HTTP_200_OK
+        assert detail.json()["status"] == "CANCELLED"
+        assert active.json() == []
+    
+    def test_other_users_booking_forbidden_before_etag(self, client: TestClient, admin_headers, user_headers, admin_user):
+        """Test the ownership check runs before a 304 could reveal anything."""
+        booking = create_booking(client, admin_headers, admin_user.id)
+        etag = client.get(f"/api/v1/bookings/{booking['id']}", headers=admin_headers).headers["etag"]
+        
+        response = client.get(f"/api/v1/bookings/{booking['id']}", headers={**user_headers, "If-None-Match": etag})
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+    
+    def test_status_list_not_modified(self, client: TestClient, admin_headers, normal_user):
+        """Test the admin status list supports conditional GETs too."""
+        create_booking(client, admin_headers, normal_user.id)
+        etag = client.get("/api/v1/bookings/status/CONFIRMED", headers=admin_headers).headers["etag"]
+        
+        response = client.get("/api/v1/bookings/status/CONFIRMED", headers={**admin_headers, "If-None-Match": etag})
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
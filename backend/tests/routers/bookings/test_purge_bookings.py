@@ -0,0 +1,146 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+from datetime import datetime, timedelta, timezone
+
+
+def create_slot(client: TestClient, admin_headers, game_id: int, start_time: datetime) -> int:
+    response = client.post(
+        "/api/v1/slots/",
+        headers=admin_headers,
+        json={
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=1)).isoformat(),
+            "capacity": 4,
+            "game_id": game_id
+        }
+    )
+    return response.json()["id"]
+
+
+def book(client: TestClient, admin_headers, slot_id: int, user_id: int, booking_status: str = "CONFIRMED") -> int:
+    response = client.post(
+        "/api/v1/bookings/",
+        headers=admin_headers,
+        json={"user_id": user_id, "slot_id": slot_id, "status": booking_status}
+    )
+    return response.json()["id"]
+
+
+def purge(client: TestClient, headers, **body):
+    response = client.post("/api/v1/bookings/purge", headers=headers, json=body)
+    lines = [json.loads(line) for line in response.text.splitlines()] if response.status_code == 200 else []
+    return response, lines
+
+
+@pytest.fixture
+def booked_slots(client: TestClient, admin_headers, normal_user):
+    """Two bookings on each of three slots: two on 2030-01-07 and one on 2030-01-08."""
+    game_id = client.post(
+        "/api/v1/games/",
+        headers=admin_headers,
+        json={"title": "Purge Game", "description": "Test game for purging bookings"}
+    ).json()["id"]
+    slot_ids = [
+        create_slot(client, admin_headers, game_id, datetime(2030, 1, 7, 10)),
+        create_slot(client, admin_headers, game_id, datetime(2030, 1, 7, 12)),
+        create_slot(client, admin_headers, game_id, datetime(2030, 1, 8, 10)),
+    ]
+    for slot_id in slot_ids:
+        book(client, admin_headers, slot_id, 1)
+        book(client, admin_headers, slot_id, normal_user.id, "CANCELLED")
+    return game_id, slot_ids
+
+
+class TestPurgeBookings:
+    """Test cases for purge bookings endpoint."""
+    
+    def test_purge_time_range_in_batches(self, client: TestClient, admin_headers, booked_slots):
+        """Test bookings on slots in the range are deleted batch by batch with progress lines."""
+        game_id, slot_ids = booked_slots
+        
+        response, lines = purge(
+            client, admin_headers,
+            start_time="2030-01-07T00:00:00", end_time="2030-01-08T00:00:00", batch_size=3
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert lines[0] == {"matched": 4}
+        assert [line["deleted"] for line in lines[1:-1]] == [3, 1]
+        assert lines[-1] == {"done": True, "deleted_count": 4, "batches": 2}
+        
+        for slot_id, remaining in zip(slot_ids, [0, 0, 2]):
+            bookings = client.get(f"/api/v1/bookings/slot/{slot_id}", headers=admin_headers).json()
+            assert len(bookings) == remaining
+        slot = client.get(f"/api/v1/slots/{slot_ids[0]}", headers=admin_headers).json()
+        assert slot["slots_booked_count"] == 0
+    
+    def test_purge_by_status(self, client: TestClient, admin_headers, booked_slots):
+        """Test only bookings in the given status are deleted and seat counts are kept."""
+        game_id, slot_ids = booked_slots
+        
+        response, lines = purge(client, admin_headers, game_id=game_id, status="CANCELLED")
+        
+        assert lines[-1]["deleted_count"] == 3
+        for slot_id in slot_ids:
+            bookings = client.get(f"/api/v1/bookings/slot/{slot_id}", headers=admin_headers).json()
+            assert [booking["status"] for booking in bookings] == ["CONFIRMED"]
+            slot = client.get(f"/api/v1/slots/{slot_id}", headers=admin_headers).json()
+            assert slot["slots_booked_count"] == 1
+    
+    def test_purge_offset_aware_bounds(self, client: TestClient, admin_headers, booked_slots):
+        """Test offset-aware bounds are compared against slot times in UTC."""
+        # 2030-01-07T11:00 to 13:00 UTC only covers the 12:00 slot
+        response, lines = purge(
+            client, admin_headers, start_time="2030-01-07T12:00:00+01:00", end_time="2030-01-07T14:00:00+01:00"
+        )
+        
+        assert lines[-1]["deleted_count"] == 2
+    
+    def test_purge_requires_filter(self, client: TestClient, admin_headers):
+        """Test a purge without any filter is rejected."""
+        response, lines = purge(client, admin_headers, batch_size=100)
+        
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    
+    def test_purge_user_forbidden(self, client: TestClient, user_headers):
+        """Test user cannot purge bookings."""
+        response, lines = purge(client, user_headers, status="CANCELLED")
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestResetCurrentDayBookings:
+    """Test cases for reset current day bookings endpoint."""
+    
+    def test_reset_deletes_only_today(self, client: TestClient, admin_headers):
+        """Test bookings on today's slots are deleted and tomorrow's are kept."""
+        game_id = client.post(
+            "/api/v1/games/",
+            headers=admin_headers,
+            json={"title": "Reset Game", "description": "Test game for resetting bookings"}
+        ).json()["id"]
+        today = datetime.now(timezone.utc).replace(tzinfo=None).replace(hour=0, minute=30, second=0, microsecond=0)
+        today_slot = create_slot(client, admin_headers, game_id, today)
+        tomorrow_slot = create_slot(client, admin_headers, game_id, today + timedelta(days=1))
+        book(client, admin_headers, today_slot, 1)
+        book(client, admin_headers, tomorrow_slot, 1)
+        
+        response = client.post("/api/v1/bookings/reset-current-day?tz=UTC", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["deleted_count"] == 1
+        assert data["timezone"] == "UTC"
+        assert client.get(f"/api/v1/bookings/slot/{today_slot}", headers=admin_headers).json() == []
+        assert len(client.get(f"/api/v1/bookings/slot/{tomorrow_slot}", headers=admin_headers).json()) == 1
+        slot = client.get(f"/api/v1/slots/{today_slot}", headers=admin_headers).json()
+        assert slot["slots_booked_count"] == 0
+    
+    def test_reset_unknown_timezone(self, client: TestClient, admin_headers):
+        """Test an unknown timezone is rejected."""
+        response = client.post("/api/v1/bookings/reset-current-day?tz=Mars/Olympus", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
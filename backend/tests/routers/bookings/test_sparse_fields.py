@@ -0,0 +1,55 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+
+def create_booking(client: TestClient, admin_headers, user_id: int) -> dict:
+    game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Projection Game"}).json()["id"]
+    slot_id = client.post("/api/v1/slots/", headers=admin_headers, json={
+        "start_time": "2030-01-01T10:00:00",
+        "end_time": "2030-01-01T11:00:00",
+        "capacity": 2,
+        "game_id": game_id
+    }).json()["id"]
+    return client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": user_id, "slot_id": slot_id}).json()
+
+
+class TestBookingProjections:
+    """Test cases for column-projected booking reads and sparse fieldsets."""
+    
+    def test_list_is_one_statement(self, client: TestClient, admin_headers, normal_user, statement_counter):
+        """Test a booking list selects its columns without loading users, slots or games."""
+        create_booking(client, admin_headers, normal_user.id)
+        client.get("/api/v1/bookings/", headers=admin_headers)
+        
+        with statement_counter:
+            response = client.get("/api/v1/bookings/", headers={**admin_headers, "If-None-Match": "stale"})
+        
+        assert response.status_code == status.HTTP_200_OK
+        # The ETag version query and the page itself
+        assert statement_counter.count == 2
+        assert not any("FROM users" in statement or "FROM games" in statement for statement in statement_counter.statements)
+    
+    def test_sparse_fieldset(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test fields= returns only the requested fields, plus id."""
+        booking = create_booking(client, admin_headers, normal_user.id)
+        
+        response = client.get(f"/api/v1/bookings/user/{normal_user.id}?fields=slot_id,status", headers=user_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [{"id": booking["id"], "slot_id": booking["slot_id"], "status": "CONFIRMED"}]
+        assert "etag" in response.headers
+    
+    def test_full_response_unchanged(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test the list without fields= still returns every BookingOut field."""
+        booking = create_booking(client, admin_headers, normal_user.id)
+        
+        response = client.get(f"/api/v1/bookings/user/{normal_user.id}", headers=user_headers)
+        
+        assert response.json() == [booking]
+    
+    def test_unknown_field_rejected(self, client: TestClient, admin_headers):
+        """Test an unknown field is a 400."""
+        response = client.get("/api/v1/bookings/?fields=user", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,6 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import status
+from datetime import datetime, timedelta
 
 
 class TestGetDepartment:
@@ -37,3 +38,77 @@ class TestGetDepartment:
         response = client.get("/api/v1/departments/1")
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_get_department_booking_totals(self, client: TestClient, user_headers, admin_headers):
+        """Test slot_booked counts the department's bookings, optionally filtered."""
+        department_id = client.post(
+            "/api/v1/departments/",
+            headers=admin_headers,
+            json={"title": "Department With Bookings"}
+        ).json()["id"]
+        user_ids = [
+            client.post(
+                "/api/v1/users/",
+                headers=admin_headers,
+                json={
+                    "email": f"member{i}@test.com",
+                    "username": f"member{i}",
+                    "password": "member123",
+                    "department_id": department_id
+                }
+            ).json()["id"]
+            for i in range(2)
+        ]
+        game_id = client.post(
+            "/api/v1/games/",
+            headers=admin_headers,
+            json={"title": "Game for Department Totals"}
+        ).json()["id"]
+        start_time = datetime.now() + timedelta(days=1)
+        slot_id = client.post(
+            "/api/v1/slots/",
+            headers=admin_headers,
+            json={
+                "start_time": start_time.isoformat(),
+                "end_time": (start_time + timedelta(hours=1)).isoformat(),
+                "capacity": 4,
+                "game_id": game_id
+            }
+        ).json()["id"]
+        for user_id, booking_status in zip(user_ids, ["CONFIRMED", "CANCELLED"]):
+            client.post(
+                "/api/v1/bookings/",
+                headers=admin_headers,
+                json={"user_id": user_id, "slot_id": slot_id, "status": booking_status}
+            )
+
+        url = f"/api/v1/departments/{department_id}"
+        assert client.get(url, headers=user_headers).json()["slot_booked"] == 2
+        assert client.get(f"{url}?booking_status=CONFIRMED", headers=user_headers).json()["slot_booked"] == 1
+        window = f"start_date={(start_time + timedelta(hours=1)).isoformat()}"
+        assert client.get(f"{url}?{window}", headers=user_headers).json()["slot_booked"] == 0
+
+        listed = client.get("/api/v1/departments/", headers=user_headers).json()
+        assert [department["slot_booked"] for department in listed if department["id"] == department_id] == [2]
+
+    def test_get_department_booking_totals_with_offset_window(self, client: TestClient, user_headers, admin_headers, normal_user):
+        """Test a date window with a UTC offset is compared with slot start times in UTC."""
+        game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Offset Window Game"}).json()["id"]
+        slot_id = client.post(
+            "/api/v1/slots/",
+            headers=admin_headers,
+            json={
+                "start_time": "2030-01-01T10:00:00",
+                "end_time": "2030-01-01T11:00:00",
+                "capacity": 4,
+                "game_id": game_id
+            }
+        ).json()["id"]
+        client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": normal_user.id, "slot_id": slot_id})
+
+        url = f"/api/v1/departments/{normal_user.department_id}"
+        # 15:00+05:00 is 10:00 UTC, when the slot starts
+        window = {"start_date": "2030-01-01T15:00:00+05:00", "end_date": "2030-01-01T15:30:00+05:00"}
+        assert client.get(url, headers=user_headers, params=window).json()["slot_booked"] == 1
+        later = {"start_date": "2030-01-01T15:01:00+05:00"}
+        assert client.get(url, headers=user_headers, params=later).json()["slot_booked"] == 0
@@ -25,7 +25,28 @@ class TestGetDepartments:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) <= 10
-    
+
+    def test_get_departments_with_cursor(self, client: TestClient, user_headers, admin_headers):
+        """Test the next cursor continues after the last department of the page."""
+        for i in range(3):
+            client.post(
+                "/api/v1/departments/",
+                headers=admin_headers,
+                json={"title": f"Cursor Department {i}"}
+            )
+
+        first_page = client.get("/api/v1/departments/?limit=2", headers=user_headers)
+        assert first_page.status_code == status.HTTP_200_OK
+        cursor = first_page.headers["X-Next-Cursor"]
+
+        second_page = client.get(f"/api/v1/departments/?limit=2&cursor={cursor}", headers=user_headers)
+        assert second_page.status_code == status.HTTP_200_OK
+
+        first_ids = [department["id"] for department in first_page.json()]
+        second_ids = [department["id"] for department in second_page.json()]
+        assert second_ids
+        assert min(second_ids) > max(first_ids)
+
     def test_get_departments_unauthorized(self, client: TestClient):
         """Test unauthorized access to get departments."""
         response = client.get("/api/v1/departments/")
@@ -0,0 +1,127 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+from sqlalchemy import update
+
+from app.core.cache import catalog_cache, catalog_cache_requests
+from app.models.slot import Slot
+
+
+def create_game_with_slot(client: TestClient, admin_headers, capacity: int = 1) -> tuple:
+    game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Cached Game"}).json()["id"]
+    slot_id = client.post("/api/v1/slots/", headers=admin_headers, json={
+        "start_time": "2030-01-01T10:00:00",
+        "end_time": "2030-01-01T11:00:00",
+        "capacity": capacity,
+        "game_id": game_id
+    }).json()["id"]
+    return game_id, slot_id
+
+
+class TestCatalogCache:
+    """Test cases for cached game and slot catalog reads."""
+    
+    def test_repeated_reads_hit_the_cache(self, client: TestClient, admin_headers, user_headers):
+        """Test a repeated read is served without querying the games table."""
+        game_id, _ = create_game_with_slot(client, admin_headers)
+        hits = catalog_cache_requests.value("game", "hit")
+        
+        first = client.get(f"/api/v1/games/{game_id}", headers=user_headers)
+        second = client.get(f"/api/v1/games/{game_id}", headers=user_headers)
+        
+        assert first.json() == second.json()
+        assert catalog_cache_requests.value("game", "hit") == hits + 1
+        # The ETag comes from the cached copy and the principal is cached per token, so nothing is queried
+        assert 'desc="0 queries"' in second.headers["server-timing"]
+        assert first.headers["etag"] == second.headers["etag"]
+    
+    def test_game_update_invalidates_game_and_list(self, client: TestClient, admin_headers, user_headers):
+        """Test updating a game is visible in its detail and in the list."""
+        game_id, _ = create_game_with_slot(client, admin_headers)
+        client.get(f"/api/v1/games/{game_id}", headers=user_headers)
+        client.get("/api/v1/games/", headers=user_headers)
+        
+        client.put(f"/api/v1/games/{game_id}", headers=admin_headers, json={"title": "Renamed Game"})
+        
+        assert client.get(f"/api/v1/games/{game_id}", headers=user_headers).json()["title"] == "Renamed Game"
+        assert client.get("/api/v1/games/", headers=user_headers).json()[0]["title"] == "Renamed Game"
+    
+    def test_slot_changes_invalidate_game_counts(self, client: TestClient, admin_headers, user_headers):
+        """Test creating and deleting slots updates cached game counts and slot lists."""
+        game_id, slot_id = create_game_with_slot(client, admin_headers)
+        assert client.get(f"/api/v1/games/{game_id}", headers=user_headers).json()["total_slots"] == 1
+        assert len(client.get(f"/api/v1/slots/game/{game_id}", headers=user_headers).json()) == 1
+        
+        client.delete(f"/api/v1/slots/{slot_id}", headers=admin_headers)
+        
+        assert client.get(f"/api/v1/games/{game_id}", headers=user_headers).json()["total_slots"] == 0
+        assert client.get(f"/api/v1/slots/game/{game_id}", headers=user_headers).json() == []
+    
+    def test_bookings_invalidate_availability(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test booking the last seat and cancelling it update cached availability."""
+        game_id, slot_id = create_game_with_slot(client, admin_headers)
+        date_range = {"start_date": "2030-01-01T00:00:00", "end_date": "2030-01-02T00:00:00"}
+        assert client.get(f"/api/v1/games/{game_id}", headers=user_headers).json()["available_slots"] == 1
+        assert client.get("/api/v1/slots/date-range/", headers=user_headers, params=date_range).json()[0]["is_full"] is False
+        
+        booking = client.post("/api/v1/bookings/", headers=admin_headers, json={
+            "user_id": normal_user.id,
+            "slot_id": slot_id
+        })
+        assert booking.status_code == status.HTTP_201_CREATED
+        
+        assert client.get(f"/api/v1/games/{game_id}", headers=user_headers).json()["available_slots"] == 0
+        assert client.get("/api/v1/games/", headers=user_headers).json()[0]["available_slots"] == 0
+        assert client.get("/api/v1/slots/date-range/", headers=user_headers, params=date_range).json()[0]["is_full"] is True
+        assert client.get(f"/api/v1/slots/game/{game_id}", headers=user_headers).json()[0]["slots_booked_count"] == 1
+        
+        client.post(f"/api/v1/bookings/{booking.json()['id']}/cancel", headers=admin_headers)
+        
+        assert client.get(f"/api/v1/games/{game_id}", headers=user_headers).json()["available_slots"] == 1
+        assert client.get(f"/api/v1/slots/game/{game_id}", headers=user_headers).json()[0]["slots_booked_count"] == 0
+    
+    def test_booking_without_fullness_change_keeps_game_cached(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test a booking that leaves seats free only invalidates the slot lists."""
+        game_id, slot_id = create_game_with_slot(client, admin_headers, capacity=3)
+        client.get(f"/api/v1/games/{game_id}", headers=user_headers)
+        client.get(f"/api/v1/slots/game/{game_id}", headers=user_headers)
+        hits = catalog_cache_requests.value("game", "hit")
+        
+        client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": normal_user.id, "slot_id": slot_id})
+        
+        assert client.get(f"/api/v1/games/{game_id}", headers=user_headers).json()["available_slots"] == 1
+        assert catalog_cache_requests.value("game", "hit") == hits + 1
+        assert client.get(f"/api/v1/slots/game/{game_id}", headers=user_headers).json()[0]["slots_booked_count"] == 1
+    
+    async def test_etag_follows_the_cached_copy(self, client: TestClient, db_session, admin_headers, user_headers):
+        """Test a cached copy that lags the database keeps its own ETag, so the fresh copy isn't answered with 304."""
+        game_id, slot_id = create_game_with_slot(client, admin_headers, capacity=2)
+        url = f"/api/v1/slots/game/{game_id}"
+        etag = client.get(url, headers=user_headers).headers["etag"]
+        # A write this worker's cache never heard of, as one committed through another worker
+        await db_session.execute(update(Slot).where(Slot.id == slot_id).values(booked_count=1))
+        await db_session.commit()
+        
+        stale = client.get(url, headers={**user_headers, "If-None-Match": etag})
+        assert stale.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        await catalog_cache.clear()
+        fresh = client.get(url, headers={**user_headers, "If-None-Match": etag})
+        assert fresh.status_code == status.HTTP_200_OK
+        assert fresh.json()[0]["slots_booked_count"] == 1
+        assert fresh.headers["etag"] != etag
+    
+    def test_user_deletion_invalidates_availability(self, client: TestClient, admin_headers, normal_user):
+        """Test deleting a user frees their seats in cached slot lists and game counts."""
+        game_id, slot_id = create_game_with_slot(client, admin_headers)
+        client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": normal_user.id, "slot_id": slot_id})
+        assert client.get(f"/api/v1/slots/game/{game_id}", headers=admin_headers).json()[0]["is_full"] is True
+        assert client.get(f"/api/v1/games/{game_id}", headers=admin_headers).json()["available_slots"] == 0
+        
+        response = client.delete(f"/api/v1/users/{normal_user.id}", headers=admin_headers)
+        assert response.status_code == status.HTTP_200_OK
+        
+        slot = client.get(f"/api/v1/slots/game/{game_id}", headers=admin_headers).json()[0]
+        assert (slot["slots_booked_count"], slot["is_full"]) == (0, False)
+        assert client.get(f"/api/v1/games/{game_id}", headers=admin_headers).json()["available_slots"] == 1
@@ -0,0 +1,64 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+
+class TestGamesConditionalGet:
+    """Test cases for ETags on game reads."""
+    
+    def test_list_not_modified(self, client: TestClient, admin_headers, user_headers):
+        """Test an unchanged list answers If-None-Match with 304 and no body."""
+        client.post("/api/v1/games/", headers=admin_headers, json={"title": "Etag Game"})
+        first = client.get("/api/v1/games/", headers=user_headers)
+        etag = first.headers["etag"]
+        
+        response = client.get("/api/v1/games/", headers={**user_headers, "If-None-Match": etag})
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert first.headers["cache-control"] == "private, no-cache"
+    
+    def test_query_params_are_part_of_the_etag(self, client: TestClient, user_headers):
+        """Test different pages get different ETags."""
+        first = client.get("/api/v1/games/?limit=10", headers=user_headers)
+        second = client.get("/api/v1/games/?limit=20", headers=user_headers)
+        
+        assert first.headers["etag"] != second.headers["etag"]
+    
+    def test_game_etag_changes_with_its_slots(self, client: TestClient, admin_headers, user_headers):
+        """Test adding a slot changes the game's ETag, since its counts change."""
+        game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Etag Game"}).json()["id"]
+        etag = client.get(f"/api/v1/games/{game_id}", headers=user_headers).headers["etag"]
+        
+        client.post("/api/v1/slots/", headers=admin_headers, json={
+            "start_time": "2030-01-01T10:00:00",
+            "end_time": "2030-01-01T11:00:00",
+            "capacity": 2,
+            "game_id": game_id
+        })
+        response = client.get(f"/api/v1/games/{game_id}", headers={**user_headers, "If-None-Match": etag})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total_slots"] == 1
+        assert response.headers["etag"] != etag
+    
+    def test_game_update_changes_etag(self, client: TestClient, admin_headers, user_headers):
+        """Test updating a game changes its detail and list ETags."""
+        game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Etag Game"}).json()["id"]
+        detail_etag = client.get(f"/api/v1/games/{game_id}", headers=user_headers).headers["etag"]
+        list_etag = client.get("/api/v1/games/", headers=user_headers).headers["etag"]
+        
+        client.put(f"/api/v1/games/{game_id}", headers=admin_headers, json={"description": "Updated"})
+        
+        detail = client.get(f"/api/v1/games/{game_id}", headers={**user_headers, "If-None-Match": detail_etag})
+        games = client.get("/api/v1/games/", headers={**user_headers, "If-None-Match": list_etag})
+        assert detail.status_code == games.status_code == status.HTTP_200_OK
+        assert detail.json()["description"] == "Updated"
+    
+    def test_missing_game_has_no_etag(self, client: TestClient, user_headers):
+        """Test a 404 carries no ETag."""
+        response = client.get("/api/v1/games/999", headers={**user_headers, "If-None-Match": "*"})
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "etag" not in response.headers
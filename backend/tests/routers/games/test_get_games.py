@@ -1,6 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import status
+from datetime import datetime, timedelta
 
 
 class TestGetGames:
@@ -89,6 +90,44 @@ class TestGetGames:
         assert isinstance(data, list)
         assert len(data) <= 2
     
+    def test_get_games_with_available_slots_excludes_full_games(self, client: TestClient, user_headers, admin_headers, normal_user):
+        """Test a game whose only slot is full is not listed and counts come from the database."""
+        game_ids = []
+        for title in ["Full Game", "Open Game"]:
+            game_response = client.post(
+                "/api/v1/games/",
+                headers=admin_headers,
+                json={"title": title, "description": "Test game for availability"}
+            )
+            game_ids.append(game_response.json()["id"])
+
+        start_time = datetime.now() + timedelta(hours=1)
+        for game_id in game_ids:
+            slot_response = client.post(
+                "/api/v1/slots/",
+                headers=admin_headers,
+                json={
+                    "start_time": start_time.isoformat(),
+                    "end_time": (start_time + timedelta(hours=2)).isoformat(),
+                    "capacity": 1,
+                    "game_id": game_id
+                }
+            )
+            if game_id == game_ids[0]:
+                client.post(
+                    "/api/v1/bookings/",
+                    headers=admin_headers,
+                    json={"user_id": normal_user.id, "slot_id": slot_response.json()["id"], "status": "CONFIRMED"}
+                )
+
+        response = client.get("/api/v1/games/available/?limit=1", headers=user_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [game["id"] for game in data] == [game_ids[1]]
+        assert data[0]["total_slots"] == 1
+        assert data[0]["available_slots"] == 1
+
     def test_get_games_with_available_slots_unauthorized(self, client: TestClient):
         """Test unauthorized access to get games with available slots."""
         response = client.get("/api/v1/games/available/")
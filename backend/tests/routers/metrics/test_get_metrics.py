@@ -0,0 +1,64 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+from app.core.security import jwt_decode_failures
+from app.services.booking_service import booking_outcomes
+
+
+class TestGetMetrics:
+    """Test cases for the Prometheus metrics endpoint."""
+    
+    def test_metrics_text_format(self, client: TestClient, user_headers):
+        """Test metrics are served unauthenticated in the text exposition format."""
+        client.get("/api/v1/games/", headers=user_headers)
+        
+        response = client.get("/metrics")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = response.text
+        assert "# TYPE http_requests_total counter" in body
+        assert 'http_requests_total{method="GET",route="/api/v1/games/",status="200"}' in body
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/api/v1/games/",le="+Inf"}' in body
+        assert "http_requests_in_flight 1" in body
+        assert "# TYPE db_pool_wait_seconds histogram" in body
+        assert "# TYPE password_hash_duration_seconds histogram" in body
+    
+    def test_jwt_decode_failures_counted(self, client: TestClient):
+        """Test invalid tokens increment the decode failure counter."""
+        before = jwt_decode_failures.value("invalid")
+        
+        response = client.get("/api/v1/games/", headers={"Authorization": "Bearer not-a-token"})
+        
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert jwt_decode_failures.value("invalid") == before + 1
+        assert f'jwt_decode_failures_total{{reason="invalid"}} {before + 1:g}' in client.get("/metrics").text
+    
+    def test_booking_outcomes_counted(self, client: TestClient, admin_headers, admin_user, normal_user):
+        """Test created, duplicate and full booking attempts are counted separately."""
+        game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Metrics Game"}).json()["id"]
+        slot_ids = [
+            client.post("/api/v1/slots/", headers=admin_headers, json={
+                "start_time": f"2030-01-01T{hour}:00:00",
+                "end_time": f"2030-01-01T{hour + 1}:00:00",
+                "capacity": capacity,
+                "game_id": game_id
+            }).json()["id"]
+            for hour, capacity in ((10, 2), (12, 1))
+        ]
+        before = {outcome: booking_outcomes.value(outcome) for outcome in ("created", "duplicate", "rejected_full")}
+        
+        attempts = [
+            (normal_user.id, slot_ids[0], status.HTTP_201_CREATED),
+            (normal_user.id, slot_ids[0], status.HTTP_400_BAD_REQUEST),
+            (normal_user.id, slot_ids[1], status.HTTP_201_CREATED),
+            (admin_user.id, slot_ids[1], status.HTTP_400_BAD_REQUEST),
+        ]
+        for user_id, slot_id, expected in attempts:
+            response = client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": user_id, "slot_id": slot_id})
+            assert response.status_code == expected
+        
+        assert booking_outcomes.value("created") == before["created"] + 2
+        assert booking_outcomes.value("duplicate") == before["duplicate"] + 1
+        assert booking_outcomes.value("rejected_full") == before["rejected_full"] + 1
@@ -0,0 +1,129 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+
+def create_game(client: TestClient, admin_headers, title: str) -> int:
+    response = client.post(
+        "/api/v1/games/",
+        headers=admin_headers,
+        json={"title": title, "description": "Test game for bulk slots"}
+    )
+    return response.json()["id"]
+
+
+def schedule(game_id: int, **overrides) -> dict:
+    # 2030-01-07 is a Monday
+    data = {
+        "game_id": game_id,
+        "start_date": "2030-01-07",
+        "end_date": "2030-01-13",
+        "day_start": "09:00:00",
+        "day_end": "12:00:00",
+        "slot_minutes": 60,
+        "capacity": 4
+    }
+    data.update(overrides)
+    return data
+
+
+class TestBulkCreateSlots:
+    """Test cases for bulk slot creation endpoint."""
+    
+    def test_bulk_create_expands_weekdays(self, client: TestClient, admin_headers):
+        """Test only the requested weekdays are expanded into back-to-back slots."""
+        game_id = create_game(client, admin_headers, "Bulk Weekdays Game")
+        
+        response = client.post(
+            "/api/v1/slots/bulk/",
+            headers=admin_headers,
+            json=schedule(game_id, weekdays=["MO", "WE", "FR"], slot_minutes=45)
+        )
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        # Four 45 minute slots fit between 09:00 and 12:00 on each of three days
+        assert data["created"] == 12
+        assert data["skipped_overlapping"] == 0
+        assert data["first_start_time"] == "2030-01-07T09:00:00"
+        assert data["last_end_time"] == "2030-01-11T12:00:00"
+        
+        slots = client.get(f"/api/v1/slots/game/{game_id}?limit=100", headers=admin_headers).json()
+        assert len(slots) == 12
+        assert all(slot["capacity"] == 4 for slot in slots)
+    
+    def test_bulk_create_skips_overlapping(self, client: TestClient, admin_headers):
+        """Test generated slots overlapping an existing slot are skipped."""
+        game_id = create_game(client, admin_headers, "Bulk Overlap Game")
+        client.post(
+            "/api/v1/slots/",
+            headers=admin_headers,
+            json={
+                "start_time": "2030-01-07T10:30:00",
+                "end_time": "2030-01-07T11:30:00",
+                "capacity": 2,
+                "game_id": game_id
+            }
+        )
+        
+        response = client.post(
+            "/api/v1/slots/bulk/",
+            headers=admin_headers,
+            json=schedule(game_id, end_date="2030-01-07")
+        )
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["created"] == 1
+        assert data["skipped_overlapping"] == 2
+        assert data["first_start_time"] == "2030-01-07T09:00:00"
+    
+    def test_bulk_create_rejects_overlapping(self, client: TestClient, admin_headers):
+        """Test overlaps fail the whole request when skipping is disabled."""
+        game_id = create_game(client, admin_headers, "Bulk Reject Game")
+        client.post(
+            "/api/v1/slots/",
+            headers=admin_headers,
+            json={
+                "start_time": "2030-01-08T09:00:00",
+                "end_time": "2030-01-08T10:00:00",
+                "capacity": 2,
+                "game_id": game_id
+            }
+        )
+        
+        response = client.post(
+            "/api/v1/slots/bulk/",
+            headers=admin_headers,
+            json=schedule(game_id, skip_overlapping=False)
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        slots = client.get(f"/api/v1/slots/game/{game_id}", headers=admin_headers).json()
+        assert len(slots) == 1
+    
+    def test_bulk_create_invalid_window(self, client: TestClient, admin_headers):
+        """Test a day window that ends before it starts is rejected."""
+        game_id = create_game(client, admin_headers, "Bulk Window Game")
+        
+        response = client.post(
+            "/api/v1/slots/bulk/",
+            headers=admin_headers,
+            json=schedule(game_id, day_start="12:00:00", day_end="09:00:00")
+        )
+        
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    
+    def test_bulk_create_game_not_found(self, client: TestClient, admin_headers):
+        """Test bulk creation for a missing game."""
+        response = client.post("/api/v1/slots/bulk/", headers=admin_headers, json=schedule(99999))
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    def test_bulk_create_user_forbidden(self, client: TestClient, user_headers, admin_headers):
+        """Test normal user cannot bulk create slots."""
+        game_id = create_game(client, admin_headers, "Bulk Forbidden Game")
+        
+        response = client.post("/api/v1/slots/bulk/", headers=user_headers, json=schedule(game_id))
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,60 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+
+def create_slot(client: TestClient, admin_headers, capacity: int = 1) -> dict:
+    game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Etag Game"}).json()["id"]
+    return client.post("/api/v1/slots/", headers=admin_headers, json={
+        "start_time": "2030-01-01T10:00:00",
+        "end_time": "2030-01-01T11:00:00",
+        "capacity": capacity,
+        "game_id": game_id
+    }).json()
+
+
+class TestSlotsConditionalGet:
+    """Test cases for ETags on slot reads."""
+    
+    @pytest.mark.parametrize("path", [
+        "/api/v1/slots/",
+        "/api/v1/slots/available/",
+        "/api/v1/slots/date-range/?start_date=2030-01-01T00:00:00&end_date=2030-01-02T00:00:00",
+    ])
+    def test_lists_not_modified(self, client: TestClient, admin_headers, user_headers, path):
+        """Test unchanged slot lists answer If-None-Match with 304."""
+        create_slot(client, admin_headers)
+        etag = client.get(path, headers=user_headers).headers["etag"]
+        
+        response = client.get(path, headers={**user_headers, "If-None-Match": etag})
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    def test_booking_changes_slot_etags(self, client: TestClient, admin_headers, user_headers, normal_user):
+        """Test a booking changes the slot's ETags, since its booked count changes."""
+        slot = create_slot(client, admin_headers)
+        detail_etag = client.get(f"/api/v1/slots/{slot['id']}", headers=user_headers).headers["etag"]
+        game_etag = client.get(f"/api/v1/slots/game/{slot['game_id']}", headers=user_headers).headers["etag"]
+        
+        client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": normal_user.id, "slot_id": slot["id"]})
+        
+        detail = client.get(f"/api/v1/slots/{slot['id']}", headers={**user_headers, "If-None-Match": detail_etag})
+        by_game = client.get(f"/api/v1/slots/game/{slot['game_id']}", headers={**user_headers, "If-None-Match": game_etag})
+        assert detail.status_code == by_game.status_code == status.HTTP_200_OK
+        assert detail.json()["is_full"] is True
+        assert by_game.json()[0]["slots_booked_count"] == 1
+    
+    def test_other_game_slots_keep_etag(self, client: TestClient, admin_headers, user_headers):
+        """Test a slot added to another game leaves a game's slot list ETag alone."""
+        slot = create_slot(client, admin_headers)
+        etag = client.get(f"/api/v1/slots/game/{slot['game_id']}", headers=user_headers).headers["etag"]
+        
+        other_game = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Other Game"}).json()["id"]
+        client.post("/api/v1/slots/", headers=admin_headers, json={
+            "start_time": "2030-01-01T10:00:00",
+            "end_time": "2030-01-01T11:00:00",
+            "game_id": other_game
+        })
+        
+        response = client.get(f"/api/v1/slots/game/{slot['game_id']}", headers={**user_headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
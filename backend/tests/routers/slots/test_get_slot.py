@@ -62,3 +62,56 @@ class TestGetSlot:
         response = client.get("/api/v1/slots/invalid", headers=user_headers)
         
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    
+    def test_get_slot_booked_count_tracks_active_bookings(self, client: TestClient, user_headers, admin_headers):
+        """Test slots_booked_count counts active bookings only."""
+        game_response = client.post(
+            "/api/v1/games/",
+            headers=admin_headers,
+            json={
+                "title": "Test Game for Booked Count",
+                "description": "Test game for booked count"
+            }
+        )
+        game_id = game_response.json()["id"]
+        
+        start_time = datetime.now() + timedelta(hours=1)
+        end_time = start_time + timedelta(hours=2)
+        
+        create_response = client.post(
+            "/api/v1/slots/",
+            headers=admin_headers,
+            json={
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "capacity": 2,
+                "game_id": game_id
+            }
+        )
+        slot_id = create_response.json()["id"]
+        
+        booking_ids = []
+        for user_id in (1, 2):
+            booking_response = client.post(
+                "/api/v1/bookings/",
+                headers=admin_headers,
+                json={
+                    "user_id": user_id,
+                    "slot_id": slot_id,
+                    "status": "CONFIRMED"
+                }
+            )
+            booking_ids.append(booking_response.json()["id"])
+        
+        response = client.get(f"/api/v1/slots/{slot_id}", headers=user_headers)
+        data = response.json()
+        assert data["slots_booked_count"] == 2
+        assert data["is_full"] is True
+        
+        # Cancelled bookings free their seat
+        client.post(f"/api/v1/bookings/{booking_ids[0]}/cancel", headers=admin_headers)
+        
+        response = client.get(f"/api/v1/slots/{slot_id}", headers=user_headers)
+        data = response.json()
+        assert data["slots_booked_count"] == 1
+        assert data["is_full"] is False
@@ -76,7 +76,61 @@ class TestGetSlots:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) <= 2
-    
+
+    def test_get_slots_with_cursor(self, client: TestClient, user_headers, admin_headers):
+        """Test walking slots page by page with the next cursor."""
+        game_ids = []
+        for title in ["Cursor Game A", "Cursor Game B"]:
+            game_response = client.post(
+                "/api/v1/games/",
+                headers=admin_headers,
+                json={"title": title, "description": "Test game for cursor pagination"}
+            )
+            game_ids.append(game_response.json()["id"])
+
+        # Create slots out of start_time order, two of them starting together
+        created_ids = []
+        for hours, game_id in [(9, game_ids[0]), (3, game_ids[0]), (6, game_ids[0]), (3, game_ids[1]), (12, game_ids[1])]:
+            start_time = datetime(2030, 1, 1) + timedelta(hours=hours)
+            slot_response = client.post(
+                "/api/v1/slots/",
+                headers=admin_headers,
+                json={
+                    "start_time": start_time.isoformat(),
+                    "end_time": (start_time + timedelta(hours=1)).isoformat(),
+                    "capacity": 4,
+                    "game_id": game_id
+                }
+            )
+            assert slot_response.status_code == status.HTTP_201_CREATED
+            created_ids.append(slot_response.json()["id"])
+
+        seen = []
+        cursor = None
+        while True:
+            url = "/api/v1/slots/?limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = client.get(url, headers=user_headers)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert len(data) <= 2
+            seen.extend(data)
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert sorted(slot["id"] for slot in seen) == sorted(created_ids)
+        keys = [(slot["start_time"], slot["id"]) for slot in seen]
+        assert keys == sorted(keys)
+
+    def test_get_slots_invalid_cursor(self, client: TestClient, user_headers):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/api/v1/slots/?cursor=not-a-cursor", headers=user_headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Invalid cursor"
+
     def test_get_slots_unauthorized(self, client: TestClient):
         """Test unauthorized access to get slots."""
         response = client.get("/api/v1/slots/")
@@ -152,6 +206,46 @@ class TestGetSlots:
         assert isinstance(data, list)
         assert len(data) <= 2
     
+    def test_get_available_slots_skips_full_slots_before_limit(self, client: TestClient, user_headers, admin_headers, normal_user):
+        """Test full slots don't leave short pages of available slots."""
+        game_response = client.post(
+            "/api/v1/games/",
+            headers=admin_headers,
+            json={
+                "title": "Test Game for Full Pages",
+                "description": "Test game for full pages"
+            }
+        )
+        game_id = game_response.json()["id"]
+
+        slot_ids = []
+        for i in range(4):
+            start_time = datetime.now() + timedelta(hours=3 * i + 1)
+            slot_response = client.post(
+                "/api/v1/slots/",
+                headers=admin_headers,
+                json={
+                    "start_time": start_time.isoformat(),
+                    "end_time": (start_time + timedelta(hours=2)).isoformat(),
+                    "capacity": 1,
+                    "game_id": game_id
+                }
+            )
+            slot_ids.append(slot_response.json()["id"])
+
+        # Fill the two earliest slots
+        for slot_id in slot_ids[:2]:
+            client.post(
+                "/api/v1/bookings/",
+                headers=admin_headers,
+                json={"user_id": normal_user.id, "slot_id": slot_id, "status": "CONFIRMED"}
+            )
+
+        response = client.get("/api/v1/slots/available/?limit=2", headers=user_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [slot["id"] for slot in response.json()] == slot_ids[2:]
+
     def test_get_available_slots_unauthorized(self, client: TestClient):
         """Test unauthorized access to get available slots."""
         response = client.get("/api/v1/slots/available/")
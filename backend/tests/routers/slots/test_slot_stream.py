@@ -0,0 +1,172 @@
+import asyncio
+import json
+import pytest
+from datetime import datetime
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from tests.test_app import test_app
+from app.schemas.booking import BookingCreate
+from app.schemas.slot import SlotCreate
+from app.services.booking_service import BookingService
+from app.services.slot_service import SlotService
+from app.services.user_service import UserService
+
+
+class EventStream:
+    """Reads an endless streaming response straight from the ASGI app, which TestClient would wait out."""
+
+    def __init__(self, path: str, headers: dict):
+        path, _, query = path.partition("?")
+        self.scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+            "client": ("test", 0),
+            "server": ("test", 80),
+        }
+        self.status = None
+        self.chunks: asyncio.Queue = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self.buffer = ""
+
+    async def receive(self):
+        if not hasattr(self, "_requested"):
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+        elif message["type"] == "http.response.body":
+            await self.chunks.put(message.get("body", b"").decode())
+
+    async def __aenter__(self):
+        self.task = asyncio.create_task(test_app(self.scope, self.receive, self.send))
+        return self
+
+    async def __aexit__(self, *exc):
+        self.disconnected.set()
+        await asyncio.wait_for(self.task, timeout=5)
+
+    async def next_frame(self) -> str:
+        while "\n\n" not in self.buffer:
+            self.buffer += await asyncio.wait_for(self.chunks.get(), timeout=5)
+        frame, self.buffer = self.buffer.split("\n\n", 1)
+        return frame
+
+    async def next_event(self) -> tuple:
+        """(event name, data) of the next event, skipping the retry hint and comments."""
+        while True:
+            lines = dict(line.split(": ", 1) for line in (await self.next_frame()).splitlines())
+            if "event" in lines:
+                return lines["event"], json.loads(lines["data"])
+
+
+async def create_slot(db_session, game_title: str = "Stream Game", capacity: int = 1):
+    from app.models.game import Game
+    game = Game(title=game_title)
+    db_session.add(game)
+    await db_session.commit()
+    return await SlotService(db_session).create_slot(SlotCreate(
+        start_time=datetime(2030, 1, 1, 10),
+        end_time=datetime(2030, 1, 1, 11),
+        capacity=capacity,
+        game_id=game.id
+    ))
+
+
+class TestSlotStream:
+    """Test cases for the slot occupancy event stream."""
+
+    async def test_booking_pushes_occupancy(self, client: TestClient, db_session, user_headers, normal_user):
+        """Test a committed booking is pushed with the slot's new counts."""
+        slot = await create_slot(db_session)
+
+        async with EventStream("/api/v1/slots/stream/", user_headers) as stream:
+            assert await stream.next_frame() == "retry: 3000"
+            assert stream.status == status.HTTP_200_OK
+            await BookingService(db_session).create_booking(BookingCreate(user_id=normal_user.id, slot_id=slot.id))
+
+            event, data = await stream.next_event()
+
+        assert event == "occupancy"
+        assert data["slot_id"] == slot.id
+        assert data["booked_count"] == 1
+        assert data["is_full"] is True
+
+    async def test_filters_by_game(self, client: TestClient, db_session, user_headers, normal_user):
+        """Test a stream filtered to one game skips other games' slots."""
+        other = await create_slot(db_session, "Other Game")
+        watched = await create_slot(db_session, "Watched Game")
+
+        async with EventStream(f"/api/v1/slots/stream/?game_id={watched.game_id}", user_headers) as stream:
+            await stream.next_frame()
+            booking_service = BookingService(db_session)
+            await booking_service.create_booking(BookingCreate(user_id=normal_user.id, slot_id=other.id))
+            await booking_service.create_booking(BookingCreate(user_id=normal_user.id, slot_id=watched.id))
+
+            event, data = await stream.next_event()
+
+        assert data["slot_id"] == watched.id
+
+    async def test_filters_by_offset_aware_dates(self, client: TestClient, db_session, user_headers, normal_user):
+        """Test date filters with a UTC offset are compared with slot times in UTC."""
+        slot = await create_slot(db_session)
+        # 12:00+02:00 is 10:00 UTC, when the slot starts
+        dates = "start_date=2030-01-01T12:00:00%2B02:00&end_date=2030-01-01T11:00:00Z"
+
+        async with EventStream(f"/api/v1/slots/stream/?{dates}", user_headers) as stream:
+            await stream.next_frame()
+            await BookingService(db_session).create_booking(BookingCreate(user_id=normal_user.id, slot_id=slot.id))
+
+            event, data = await stream.next_event()
+
+        assert event == "occupancy"
+        assert data["slot_id"] == slot.id
+
+    async def test_cancel_and_delete_are_pushed(self, client: TestClient, db_session, user_headers, normal_user):
+        """Test a cancellation frees the seat and a deleted slot is marked removed."""
+        slot = await create_slot(db_session)
+        booking_service = BookingService(db_session)
+        booking = await booking_service.create_booking(BookingCreate(user_id=normal_user.id, slot_id=slot.id))
+
+        async with EventStream("/api/v1/slots/stream/", user_headers) as stream:
+            await stream.next_frame()
+            await booking_service.delete_booking(booking.id)
+            freed = await stream.next_event()
+            await SlotService(db_session).delete_slot(slot.id)
+            removed = await stream.next_event()
+
+        assert freed[1]["booked_count"] == 0
+        assert freed[1]["is_full"] is False
+        assert removed[1]["removed"] is True
+
+    async def test_user_deletion_is_pushed(self, client: TestClient, db_session, admin_headers, normal_user):
+        """Test deleting a user pushes the seats their bookings held as freed."""
+        slot = await create_slot(db_session)
+        await BookingService(db_session).create_booking(BookingCreate(user_id=normal_user.id, slot_id=slot.id))
+
+        async with EventStream("/api/v1/slots/stream/", admin_headers) as stream:
+            await stream.next_frame()
+            await UserService(db_session).delete_user(normal_user.id)
+
+            event, data = await stream.next_event()
+
+        assert event == "occupancy"
+        assert (data["slot_id"], data["booked_count"], data["is_full"]) == (slot.id, 0, False)
+
+    def test_stream_requires_authentication(self, client: TestClient):
+        """Test the stream is closed to anonymous clients."""
+        response = client.get("/api/v1/slots/stream/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,71 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+
+
+def book_slots(client: TestClient, admin_headers, user_id: int, count: int) -> None:
+    game_id = client.post("/api/v1/games/", headers=admin_headers, json={"title": "Projection Game"}).json()["id"]
+    for hour in range(count):
+        slot_id = client.post("/api/v1/slots/", headers=admin_headers, json={
+            "start_time": f"2030-01-01T{10 + hour:02d}:00:00",
+            "end_time": f"2030-01-01T{10 + hour:02d}:30:00",
+            "capacity": 2,
+            "game_id": game_id
+        }).json()["id"]
+        client.post("/api/v1/bookings/", headers=admin_headers, json={"user_id": user_id, "slot_id": slot_id})
+
+
+class TestUserProjections:
+    """Test cases for column-projected user reads and sparse fieldsets."""
+    
+    def test_slot_booked_counted_in_query(self, client: TestClient, admin_headers, normal_user, statement_counter):
+        """Test slot_booked is counted in the listing query instead of by loading bookings."""
+        book_slots(client, admin_headers, normal_user.id, 3)
+        
+        with statement_counter:
+            response = client.get("/api/v1/users/", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        counts = {user["id"]: user["slot_booked"] for user in response.json()}
+        assert counts[normal_user.id] == 3
+        assert not any("FROM bookings" in statement and "IN (" in statement for statement in statement_counter.statements)
+    
+    def test_sparse_fieldset(self, client: TestClient, admin_headers, admin_user):
+        """Test fields= returns only the requested fields, plus id."""
+        response = client.get("/api/v1/users/?fields=username,role", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0] == {"id": admin_user.id, "username": "admin", "role": "admin"}
+    
+    def test_sparse_fieldset_skips_booking_count(self, client: TestClient, admin_headers, statement_counter):
+        """Test a fieldset without slot_booked doesn't count bookings at all."""
+        client.get("/api/v1/users/", headers=admin_headers)
+        
+        with statement_counter:
+            client.get("/api/v1/users/?fields=email", headers=admin_headers)
+        
+        assert not any("bookings" in statement for statement in statement_counter.statements)
+    
+    def test_sparse_fieldset_keeps_cursor(self, client: TestClient, admin_headers, normal_user):
+        """Test cursor pagination still works with a sparse fieldset."""
+        first = client.get("/api/v1/users/?fields=email&limit=1", headers=admin_headers)
+        second = client.get(
+            f"/api/v1/users/?fields=email&limit=1&cursor={first.headers['x-next-cursor']}", headers=admin_headers
+        )
+        
+        assert [user["id"] for user in first.json() + second.json()] == sorted([normal_user.id, first.json()[0]["id"]])
+    
+    def test_unknown_field_rejected(self, client: TestClient, admin_headers):
+        """Test an unknown field is a 400, not a silently smaller response."""
+        response = client.get("/api/v1/users/?fields=email,password", headers=admin_headers)
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Unknown fields: password"
+    
+    def test_current_user_without_bookings_load(self, client: TestClient, user_headers, admin_headers, normal_user):
+        """Test /auth/me reports slot_booked from the count."""
+        book_slots(client, admin_headers, normal_user.id, 2)
+        
+        response = client.get("/api/v1/auth/me", headers=user_headers)
+        
+        assert response.json()["slot_booked"] == 2
@@ -0,0 +1 @@
+# Service tests package
@@ -0,0 +1,146 @@
+import pytest
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.usage_rollup import refresh_usage_rollup
+from app.models.booking import Booking, BookingStatus
+from app.models.department import Department
+from app.models.game import Game
+from app.models.slot import Slot
+from app.models.user import User
+from app.services.analytics_service import AnalyticsService
+from tests.conftest import TEST_POSTGRES_URL
+
+START, END = datetime(2030, 1, 1), datetime(2030, 2, 1)
+# 2030-01-06 is a Sunday: hour-of-week 10 is Sunday 10:00, 42 is Monday 18:00
+SUNDAY, MONDAY = datetime(2030, 1, 6, 10), datetime(2030, 1, 7, 18)
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+async def analytics_db(request, tmp_path):
+    if request.param == "postgresql":
+        if not TEST_POSTGRES_URL:
+            pytest.skip("TEST_POSTGRES_URL is not set")
+        engine = create_async_engine(TEST_POSTGRES_URL)
+    else:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'analytics.db'}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture(params=[False, True], ids=["live", "rollup"])
+async def seeded(request, analytics_db: AsyncSession, monkeypatch):
+    """Two games and three departments' bookings in January 2030, plus one slot outside the range.
+
+    Reports read the rollup (after a full refresh) or the live tables; both must agree.
+    """
+    db = analytics_db
+    first, second = Department(title="First"), Department(title="Second")
+    empty = Department(title="Empty")
+    chess, darts = Game(title="Chess"), Game(title="Darts")
+    db.add_all([first, second, empty, chess, darts])
+    await db.flush()
+    alice = User(username="alice", password="x", department_id=first.id)
+    bob = User(username="bob", password="x", department_id=first.id)
+    carol = User(username="carol", password="x", department_id=second.id)
+    sunday = Slot(start_time=SUNDAY, end_time=SUNDAY.replace(minute=30), capacity=2, game_id=chess.id)
+    sunday_later = Slot(start_time=SUNDAY.replace(minute=30), end_time=SUNDAY.replace(hour=11), capacity=2, game_id=chess.id)
+    monday = Slot(start_time=MONDAY, end_time=MONDAY.replace(hour=19), capacity=4, game_id=chess.id)
+    monday_darts = Slot(start_time=MONDAY, end_time=MONDAY.replace(hour=19), capacity=2, game_id=darts.id)
+    february = Slot(start_time=datetime(2030, 2, 3, 10), end_time=datetime(2030, 2, 3, 11), capacity=2, game_id=chess.id)
+    db.add_all([alice, bob, carol, sunday, sunday_later, monday, monday_darts, february])
+    await db.flush()
+    db.add_all([
+        Booking(user_id=alice.id, slot_id=sunday.id, status=BookingStatus.CONFIRMED),
+        Booking(user_id=carol.id, slot_id=sunday.id, status=BookingStatus.CONFIRMED),
+        Booking(user_id=bob.id, slot_id=sunday_later.id, status=BookingStatus.CANCELLED),
+        Booking(user_id=alice.id, slot_id=monday.id, status=BookingStatus.PENDING),
+        Booking(user_id=bob.id, slot_id=monday.id, status=BookingStatus.CONFIRMED),
+        Booking(user_id=carol.id, slot_id=monday.id, status=BookingStatus.CANCELLED),
+        Booking(user_id=carol.id, slot_id=monday_darts.id, status=BookingStatus.CONFIRMED),
+        Booking(user_id=alice.id, slot_id=february.id, status=BookingStatus.CONFIRMED),
+    ])
+    await db.commit()
+
+    if request.param:
+        monkeypatch.setattr(settings, "ANALYTICS_ROLLUP", True)
+        await refresh_usage_rollup(db, full=True)
+    return {"games": (chess.id, darts.id), "departments": (first.id, second.id, empty.id)}
+
+
+class TestAnalyticsService:
+    """Test cases for grouped usage reports, read live and from the rollup."""
+
+    async def test_usage_by_game(self, analytics_db, seeded):
+        """Test per-game seats, bookings, rates and peak hour."""
+        chess, darts = await AnalyticsService(analytics_db).usage_by_game(START, END)
+
+        assert (chess.game_title, chess.slots, chess.capacity) == ("Chess", 3, 8)
+        assert (chess.bookings, chess.active_bookings, chess.cancelled_bookings) == (6, 4, 2)
+        assert chess.utilization == pytest.approx(0.5)
+        assert chess.cancellation_rate == pytest.approx(2 / 6)
+        # Sunday 10:00 and Monday 18:00 tie on active bookings; the earlier hour wins
+        assert chess.peak_hour_of_week == 10
+        assert (darts.slots, darts.capacity, darts.active_bookings) == (1, 2, 1)
+        assert darts.cancellation_rate == 0
+        assert darts.peak_hour_of_week == 42
+
+    async def test_usage_by_department(self, analytics_db, seeded):
+        """Test per-department bookings and their share of all seats, departments without bookings included."""
+        first, second, empty = await AnalyticsService(analytics_db).usage_by_department(START, END)
+
+        assert (first.bookings, first.active_bookings, first.cancelled_bookings) == (4, 3, 1)
+        assert first.utilization == pytest.approx(3 / 10)
+        assert first.cancellation_rate == pytest.approx(1 / 4)
+        assert first.peak_hour_of_week == 42
+        assert (second.bookings, second.active_bookings) == (3, 2)
+        assert second.peak_hour_of_week == 10
+        assert (empty.bookings, empty.utilization, empty.cancellation_rate, empty.peak_hour_of_week) == (0, 0, None, None)
+
+    async def test_usage_by_hour_of_week(self, analytics_db, seeded):
+        """Test buckets are per weekday and hour, with rates over every slot starting in them."""
+        sunday, monday = await AnalyticsService(analytics_db).usage_by_hour_of_week(START, END)
+
+        assert (sunday.hour_of_week, sunday.day_of_week, sunday.hour) == (10, 0, 10)
+        assert (sunday.slots, sunday.capacity, sunday.bookings, sunday.active_bookings) == (2, 4, 3, 2)
+        assert (monday.hour_of_week, monday.day_of_week, monday.hour) == (42, 1, 18)
+        assert monday.utilization == pytest.approx(3 / 6)
+        assert monday.cancellation_rate == pytest.approx(1 / 4)
+
+    async def test_game_filter(self, analytics_db, seeded):
+        """Test the game filter narrows every report to those games' slots."""
+        darts = seeded["games"][1]
+        analytics_service = AnalyticsService(analytics_db)
+
+        [hour] = await analytics_service.usage_by_hour_of_week(START, END, game_ids=[darts])
+        departments = await analytics_service.usage_by_department(START, END, game_ids=[darts])
+
+        assert (hour.hour_of_week, hour.slots, hour.active_bookings) == (42, 1, 1)
+        assert [department.bookings for department in departments] == [0, 1, 0]
+        assert departments[1].utilization == pytest.approx(1 / 2)
+
+    async def test_range_is_widened_to_whole_hours(self, analytics_db, seeded):
+        """Test bounds inside an hour still cover every slot starting in it."""
+        [chess] = await AnalyticsService(analytics_db).usage_by_game(
+            SUNDAY.replace(minute=15), SUNDAY.replace(minute=20)
+        )
+
+        assert chess.slots == 2
+
+    async def test_empty_range_rejected(self, analytics_db):
+        """Test a start date not before the end date is a 400."""
+        with pytest.raises(HTTPException) as error:
+            await AnalyticsService(analytics_db).usage_by_game(END, START)
+
+        assert error.value.status_code == 400
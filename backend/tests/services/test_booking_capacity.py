@@ -0,0 +1,158 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+from sqlalchemy import insert, func
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.booking import Booking, ACTIVE_BOOKING_STATUSES
+from app.models.department import Department
+from app.models.game import Game
+from app.models.slot import Slot
+from app.models.user import User
+from app.schemas.booking import BookingCreate
+from app.services.booking_service import BookingService
+from app.services.game_service import GameService
+from app.core.cache import catalog_cache
+from tests.conftest import TEST_POSTGRES_URL
+
+
+CONCURRENT_BOOKINGS = 300
+CAPACITY = 10
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+async def stress_engine(request, tmp_path):
+    """Engine whose sessions use separate connections, so bookings really run concurrently."""
+    if request.param == "postgresql":
+        if not TEST_POSTGRES_URL:
+            pytest.skip("TEST_POSTGRES_URL is not set")
+        engine = create_async_engine(TEST_POSTGRES_URL, pool_size=50, max_overflow=0)
+    else:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'stress.db'}",
+            connect_args={"timeout": 60},
+        )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+async def _seed(engine, user_count: int) -> tuple:
+    async with engine.begin() as conn:
+        department_id = (await conn.execute(
+            insert(Department).values(title="Stress Department").returning(Department.id)
+        )).scalar_one()
+        game_id = (await conn.execute(
+            insert(Game).values(title="Stress Game").returning(Game.id)
+        )).scalar_one()
+        start_time = datetime.now() + timedelta(hours=1)
+        slot_id = (await conn.execute(
+            insert(Slot).values(
+                start_time=start_time,
+                end_time=start_time + timedelta(hours=1),
+                capacity=CAPACITY,
+                game_id=game_id
+            ).returning(Slot.id)
+        )).scalar_one()
+        user_ids = (await conn.execute(
+            insert(User).returning(User.id),
+            [
+                {"username": f"stress{i}", "password": "x", "department_id": department_id}
+                for i in range(user_count)
+            ]
+        )).scalars().all()
+    return slot_id, list(user_ids)
+
+
+class TestBookingCapacityUnderConcurrency:
+    """Stress tests for atomic capacity and duplicate enforcement."""
+
+    async def test_concurrent_bookings_never_exceed_capacity(self, stress_engine):
+        """Test hundreds of simultaneous bookings fill the slot exactly to capacity."""
+        # Every user books twice, so duplicates race against each other too
+        slot_id, user_ids = await _seed(stress_engine, CONCURRENT_BOOKINGS // 2)
+        SessionLocal = sessionmaker(stress_engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def book(user_id: int):
+            async with SessionLocal() as session:
+                try:
+                    return await BookingService(session).create_booking(
+                        BookingCreate(user_id=user_id, slot_id=slot_id)
+                    )
+                except HTTPException as exc:
+                    return exc
+
+        results = await asyncio.gather(*(book(user_id) for user_id in user_ids * 2))
+
+        created = [result for result in results if not isinstance(result, HTTPException)]
+        rejected = [result for result in results if isinstance(result, HTTPException)]
+        assert len(created) == CAPACITY
+        assert {exc.status_code for exc in rejected} == {400}
+        assert len({booking.user_id for booking in created}) == CAPACITY
+
+        async with SessionLocal() as session:
+            booked_count = await session.scalar(select(Slot.booked_count).where(Slot.id == slot_id))
+            active = await session.scalar(
+                select(func.count(Booking.id)).where(
+                    Booking.slot_id == slot_id,
+                    Booking.status.in_(ACTIVE_BOOKING_STATUSES)
+                )
+            )
+        assert booked_count == active == CAPACITY
+
+    async def test_concurrent_duplicate_bookings_keep_one(self, stress_engine):
+        """Test one user racing the same booking only ever holds one seat."""
+        slot_id, (user_id,) = await _seed(stress_engine, 1)
+        SessionLocal = sessionmaker(stress_engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def book():
+            async with SessionLocal() as session:
+                try:
+                    return await BookingService(session).create_booking(
+                        BookingCreate(user_id=user_id, slot_id=slot_id)
+                    )
+                except HTTPException as exc:
+                    return exc
+
+        results = await asyncio.gather(*(book() for _ in range(50)))
+
+        created = [result for result in results if not isinstance(result, HTTPException)]
+        assert len(created) == 1
+
+        async with SessionLocal() as session:
+            booked_count = await session.scalar(select(Slot.booked_count).where(Slot.id == slot_id))
+        assert booked_count == 1
+
+
+class TestCatalogInvalidationUnderConcurrency:
+    """Stress tests for catalog cache invalidation by concurrent bookings."""
+
+    async def test_filling_a_slot_invalidates_cached_game(self, stress_engine):
+        """Test the cached game stops counting the slot once concurrent bookings fill it."""
+        await catalog_cache.clear()
+        slot_id, user_ids = await _seed(stress_engine, CAPACITY * 2)
+        SessionLocal = sessionmaker(stress_engine, class_=AsyncSession, expire_on_commit=False)
+        async with SessionLocal() as session:
+            game_id = await session.scalar(select(Slot.game_id).where(Slot.id == slot_id))
+            assert (await GameService(session).get_game_by_id(game_id)).available_slots == 1
+
+        async def book(user_id: int):
+            async with SessionLocal() as session:
+                try:
+                    await BookingService(session).create_booking(BookingCreate(user_id=user_id, slot_id=slot_id))
+                except HTTPException:
+                    pass
+
+        await asyncio.gather(*(book(user_id) for user_id in user_ids))
+
+        async with SessionLocal() as session:
+            assert (await GameService(session).get_game_by_id(game_id)).available_slots == 0
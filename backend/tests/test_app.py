@@ -1,6 +1,10 @@
 from fastapi import FastAPI
 from app.api.v1.api import api_router
+from app.api import metrics
+from app.core.request_metrics import QueryMetricsMiddleware
 
 # Create test app without startup events
 test_app = FastAPI(title="Test API", version="1.0.0")
+test_app.add_middleware(QueryMetricsMiddleware)
 test_app.include_router(api_router, prefix="/api/v1")
+test_app.include_router(metrics.router)